@@ -5,8 +5,15 @@ from typing import Any
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+
+from .authentication import add_user_claims
+from .blacklist import DeferredBlacklistRefreshToken, cached_refresh_token_state
 
 User = get_user_model()
 
@@ -25,6 +32,14 @@ class IdentifierTokenObtainPairSerializer(TokenObtainPairSerializer):
         if self.username_field in self.fields:
             self.fields[self.username_field].required = False
 
+    @classmethod
+    def get_token(cls, user: AbstractUser) -> Token:
+        """
+        토큰에 역할(role)과 쿠폰북 id(couponbook_id) 클레임을 추가합니다.
+        Refresh 토큰의 클레임은 재발급되는 Access 토큰에도 그대로 복사됩니다.
+        """
+        return add_user_claims(super().get_token(user), user)
+
     def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
         """
     사용자로부터 'identifier' 또는 'username'을 받아 유효성을 검사합니다.
@@ -53,3 +68,33 @@ class IdentifierTokenObtainPairSerializer(TokenObtainPairSerializer):
                 attrs[self.username_field] = identifier
 
         return super().validate(attrs)
+
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    보통은 DB를 조회하지 않고 Access 토큰을 재발급하는 시리얼라이저입니다.
+
+    - 기본 시리얼라이저는 블랙리스트와 유저를 따로 조회합니다.
+      여기서는 `cached_refresh_token_state`(accounts.blacklist)로 캐시에서 확인하고, 공유 캐시가 없으면 DB에서 쿼리 한 번으로 확인합니다.
+    - 로그아웃과 유저 비활성화/삭제는 공유 캐시의 무효화로 어느 워커에서 일어나도 다음 재발급에 반영됩니다.
+    - Refresh 토큰을 교체하는 설정(`ROTATE_REFRESH_TOKENS`)에서는 새 토큰을 기록해야 하므로 기존 동작을 그대로 사용합니다.
+    """
+
+    token_class = DeferredBlacklistRefreshToken
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, str]:
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            self.token_class = RefreshToken  # 기본 동작대로 토큰을 만들 때 블랙리스트를 확인합니다.
+            return super().validate(attrs)
+
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None:
+            user_id = User._meta.pk.to_python(user_id)
+        is_blacklisted, is_active = cached_refresh_token_state(refresh.payload[api_settings.JTI_CLAIM], user_id)
+        if is_blacklisted:
+            raise TokenError(_("Token is blacklisted"))
+        if user_id is not None and (is_active is None or (api_settings.CHECK_USER_IS_ACTIVE and not is_active)):
+            raise AuthenticationFailed(_("No active account found for the given token."), "no_active_account")
+
+        return {"access": str(refresh.access_token)}
@@ -0,0 +1,127 @@
+"""
+토큰 클레임 기반 JWT 인증.
+
+기본 `JWTAuthentication`은 인증된 요청마다 DB에서 User를 조회합니다.
+`ClaimsJWTAuthentication`은 로그인할 때 Access 토큰에 넣어 둔 클레임(user_id, role, couponbook_id)으로
+가벼운 User 인스턴스를 만들어 사용하므로, 유저 조회 쿼리가 없습니다.
+
+- 탈퇴(비활성화)/삭제된 유저의 토큰을 막기 위해 유저의 활성 상태만 프로세스 메모리에 TTL 캐시로 보관합니다.
+  같은 프로세스에서 유저가 변경되면 시그널로 바로 무효화되고, 다른 워커에서는 TTL(`JWT_CLAIMS_USER_STATUS_TTL`초) 안에 반영됩니다.
+- 클레임이 없는 예전 토큰이나, 비밀번호 변경으로 토큰을 폐기하는 설정(`CHECK_REVOKE_TOKEN`)에서는 기존처럼 DB에서 조회합니다.
+- 클레임으로 만든 유저는 저장할 수 없습니다. 유저 정보를 수정하는 뷰(accounts 앱)는 DB에서 유저를 조회하는
+  `RequestCachedJWTAuthentication`(기본 인증 클래스)을 사용합니다.
+"""
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from utils.identity_map import get_or_compute, remember
+from utils.ttl_cache import TTLCache
+
+from .models import User
+
+ROLE_CLAIM = 'role'
+COUPONBOOK_ID_CLAIM = 'couponbook_id'
+
+# user_id -> is_active (유저가 없으면 None)
+user_status_cache = TTLCache(ttl=getattr(settings, 'JWT_CLAIMS_USER_STATUS_TTL', 60))
+
+
+def add_user_claims(token: Token, user: User) -> Token:
+    """
+    토큰에 유저의 역할과 쿠폰북 id 클레임을 추가합니다. 쿠폰북이 없는 유저(점주)는 couponbook_id가 None입니다.
+    """
+
+    from couponbook.models import CouponBook
+
+    token[ROLE_CLAIM] = user.role
+    token[COUPONBOOK_ID_CLAIM] = CouponBook.objects.filter(user=user).values_list('id', flat=True).first()
+    return token
+
+
+def get_user_status(user_id) -> bool | None:
+    """
+    유저의 활성 상태를 반환합니다. 유저가 없으면 None입니다. 결과는 TTL 캐시에 보관합니다.
+    """
+
+    return user_status_cache.get_or_set(
+        user_id, lambda: User.objects.filter(id=user_id).values_list('is_active', flat=True).first()
+    )
+
+
+def build_user_from_claims(validated_token: Token) -> User:
+    """
+    토큰 클레임으로 DB에 저장된 것처럼 보이는 User 인스턴스를 만듭니다.
+
+    pk가 있으므로 `CouponBook.objects.filter(user=user)`처럼 ORM 조건이나 `obj.user == user` 비교에 그대로 쓸 수 있습니다.
+    """
+
+    user_id = User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+    user = User(id=user_id, role=validated_token[ROLE_CLAIM], is_active=True)
+    user._state.adding = False
+    user._state.db = 'default'
+    user.couponbook_id = validated_token.get(COUPONBOOK_ID_CLAIM)
+    user.from_token_claims = True
+    return user
+
+
+class RequestCachedJWTAuthentication(JWTAuthentication):
+    """
+    DB에서 유저를 조회하는 기본 JWT 인증입니다. 같은 토큰으로 조회한 유저는 요청 단위 identity map에 보관합니다.
+
+    배치 요청(/batch/)의 내부 요청들은 같은 Authorization 헤더로 각자 다시 인증하므로, 유저 조회는 요청 전체에서 한 번입니다.
+    """
+
+    def get_user(self, validated_token: Token) -> User:
+        return get_or_compute('jwt_user', validated_token.get(api_settings.JTI_CLAIM),
+                              lambda: remember(super(RequestCachedJWTAuthentication, self).get_user(validated_token)))
+
+
+class ClaimsJWTAuthentication(RequestCachedJWTAuthentication):
+    """
+    Access 토큰의 클레임으로 유저를 만드는 JWT 인증입니다. 유저 조회 쿼리가 없습니다.
+
+    `request.user.couponbook_id`로 로그인한 유저의 쿠폰북 id를 쿼리 없이 알 수 있습니다.
+    """
+
+    def get_user(self, validated_token: Token) -> User:
+        if ROLE_CLAIM not in validated_token or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            # simplejwt는 user_id를 문자열로 저장하므로, 캐시 키와 pk로 쓰기 위해 pk 타입으로 변환합니다.
+            user_id = User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        is_active = get_user_status(user_id)
+        if is_active is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if api_settings.CHECK_USER_IS_ACTIVE and not is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return build_user_from_claims(validated_token)
+
+
+class RequestCachedJWTAuthenticationScheme(SimpleJWTScheme):
+    """
+    drf-spectacular가 RequestCachedJWTAuthentication을 기존 jwtAuth(Bearer JWT) 인증으로 문서화하도록 등록합니다.
+    """
+
+    target_class = RequestCachedJWTAuthentication
+    name = 'jwtAuth'
+
+
+class ClaimsJWTAuthenticationScheme(SimpleJWTScheme):
+    """
+    drf-spectacular가 ClaimsJWTAuthentication을 사용하는 뷰도 Bearer JWT 인증으로 문서화하도록 등록합니다.
+
+    스키마 컴포넌트 이름은 인증 클래스마다 달라야 하므로 기존 jwtAuth와 다른 이름을 사용합니다. (같은 Access 토큰을 사용합니다.)
+    """
+
+    target_class = ClaimsJWTAuthentication
+    name = 'claimsJwtAuth'
@@ -0,0 +1,271 @@
+"""
+Refresh 토큰 블랙리스트(simplejwt token_blacklist)의 대량 작업.
+
+- 모든 기기에서 로그아웃(비밀번호 변경, 회원 탈퇴)할 때 토큰마다 get_or_create를 호출하면 토큰 하나에 쿼리가 두 번씩 나갑니다.
+  `blacklist_user_tokens`는 토큰 수와 관계없이 쿼리 두 번으로 끝납니다.
+- 만료된 토큰은 사용할 수 없는데도 테이블에 계속 쌓이므로, purge_expired_tokens 명령어(docker-compose의 token-purger 서비스)가
+  `purge_expired_tokens`로 배치 단위로 정리합니다.
+- Access 토큰 재발급(RefreshView)은 블랙리스트 여부와 유저 활성 상태를 `cached_refresh_token_state`로 확인합니다.
+  블랙리스트는 프로세스 메모리의 jti 목록(`blacklist_cache`), 유저 활성 상태는 워커 사이에 공유되는 캐시(CACHES["default"])에서 읽으므로
+  보통은 DB를 조회하지 않습니다. 캐시가 공유되지 않거나(로컬 메모리 캐시) 캐시 서버에 문제가 있으면
+  `refresh_token_state`로 DB에서 쿼리 한 번에 확인합니다.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models import Exists
+from django.utils.timezone import now
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from utils.logs import log_event
+
+logger = logging.getLogger(__name__)
+
+# 블랙리스트가 바뀔 때마다 새 값(uuid)으로 바뀌는 세대 번호의 캐시 키
+GENERATION_CACHE_KEY = 'accounts:token-blacklist:generation'
+# 유저 활성 상태의 캐시 키 (유저가 없으면 None을 저장합니다.)
+USER_STATUS_CACHE_KEY = 'accounts:user-status:{}'
+# 증분 동기화에서 이만큼 이전에 추가된 항목부터 다시 읽습니다. (동기화 중에 커밋된 트랜잭션을 놓치지 않기 위해)
+SYNC_OVERLAP = timedelta(seconds=60)
+
+_MISSING = object()
+
+
+def shared_cache() -> BaseCache | None:
+    """
+    워커 사이에 공유되는 캐시(CACHES["default"])를 반환합니다. 로컬 메모리 캐시나 더미 캐시라면 None입니다.
+    """
+
+    backend = caches['default']
+    return None if isinstance(backend, (LocMemCache, DummyCache)) else backend
+
+
+class BlacklistCache:
+    """
+    블랙리스트에 있는 Refresh 토큰의 jti -> 만료 시각(epoch)을 프로세스 메모리에 보관합니다.
+
+    - 워커에서 처음 확인할 때 만료되지 않은 블랙리스트 전체를 읽고, 이후에는 최근에 추가된 항목만 읽습니다.
+    - 항목은 토큰이 만료되면 버립니다. (만료된 토큰은 어차피 검증에 실패합니다.)
+    - 블랙리스트에 추가하는 쪽은 커밋 후에 공유 캐시의 세대 번호를 새 값으로 바꿉니다(`publish_blacklist_change`).
+      확인하는 쪽은 세대 번호가 바뀌었을 때만 DB를 읽으므로, 다른 워커의 로그아웃도 다음 확인에서 바로 반영됩니다.
+    - 세대 번호는 매번 새 uuid이므로, 캐시 서버가 재시작되어 값이 사라져도 예전 값과 같아지는 일이 없습니다.
+      세대 번호가 없으면 새로 만들고 전체를 다시 읽습니다.
+    - 세대 번호를 바꾸지 못한 경우(캐시 서버 장애)에 대비해, `sync_interval`초가 지나면 세대 번호와 관계없이 다시 읽습니다.
+    """
+
+    def __init__(self, sync_interval: float):
+        self.sync_interval = sync_interval
+        self._jtis: dict[str, float] = {}
+        self._synced_at: datetime | None = None  # 마지막 동기화를 시작한 시각 (DB 기준 증분 조회에 사용)
+        self._checked_at = 0.0  # 마지막 동기화 시각 (time.monotonic)
+        self._generation = None
+        self._lock = threading.Lock()
+
+    def is_blacklisted(self, jti: str, backend: BaseCache) -> bool:
+        # 세대 번호는 DB보다 먼저 읽어야, 동기화하는 동안 바뀐 세대 번호를 놓치지 않습니다.
+        generation = backend.get(GENERATION_CACHE_KEY)
+        full = generation is None
+        if full:
+            backend.add(GENERATION_CACHE_KEY, uuid4().hex, timeout=None)
+            generation = backend.get(GENERATION_CACHE_KEY)
+
+        if full or generation != self._generation or time.monotonic() - self._checked_at >= self.sync_interval:
+            self.sync(generation, full=full)
+        return jti in self._jtis
+
+    def sync(self, generation, full: bool = False):
+        """
+        DB에서 블랙리스트를 다시 읽고 `generation`까지 반영했다고 기록합니다. 처음이거나 `full`이면 전체를 읽습니다.
+        """
+
+        with self._lock:
+            started_at = now()
+            rows = BlacklistedToken.objects.filter(token__expires_at__gt=started_at)
+            if not full and self._synced_at is not None:
+                rows = rows.filter(blacklisted_at__gte=self._synced_at - SYNC_OVERLAP)
+                jtis = dict(self._jtis)
+            else:
+                jtis = {}
+            jtis.update((jti, expires_at.timestamp())
+                        for jti, expires_at in rows.values_list('token__jti', 'token__expires_at'))
+
+            current = time.time()
+            self._jtis = {jti: expires_at for jti, expires_at in jtis.items() if expires_at > current}
+            self._synced_at = started_at
+            self._checked_at = time.monotonic()
+            self._generation = generation
+
+    def clear(self):
+        with self._lock:
+            self._jtis = {}
+            self._synced_at = None
+            self._generation = None
+
+
+blacklist_cache = BlacklistCache(sync_interval=getattr(settings, 'JWT_BLACKLIST_SYNC_INTERVAL', 30))
+
+
+def publish_blacklist_change():
+    """
+    트랜잭션이 커밋된 후 공유 캐시의 세대 번호를 새 값으로 바꿔, 모든 워커가 다음 확인에서 블랙리스트를 다시 읽게 합니다.
+    """
+
+    def publish():
+        backend = shared_cache()
+        if backend is None:
+            return
+        try:
+            backend.set(GENERATION_CACHE_KEY, uuid4().hex, timeout=None)
+        except Exception:
+            log_event(logger, 'token_blacklist_publish_failed', "Failed to publish a token blacklist change",
+                      level=logging.WARNING, exc_info=True)
+
+    transaction.on_commit(publish, robust=True)
+
+
+def forget_user_status(user_id):
+    """
+    트랜잭션이 커밋된 후 공유 캐시에서 유저 활성 상태를 지웁니다. (유저 수정/삭제 시그널)
+    """
+
+    def forget():
+        backend = shared_cache()
+        if backend is None:
+            return
+        try:
+            backend.delete(USER_STATUS_CACHE_KEY.format(user_id))
+        except Exception:
+            log_event(logger, 'user_status_forget_failed', "Failed to delete a cached user status",
+                      level=logging.WARNING, exc_info=True, user_id=user_id)
+
+    transaction.on_commit(forget, robust=True)
+
+
+class DeferredBlacklistRefreshToken(RefreshToken):
+    """
+    생성할 때 블랙리스트를 확인하지 않는 Refresh 토큰입니다.
+
+    블랙리스트 여부는 사용하는 쪽에서 `cached_refresh_token_state`(또는 `refresh_token_state`)로 유저 상태와 함께 확인해야 합니다.
+    (Access 토큰 재발급, accounts.auth_utils.CachedTokenRefreshSerializer)
+    """
+
+    def check_blacklist(self):
+        pass
+
+
+def refresh_token_state(jti: str, user_id) -> tuple[bool, bool | None]:
+    """
+    Refresh 토큰의 (블랙리스트 여부, 유저 활성 상태)를 쿼리 한 번으로 DB에서 읽습니다. 유저가 없으면 활성 상태는 None입니다.
+    """
+
+    blacklisted = BlacklistedToken.objects.filter(token__jti=jti)
+    if user_id is None:
+        return blacklisted.exists(), None
+
+    User = get_user_model()
+    row = (User.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+           .values_list('is_active', Exists(blacklisted)).first())
+    if row is None:
+        # 유저가 없어도 블랙리스트 여부는 알려 줍니다. (유저가 없으면 어차피 재발급은 거부됩니다.)
+        return blacklisted.exists(), None
+    is_active, is_blacklisted = row
+    return is_blacklisted, is_active
+
+
+def cached_refresh_token_state(jti: str, user_id) -> tuple[bool, bool | None]:
+    """
+    `refresh_token_state`와 같은 값을 캐시에서 읽습니다. 블랙리스트와 유저 상태가 바뀌지 않았다면 DB를 조회하지 않습니다.
+
+    - 유저 활성 상태는 유저가 수정/삭제되면 시그널(`forget_user_status`)로 지워집니다.
+      시그널을 보내지 않는 `QuerySet.update()`로 바꾼 경우에는 `JWT_CLAIMS_USER_STATUS_TTL`초 안에 반영됩니다.
+    - 공유 캐시가 없거나 캐시 서버에 문제가 있으면 DB에서 읽습니다. (다른 워커의 변경을 놓치지 않기 위해)
+    """
+
+    backend = shared_cache()
+    if backend is None:
+        return refresh_token_state(jti, user_id)
+
+    try:
+        is_blacklisted = blacklist_cache.is_blacklisted(jti, backend)
+        if user_id is None:
+            return is_blacklisted, None
+
+        key = USER_STATUS_CACHE_KEY.format(user_id)
+        is_active = backend.get(key, _MISSING)
+        if is_active is _MISSING:
+            User = get_user_model()
+            is_active = (User.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+                         .values_list('is_active', flat=True).first())
+            backend.set(key, is_active, timeout=getattr(settings, 'JWT_CLAIMS_USER_STATUS_TTL', 60))
+        return is_blacklisted, is_active
+    except Exception:
+        log_event(logger, 'token_blacklist_cache_failed', "Falling back to the database for a refresh token check",
+                  level=logging.WARNING, exc_info=True)
+        return refresh_token_state(jti, user_id)
+
+
+def blacklist_user_tokens(user_id: int) -> int:
+    """
+    유저에게 발급된 Refresh 토큰 중 아직 만료되지 않았고 블랙리스트에 없는 토큰을 한 번에 블랙리스트에 추가하고, 추가한 개수를 반환합니다.
+    (비밀번호 변경, 회원 탈퇴 시 모든 기기에서 로그아웃)
+
+    토큰 수와 관계없이 조회 한 번, INSERT 한 번으로 끝납니다. 동시에 같은 토큰을 추가해도 충돌은 무시합니다.
+    만료된 토큰은 어차피 사용할 수 없으므로 추가하지 않습니다. (purge_expired_tokens가 정리합니다.)
+    """
+
+    token_ids = list(
+        OutstandingToken.objects.filter(user_id=user_id, expires_at__gt=now(), blacklistedtoken__isnull=True)
+        .values_list('id', flat=True)
+    )
+    BlacklistedToken.objects.bulk_create([BlacklistedToken(token_id=token_id) for token_id in token_ids],
+                                         ignore_conflicts=True)
+    if token_ids:
+        # bulk_create는 post_save 시그널을 보내지 않으므로 직접 알립니다.
+        publish_blacklist_change()
+    return len(token_ids)
+
+
+def purge_expired_tokens(cutoff: datetime | None = None, batch_size: int | None = None, pause: float = 0.0,
+                         on_batch: Callable[[int], None] | None = None) -> int:
+    """
+    `cutoff`(기본값: 지금) 이전에 만료된 Refresh 토큰과 그 블랙리스트 항목을 배치 단위로 삭제하고, 삭제한 토큰 수를 반환합니다.
+
+    simplejwt의 flushexpiredtokens 명령어는 한 번의 DELETE로 모두 지우므로 토큰이 많으면 테이블을 오래 잠급니다.
+    여기서는 배치마다 id를 먼저 조회하고, 그 id들만 삭제합니다. (블랙리스트 항목도 같은 id 목록으로 한 번에 삭제됩니다.)
+    """
+
+    cutoff = cutoff or now()
+    batch_size = batch_size or settings.TOKEN_PURGE_BATCH_SIZE
+    expired = OutstandingToken.objects.filter(expires_at__lt=cutoff)
+    deleted = 0
+
+    while True:
+        token_ids = list(expired.order_by('id').values_list('id', flat=True)[:batch_size])
+        if not token_ids:
+            break
+
+        _, counts = OutstandingToken.objects.filter(id__in=token_ids).delete()
+        count = counts.get(OutstandingToken._meta.label, 0)
+        deleted += count
+
+        if on_batch:
+            on_batch(count)
+        if len(token_ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return deleted
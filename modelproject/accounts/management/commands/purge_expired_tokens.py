@@ -0,0 +1,30 @@
+from accounts.blacklist import purge_expired_tokens
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+
+class Command(BaseCommand):
+    help = ("만료된 Refresh 토큰(OutstandingToken)과 그 블랙리스트 항목을 배치 단위로 삭제합니다. "
+            "docker-compose의 token-purger 서비스가 하루에 한 번 실행합니다.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.TOKEN_PURGE_BATCH_SIZE,
+                            help="한 번에 삭제할 토큰 수")
+        parser.add_argument('--pause', type=float, default=0.0, help="배치 사이에 쉬는 시간(초)")
+        parser.add_argument('--dry-run', action='store_true', help="삭제하지 않고 대상 토큰 수만 출력합니다.")
+
+    def handle(self, *args, **options):
+        cutoff = now()
+
+        if options['dry_run']:
+            count = OutstandingToken.objects.filter(expires_at__lt=cutoff).count()
+            self.stdout.write(f"만료된 토큰 {count}개가 삭제 대상입니다.")
+            return
+
+        def on_batch(count: int):
+            self.stdout.write(f"토큰 {count}개 삭제")
+
+        deleted = purge_expired_tokens(cutoff, options['batch_size'], options['pause'], on_batch)
+        self.stdout.write(self.style.SUCCESS(f"만료된 토큰 {deleted}개를 정리했습니다."))
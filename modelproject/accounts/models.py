@@ -42,6 +42,15 @@ class User(AbstractUser):
         """손님 여부 헬퍼."""
         return self.role == self.Role.CUSTOMER
 
+    def save(self, *args, **kwargs) -> None:
+        """
+        토큰 클레임으로 만든 유저(accounts.authentication.ClaimsJWTAuthentication)는
+        일부 필드만 채워져 있으므로, 저장하면 나머지 필드가 빈 값으로 덮어써집니다. 이를 막습니다.
+        """
+        if getattr(self, "from_token_claims", False):
+            raise ValueError("토큰 클레임으로 만든 유저는 저장할 수 없습니다. DB에서 유저를 조회해서 사용하세요.")
+        super().save(*args, **kwargs)
+
 # ------------------------ 자주 가는 지역 -------------------------
 class FavoriteLocation(models.Model):
     """
@@ -11,8 +11,8 @@ from rest_framework import serializers
 # 점주 가입 시 가게 정보(Place 모델)를 중첩으로 생성/조회하기 위해 참조
 from couponbook.serializers import PlaceCreateSerializer, PlaceSerializer
 from couponbook.models import Place
+from .blacklist import blacklist_user_tokens
 from .models import FavoriteLocation, User
-from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
 
 User: type[AbstractUser] = get_user_model()
 
@@ -230,13 +230,8 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             instance.set_password(getattr(self, "_new_password_value"))
             instance.save(update_fields=["password"])
 
-            # simplejwt token_blacklist 사용 시, 기존 Refresh 토큰 무효화
-            try:
-                for outstanding in OutstandingToken.objects.filter(user=instance):
-                    BlacklistedToken.objects.get_or_create(token=outstanding)
-            except Exception:
-                # token_blacklist 앱이 없으면 조용히 통과
-                pass
+            # 기존 Refresh 토큰을 한 번에 무효화 (모든 기기에서 로그아웃)
+            blacklist_user_tokens(instance.id)
 
         return instance
 
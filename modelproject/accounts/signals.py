@@ -1,8 +1,16 @@
-from django.db.models.signals import post_save
+import logging
+
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
 
+from .authentication import user_status_cache
+from .blacklist import forget_user_status, publish_blacklist_change
 from .models import User
 from couponbook.models import CouponBook
+from utils.logs import log_event
+
+logger = logging.getLogger(__name__)
 
 
 @receiver(post_save, sender=User)
@@ -28,4 +36,24 @@ def create_coupon_book(sender, instance, created, **kwargs):
 
         except Exception as e:
             # 예외가 발생하면 로깅을 남겨 디버깅에 도움
-            print(f"Error creating CouponBook for user {instance.username}: {e}")
\ No newline at end of file
+            log_event(logger, 'couponbook_create_failed', f"Error creating CouponBook for user {instance.username}: {e}",
+                      level=logging.ERROR, exc_info=True, user_id=instance.id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_status(sender, instance, **kwargs):
+    """
+    유저가 수정(비활성화 등)되거나 삭제되면, 토큰 클레임 인증과 Access 토큰 재발급에서 사용하는 유저 상태 캐시를 비웁니다.
+    """
+    user_status_cache.delete(instance.id)
+    forget_user_status(instance.id)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def publish_blacklisted_token(sender, instance, created, **kwargs):
+    """
+    로그아웃 등으로 Refresh 토큰이 블랙리스트에 추가되면, 모든 워커의 블랙리스트 캐시가 다시 읽도록 알립니다.
+    """
+    if created:
+        publish_blacklist_change()
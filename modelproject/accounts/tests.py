@@ -1,3 +1,304 @@
-from django.test import TestCase
+import io
+import tempfile
+from datetime import timedelta
+from unittest import mock
+from uuid import uuid4
+
+from couponbook.models import CouponBook
+from couponbook.tests.decorators import print_success_message
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils.timezone import now
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from .authentication import (ClaimsJWTAuthentication, add_user_claims,
+                             user_status_cache)
+from .blacklist import (GENERATION_CACHE_KEY, blacklist_cache, blacklist_user_tokens,
+                        purge_expired_tokens)
+from .models import User
 
 # Create your tests here.
+
+
+class ClaimsJWTAuthenticationTestCase(APITestCase):
+    """
+    토큰 클레임 기반 JWT 인증을 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        user_status_cache.clear()
+        self.user = User.objects.create_user(username='test', email='test@example.com', password='P@ssw0rd!1234')
+        self.couponbook = CouponBook.objects.get(user=self.user)
+        self.token = add_user_claims(AccessToken.for_user(self.user), self.user)
+        return super().setUp()
+
+    @print_success_message("로그인하면 Access 토큰에 역할과 쿠폰북 id 클레임이 들어가는지 테스트")
+    def test_login_issues_claims(self):
+        r = self.client.post('/accounts/auth/login/', {'identifier': 'test', 'password': 'P@ssw0rd!1234'})
+
+        self.assertEqual(r.status_code, 200)
+        access = AccessToken(r.json()['access'])
+        self.assertEqual(access['role'], User.Role.CUSTOMER)
+        self.assertEqual(access['couponbook_id'], self.couponbook.id)
+
+    @print_success_message("캐시가 채워진 후에는 쿼리 없이 유저를 만드는지 테스트")
+    def test_get_user_without_query(self):
+        authentication = ClaimsJWTAuthentication()
+        authentication.get_user(self.token)  # 유저 상태 캐시 채우기
+
+        with self.assertNumQueries(0):
+            user = authentication.get_user(self.token)
+
+        self.assertEqual(user, self.user)
+        self.assertTrue(user.is_customer())
+        self.assertEqual(user.couponbook_id, self.couponbook.id)
+
+    @print_success_message("쿠폰북 권한 확인이 쿼리 없이 이루어지는지 테스트")
+    def test_couponbook_permission_without_query(self):
+        ClaimsJWTAuthentication().get_user(self.token)  # 유저 상태 캐시 채우기
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        other = User.objects.create(username='other', password='1234')
+        other_couponbook = CouponBook.objects.get(user=other)
+        # 유저 조회 없이, 남의 쿠폰북일 때 쿠폰북이 존재하는지(403/404 구분)만 확인합니다.
+        with self.assertNumQueries(1):
+            r = self.client.get(f'/couponbook/couponbooks/{other_couponbook.id}/coupons/')
+        self.assertEqual(r.status_code, 403, "다른 유저의 쿠폰북에 접근했습니다!")
+
+    @print_success_message("비활성화된 유저의 토큰이 거부되는지 테스트")
+    def test_inactive_user_rejected(self):
+        authentication = ClaimsJWTAuthentication()
+        authentication.get_user(self.token)
+
+        self.user.is_active = False
+        self.user.save()  # 시그널로 캐시가 무효화되어야 합니다.
+
+        with self.assertRaises(AuthenticationFailed):
+            authentication.get_user(self.token)
+
+    @print_success_message("클레임이 없는 예전 토큰은 DB에서 유저를 조회하는지 테스트")
+    def test_legacy_token_falls_back_to_db(self):
+        user = ClaimsJWTAuthentication().get_user(AccessToken.for_user(self.user))
+
+        self.assertFalse(getattr(user, 'from_token_claims', False))
+        self.assertEqual(user.username, 'test')
+
+
+class ClaimsUserTestCase(TestCase):
+    """
+    클레임으로 만든 유저 인스턴스를 테스트하는 테스트 케이스입니다.
+    """
+
+    @print_success_message("클레임으로 만든 유저는 저장할 수 없는지 테스트")
+    def test_claims_user_cannot_be_saved(self):
+        user = User.objects.create(username='test', password='1234')
+        token = add_user_claims(AccessToken.for_user(user), user)
+        claims_user = ClaimsJWTAuthentication().get_user(token)
+
+        with self.assertRaises(ValueError):
+            claims_user.save()
+        self.assertEqual(User.objects.get(id=user.id).username, 'test')
+
+
+class TokenBlacklistTestCase(APITestCase):
+    """
+    Refresh 토큰 블랙리스트 대량 추가와 만료된 토큰 정리를 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='test', email='test@example.com', password='P@ssw0rd!1234')
+        self.tokens = [RefreshToken.for_user(self.user) for _ in range(5)]
+        return super().setUp()
+
+    def expire(self, *tokens: RefreshToken):
+        OutstandingToken.objects.filter(jti__in=[token['jti'] for token in tokens]).update(
+            expires_at=now() - timedelta(days=1))
+
+    @print_success_message("토큰 수와 관계없이 쿼리 두 번으로 모든 토큰을 블랙리스트에 추가하는지 테스트")
+    def test_blacklist_user_tokens(self):
+        self.tokens[0].blacklist()
+        self.expire(self.tokens[1])
+
+        with self.assertNumQueries(2):
+            self.assertEqual(blacklist_user_tokens(self.user.id), 3)
+        self.assertEqual(blacklist_user_tokens(self.user.id), 0)
+
+        r = self.client.post('/accounts/auth/refresh/', {'refresh': str(self.tokens[2])})
+        self.assertEqual(r.status_code, 401, "블랙리스트에 추가된 토큰으로 재발급되었습니다!")
+
+    @print_success_message("만료된 토큰과 블랙리스트 항목을 배치 단위로 정리하는지 테스트")
+    def test_purge_expired_tokens(self):
+        self.tokens[0].blacklist()
+        self.tokens[4].blacklist()
+        self.expire(*self.tokens[:4])
+
+        batches = []
+        self.assertEqual(purge_expired_tokens(batch_size=3, on_batch=batches.append), 4)
+        self.assertEqual(batches, [3, 1])
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), [self.tokens[4]['jti']])
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+
+        stdout = io.StringIO()
+        call_command('purge_expired_tokens', stdout=stdout)
+        self.assertIn("만료된 토큰 0개를 정리했습니다.", stdout.getvalue())
+
+
+class SingleQueryRefreshTestCase(APITestCase):
+    """
+    블랙리스트 여부와 유저 상태를 쿼리 한 번으로 확인하는 Access 토큰 재발급을 테스트하는 테스트 케이스입니다.
+    (공유 캐시가 없는 기본 설정(로컬 메모리 캐시)에서는 캐시 대신 매번 DB를 확인합니다.)
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='test', email='test@example.com', password='P@ssw0rd!1234')
+        self.tokens = [RefreshToken.for_user(self.user) for _ in range(3)]
+        return super().setUp()
+
+    def refresh(self, token: RefreshToken):
+        return self.client.post('/accounts/auth/refresh/', {'refresh': str(token)})
+
+    @print_success_message("쿼리 한 번으로 Access 토큰을 재발급하는지 테스트")
+    def test_refresh_single_query(self):
+        with self.assertNumQueries(1):
+            r = self.refresh(self.tokens[0])
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(AccessToken(r.json()['access'])['user_id'], str(self.user.id))
+
+    @print_success_message("로그아웃하거나 모든 토큰을 무효화하면 바로 재발급이 거부되는지 테스트")
+    def test_blacklist_reflected(self):
+        self.refresh(self.tokens[0])
+        self.client.force_authenticate(self.user)
+
+        self.client.post('/accounts/auth/logout/', {'refresh_token': str(self.tokens[0])})
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 401, "로그아웃한 토큰으로 재발급되었습니다!")
+        self.assertEqual(self.refresh(self.tokens[1]).status_code, 200)
+
+        blacklist_user_tokens(self.user.id)
+        self.assertEqual(self.refresh(self.tokens[1]).status_code, 401)
+
+    @print_success_message("다른 워커에서 블랙리스트에 추가하거나 유저를 비활성화/삭제해도 바로 반영되는지 테스트")
+    def test_other_worker_changes(self):
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 200)
+
+        # 시그널 없이 DB만 바뀐 경우 (다른 워커의 변경과 같습니다.)
+        token = OutstandingToken.objects.get(jti=self.tokens[2]['jti'])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token)])
+        self.assertEqual(self.refresh(self.tokens[2]).status_code, 401, "블랙리스트에 추가된 토큰으로 재발급되었습니다!")
+
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 401, "비활성화된 유저가 재발급받았습니다!")
+
+        User.objects.filter(id=self.user.id).update(is_active=True)
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 200)
+        User.objects.filter(id=self.user.id).delete()
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 401, "삭제된 유저가 재발급받았습니다!")
+
+    @print_success_message("비활성화된 유저는 재발급이 거부되는지 테스트")
+    def test_inactive_user(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 401)
+
+
+class SharedCacheRefreshTestCase(APITestCase):
+    """
+    워커 사이에 공유되는 캐시가 있을 때 DB를 조회하지 않는 Access 토큰 재발급을 테스트하는 테스트 케이스입니다.
+    (파일 캐시는 Redis처럼 여러 프로세스가 함께 봅니다.)
+    """
+
+    def setUp(self):
+        location = tempfile.TemporaryDirectory()
+        self.addCleanup(location.cleanup)
+        settings_override = override_settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location.name},
+        })
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        blacklist_cache.clear()
+        self.addCleanup(blacklist_cache.clear)
+
+        self.user = User.objects.create_user(username='test', email='test@example.com', password='P@ssw0rd!1234')
+        self.tokens = [RefreshToken.for_user(self.user) for _ in range(3)]
+        return super().setUp()
+
+    def refresh(self, token: RefreshToken):
+        return self.client.post('/accounts/auth/refresh/', {'refresh': str(token)})
+
+    def other_worker_publishes(self):
+        # 다른 워커가 블랙리스트에 추가한 뒤 세대 번호를 바꾼 것과 같습니다.
+        caches['default'].set(GENERATION_CACHE_KEY, uuid4().hex, timeout=None)
+
+    @print_success_message("공유 캐시가 있으면 DB 조회 없이 Access 토큰을 재발급하는지 테스트")
+    def test_refresh_without_query(self):
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 200)
+        with self.assertNumQueries(0):
+            r = self.refresh(self.tokens[1])
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(AccessToken(r.json()['access'])['user_id'], str(self.user.id))
+
+    @print_success_message("로그아웃하거나 모든 토큰을 무효화하면 바로 재발급이 거부되는지 테스트 (공유 캐시)")
+    def test_blacklist_reflected(self):
+        self.refresh(self.tokens[0])
+        self.client.force_authenticate(self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/accounts/auth/logout/', {'refresh_token': str(self.tokens[0])})
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 401, "로그아웃한 토큰으로 재발급되었습니다!")
+        self.assertEqual(self.refresh(self.tokens[1]).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            blacklist_user_tokens(self.user.id)
+        self.assertEqual(self.refresh(self.tokens[1]).status_code, 401)
+
+    @print_success_message("다른 워커에서 블랙리스트에 추가하면 세대 번호로 바로 반영되는지 테스트")
+    def test_other_worker_blacklist(self):
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 200)
+
+        token = OutstandingToken.objects.get(jti=self.tokens[2]['jti'])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token)])
+        self.other_worker_publishes()
+        self.assertEqual(self.refresh(self.tokens[2]).status_code, 401, "블랙리스트에 추가된 토큰으로 재발급되었습니다!")
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 200)
+
+    @print_success_message("캐시 서버가 비워지면 블랙리스트 전체를 다시 읽는지 테스트")
+    def test_cache_flushed(self):
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 200)
+
+        token = OutstandingToken.objects.get(jti=self.tokens[2]['jti'])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token)])
+        self.other_worker_publishes()
+        caches['default'].clear()  # 세대 번호를 읽기 전에 캐시 서버가 재시작된 경우
+        self.assertEqual(self.refresh(self.tokens[2]).status_code, 401, "블랙리스트에 추가된 토큰으로 재발급되었습니다!")
+
+    @print_success_message("유저를 비활성화/삭제하면 공유 캐시가 무효화되어 바로 재발급이 거부되는지 테스트")
+    def test_user_changes(self):
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 200)
+
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 401, "비활성화된 유저가 재발급받았습니다!")
+
+        self.user.is_active = True
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 401, "삭제된 유저가 재발급받았습니다!")
+
+    @print_success_message("캐시 서버에 문제가 있으면 DB에서 확인하는지 테스트")
+    def test_cache_failure(self):
+        self.assertEqual(self.refresh(self.tokens[0]).status_code, 200)
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=OutstandingToken.objects.get(jti=self.tokens[2]['jti']))])
+
+        with mock.patch.object(FileBasedCache, 'get', side_effect=ConnectionError):
+            with self.assertNumQueries(1):
+                self.assertEqual(self.refresh(self.tokens[1]).status_code, 200)
+            self.assertEqual(self.refresh(self.tokens[2]).status_code, 401, "블랙리스트에 추가된 토큰으로 재발급되었습니다!")
@@ -9,14 +9,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.token_blacklist.models import (
-    BlacklistedToken,
-    OutstandingToken,
-)
 from rest_framework_simplejwt.tokens import RefreshToken, TokenError
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .auth_utils import IdentifierTokenObtainPairSerializer
+from .auth_utils import CachedTokenRefreshSerializer, IdentifierTokenObtainPairSerializer
+from .blacklist import blacklist_user_tokens
 from .serializers import (
     MeSerializer,
     RegisterCustomerSerializer,
@@ -203,10 +200,12 @@ class RefreshView(TokenRefreshView):
 
     요청 본문(JSON):
         - `refresh`: 기존에 발급받은 Refresh 토큰
+
+    블랙리스트 여부와 유저 활성 상태는 캐시에서 확인하므로 보통은 DB를 조회하지 않습니다.
     """
 
     authentication_classes: tuple = ()
-    pass
+    serializer_class = CachedTokenRefreshSerializer
 
 
 # ------------------------ 사용자 정보 조회 -------------------------
@@ -365,13 +364,6 @@ class UserDeactivateView(generics.DestroyAPIView):
     # 로그인 상태에서만 접근 가능
     permission_classes: list[type[IsAuthenticated]] = [permissions.IsAuthenticated]
 
-    def _blacklist_all_tokens(self, user: User) -> None:
-        try:
-            for outstanding in OutstandingToken.objects.filter(user=user):
-                BlacklistedToken.objects.get_or_create(token=outstanding)
-        except Exception:
-            pass  # token_blacklist 미사용 시 무시
-
     def delete(self, request: Request) -> Response:
         password = (
             request.data.get("password") if isinstance(request.data, dict) else None
@@ -389,7 +381,7 @@ class UserDeactivateView(generics.DestroyAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        self._blacklist_all_tokens(user)
+        blacklist_user_tokens(user.id)
         user.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
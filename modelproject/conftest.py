@@ -0,0 +1,41 @@
+"""
+pytest 공용 설정입니다.
+
+- 모든 테스트에서 N+1 쿼리 탐지기(utils.nplusone)를 켭니다. 동작 방식은 ini 옵션 `nplusone_detection`으로 정합니다.
+- API 요청 하나가 ini 옵션 `query_budget`보다 많은 쿼리를 실행하면 테스트를 실패시킵니다.
+  특정 테스트만 예산을 바꾸려면 `@pytest.mark.query_budget(20)`을 붙입니다. 0이면 검사하지 않습니다.
+"""
+
+import pytest
+from utils.signals import request_metrics_collected
+
+
+def pytest_addoption(parser):
+    parser.addini('query_budget', "API 요청 하나가 실행할 수 있는 최대 쿼리 수 (0이면 검사하지 않음)", default='0')
+    parser.addini('nplusone_detection', "테스트 중 N+1 쿼리 탐지 방식 (off, log, raise)", default='log')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', "query_budget(n): 이 테스트에서 API 요청 하나가 실행할 수 있는 최대 쿼리 수")
+
+
+@pytest.fixture(autouse=True)
+def query_budget(request, settings):
+    """
+    테스트 중에 보낸 모든 API 요청의 쿼리 수를 검사합니다. 예산을 넘으면 해당 요청에서 바로 실패합니다.
+    """
+
+    mode = request.config.getini('nplusone_detection')
+    settings.NPLUSONE_DETECTION = None if mode == 'off' else mode
+
+    marker = request.node.get_closest_marker('query_budget')
+    budget = int(marker.args[0]) if marker else int(request.config.getini('query_budget'))
+
+    def check_budget(sender, request, route, metrics, **kwargs):
+        if budget and metrics.db_queries > budget:
+            pytest.fail(f"쿼리 예산을 초과했습니다: {request.method} {request.path} "
+                        f"({metrics.db_queries}개 > 예산 {budget}개)", pytrace=False)
+
+    request_metrics_collected.connect(check_budget, weak=False)
+    yield budget
+    request_metrics_collected.disconnect(check_budget)
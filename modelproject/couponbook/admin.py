@@ -74,8 +74,9 @@ class StampAdmin(admin.ModelAdmin):
 # Receipt 모델을 Django 관리자 페이지에 등록
 @admin.register(Receipt)
 class ReceiptAdmin(admin.ModelAdmin):
-    list_display = ("receipt_number", "created_at")
+    list_display = ("receipt_number", "place", "created_at")
     search_fields = ("receipt_number",)
+    list_select_related = ("place",)
 
 @admin.register(LegalDistrict)
 class LegalDistrictAdmin(admin.ModelAdmin):
@@ -0,0 +1,380 @@
+# 벤치마크 실행기
+#
+# 실행 중인 서버(또는 --serve로 띄운 내장 서버)에 시나리오별로 동시 요청을 보내고,
+# 처리량(requests/s), 지연 시간 백분위수(p50/p95/p99), 에러율, 요청당 쿼리 수를 측정합니다.
+# 요청당 쿼리 수는 HTTP로는 알 수 없으므로, 같은 요청을 장고 테스트 클라이언트로 한 번 더 보내서 측정합니다.
+# 내보내기 시나리오는 응답이 크므로 응답 본문의 처리량(MB/s)과 행 처리량(rows/s, NDJSON의 줄 수)도 봅니다.
+# 응답당 전송량(kb_per_response)은 압축을 풀기 전 본문 크기이므로, --accept-encoding gzip으로 nginx 압축 효과를 볼 수 있습니다.
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import count
+from time import perf_counter
+from typing import Callable
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+
+from accounts.models import User
+from couponbook.models import *
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .seed import (BENCHMARK_PASSWORD, BENCHMARK_PREFIX,
+                   BENCHMARK_STAFF_USERNAME)
+
+# 임계값으로 사용할 수 있는 지표입니다. 처리량(MIN_METRICS)은 최솟값, 나머지는 최댓값으로 검사합니다.
+METRICS = ('p50', 'p95', 'p99', 'rps', 'mbps', 'rows_per_s', 'kb_per_response', 'error_rate', 'queries')
+MIN_METRICS = ('rps', 'mbps', 'rows_per_s')
+
+
+@dataclass
+class BenchmarkRequest:
+    method: str
+    path: str
+    body: dict | None = None
+    token: str | None = None
+
+
+@dataclass
+class BenchmarkUser:
+    username: str
+    token: str
+    couponbook_id: int
+    coupon_ids: list[int]
+
+
+class BenchmarkContext:
+    """
+    시나리오들이 공유하는 벤치마크 유저 목록과 미사용 영수증 번호를 관리합니다.
+
+    유저, 쿠폰, 영수증은 각각 따로 센 순서대로 돌려줍니다. 영수증은 한 번 쓰면 다시 쓸 수 없으므로
+    영수증 순번은 영수증을 꺼낼 때만 올라갑니다. (유저를 고르느라 영수증을 건너뛰거나 두 요청이 같은 영수증을 쓰지 않습니다.)
+    영수증은 쿠폰의 가게에서만 적립할 수 있으므로, 미사용 영수증과 순번은 가게마다 따로 둡니다.
+    """
+
+    def __init__(self, users: list[BenchmarkUser], spare_receipts: dict[int, list[str]],
+                 coupon_places: dict[int, int] | None = None, staff_token: str | None = None):
+        if not users:
+            raise ValueError("벤치마크 유저가 없습니다. seed_benchmark_data 명령어를 먼저 실행해 주세요.")
+        self.users = users
+        self.users_with_coupons = [user for user in users if user.coupon_ids]
+        self.spare_receipts = spare_receipts  # 가게 id -> 미사용 영수증 번호
+        self.coupon_places = coupon_places or {}  # 쿠폰 id -> 가게 id
+        self.staff_token = staff_token
+        self._user_counter = count()
+        self._coupon_counter = count()
+        self._receipt_counters: dict[int, count] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls) -> 'BenchmarkContext':
+        """
+        DB에서 벤치마크 유저와 미사용 영수증을 불러오고, 유저마다 Access 토큰을 발급합니다.
+        """
+
+        coupon_ids_by_user: dict[int, list[int]] = {}
+        coupon_places: dict[int, int] = {}
+        for coupon_id, user_id, place_id in (Coupon.objects
+                                             .filter(couponbook__user__username__startswith=BENCHMARK_PREFIX)
+                                             .values_list('id', 'couponbook__user_id', 'original_template__place_id')):
+            coupon_ids_by_user.setdefault(user_id, []).append(coupon_id)
+            coupon_places[coupon_id] = place_id
+
+        users = [
+            BenchmarkUser(
+                username=user.username,
+                token=str(AccessToken.for_user(user)),
+                couponbook_id=user.couponbook.id,
+                coupon_ids=coupon_ids_by_user.get(user.id, []),
+            )
+            for user in (User.objects
+                         .filter(username__startswith=BENCHMARK_PREFIX, is_staff=False)
+                         .select_related('couponbook'))
+        ]
+        spare_receipts: dict[int, list[str]] = {}
+        for receipt_number, place_id in (Receipt.objects
+                                         .filter(receipt_number__startswith=f'{BENCHMARK_PREFIX}free-', stamp__isnull=True)
+                                         .values_list('receipt_number', 'place_id')):
+            spare_receipts.setdefault(place_id, []).append(receipt_number)
+        staff = User.objects.filter(username=BENCHMARK_STAFF_USERNAME).first()
+        return cls(users, spare_receipts, coupon_places, str(AccessToken.for_user(staff)) if staff else None)
+
+    def next_index(self, counter: count) -> int:
+        with self._lock:
+            return next(counter)
+
+    def require_staff_token(self) -> str:
+        if not self.staff_token:
+            raise RuntimeError("벤치마크 스태프 유저가 없습니다. seed_benchmark_data 명령어를 다시 실행해 주세요.")
+        return self.staff_token
+
+    def next_user(self) -> BenchmarkUser:
+        return self.users[self.next_index(self._user_counter) % len(self.users)]
+
+    def next_coupon(self) -> tuple[BenchmarkUser, int]:
+        """
+        쿠폰이 있는 유저를 돌아가며 골라 (유저, 쿠폰 id)를 반환합니다.
+        """
+
+        if not self.users_with_coupons:
+            raise RuntimeError("쿠폰을 가진 벤치마크 유저가 없습니다. seed_benchmark_data 명령어를 다시 실행해 주세요.")
+        index = self.next_index(self._coupon_counter)
+        user = self.users_with_coupons[index % len(self.users_with_coupons)]
+        return user, user.coupon_ids[index // len(self.users_with_coupons) % len(user.coupon_ids)]
+
+    def next_receipt(self, coupon_id: int) -> str:
+        """
+        쿠폰의 가게에 등록된 미사용 영수증을 순서대로 하나씩 돌려줍니다.
+        """
+
+        place_id = self.coupon_places.get(coupon_id)
+        receipts = self.spare_receipts.get(place_id, [])
+        with self._lock:
+            index = next(self._receipt_counters.setdefault(place_id, count()))
+        if index >= len(receipts):
+            raise RuntimeError("이 가게의 미사용 영수증이 모두 소진되었습니다. 벤치마크 데이터를 다시 생성해 주세요.")
+        return receipts[index]
+
+
+# ---- 시나리오 ----
+def catalogue(ctx: BenchmarkContext) -> BenchmarkRequest:
+    """쿠폰 템플릿 목록 조회"""
+    return BenchmarkRequest('GET', '/couponbook/coupon-templates/', token=ctx.next_user().token)
+
+
+def coupon_list(ctx: BenchmarkContext) -> BenchmarkRequest:
+    """내 쿠폰 목록 조회"""
+    user = ctx.next_user()
+    return BenchmarkRequest('GET', f'/couponbook/couponbooks/{user.couponbook_id}/coupons/', token=user.token)
+
+
+def stamp(ctx: BenchmarkContext) -> BenchmarkRequest:
+    """스탬프 적립 (요청마다 미사용 영수증을 하나씩 사용합니다.)"""
+    user, coupon_id = ctx.next_coupon()
+    return BenchmarkRequest('POST', f'/couponbook/coupons/{coupon_id}/stamps/',
+                            body={'receipt': ctx.next_receipt(coupon_id)}, token=user.token)
+
+
+def login(ctx: BenchmarkContext) -> BenchmarkRequest:
+    """로그인"""
+    return BenchmarkRequest('POST', '/accounts/auth/login/',
+                            body={'identifier': ctx.next_user().username, 'password': BENCHMARK_PASSWORD})
+
+
+def curation(ctx: BenchmarkContext) -> BenchmarkRequest:
+    """AI 큐레이션 (벤치마크 설정에서는 스텁 큐레이터를 사용합니다.)"""
+    return BenchmarkRequest('GET', '/couponbook/own-couponbook/curation/', token=ctx.next_user().token)
+
+
+def export_coupons(ctx: BenchmarkContext) -> BenchmarkRequest:
+    """전체 쿠폰 이력 내보내기 (스태프, NDJSON)"""
+    return BenchmarkRequest('GET', '/couponbook/exports/coupons/?output=ndjson', token=ctx.require_staff_token())
+
+
+def export_stamps(ctx: BenchmarkContext) -> BenchmarkRequest:
+    """전체 스탬프 이력 내보내기 (스태프, NDJSON)"""
+    return BenchmarkRequest('GET', '/couponbook/exports/stamps/?output=ndjson', token=ctx.require_staff_token())
+
+
+def locations(ctx: BenchmarkContext) -> BenchmarkRequest:
+    """전체 지역 목록 조회 (응답이 큰 JSON)"""
+    return BenchmarkRequest('GET', '/api/locations/')
+
+
+SCENARIOS: dict[str, Callable[[BenchmarkContext], BenchmarkRequest]] = {
+    'catalogue': catalogue,
+    'coupon-list': coupon_list,
+    'stamp': stamp,
+    'login': login,
+    'curation': curation,
+    'export-coupons': export_coupons,
+    'export-stamps': export_stamps,
+    'locations': locations,
+}
+
+
+# ---- 측정 ----
+@dataclass
+class ScenarioResult:
+    name: str
+    latencies: list[float] = field(default_factory=list)  # 초 단위
+    errors: int = 0
+    elapsed: float = 0.0
+    queries: int | None = None
+    bytes_received: int = 0  # 성공한 응답 본문의 바이트 수 합계
+    lines_received: int = 0  # 성공한 응답 본문의 줄 수 합계
+
+    @property
+    def total(self) -> int:
+        return len(self.latencies) + self.errors
+
+    def summary(self) -> dict:
+        """
+        결과를 지표 이름(METRICS)을 키로 하는 딕셔너리로 정리합니다. 지연 시간은 밀리초 단위입니다.
+        """
+
+        return {
+            'requests': self.total,
+            'p50': percentile(self.latencies, 50) * 1000,
+            'p95': percentile(self.latencies, 95) * 1000,
+            'p99': percentile(self.latencies, 99) * 1000,
+            'rps': self.total / self.elapsed if self.elapsed else 0.0,
+            'mbps': self.bytes_received / 1_000_000 / self.elapsed if self.elapsed else 0.0,
+            'rows_per_s': self.lines_received / self.elapsed if self.elapsed else 0.0,
+            'kb_per_response': self.bytes_received / 1000 / len(self.latencies) if self.latencies else 0.0,
+            'error_rate': self.errors / self.total if self.total else 0.0,
+            'queries': self.queries,
+        }
+
+
+def percentile(values: list[float], p: float) -> float:
+    """
+    선형 보간으로 p번째 백분위수를 계산합니다. 값이 없으면 0을 반환합니다.
+    """
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def send(base_url: str, request: BenchmarkRequest, timeout: float,
+         accept_encoding: str | None = None) -> tuple[int, int, int]:
+    """
+    HTTP 요청을 보내고 (상태 코드, 응답 본문 바이트 수, 줄 수)를 반환합니다.
+
+    응답 본문은 끝까지 읽되, 큰 응답(내보내기)도 메모리에 모으지 않도록 조금씩 읽습니다.
+    `accept_encoding`을 지정하면 압축된 본문을 풀지 않고 그대로 셉니다. (줄 수는 의미가 없어집니다.)
+    """
+
+    headers = {'Accept': 'application/json'}
+    if accept_encoding:
+        headers['Accept-Encoding'] = accept_encoding
+    data = None
+    if request.body is not None:
+        data = json.dumps(request.body).encode()
+        headers['Content-Type'] = 'application/json'
+    if request.token:
+        headers['Authorization'] = f'Bearer {request.token}'
+
+    try:
+        with urlopen(Request(base_url + request.path, data=data, headers=headers, method=request.method),
+                     timeout=timeout) as response:
+            size = lines = 0
+            while chunk := response.read(64 * 1024):
+                size += len(chunk)
+                lines += chunk.count(b'\n')
+            return response.status, size, lines
+    except HTTPError as e:
+        e.read()
+        return e.code, 0, 0
+
+
+def run_load(base_url: str, name: str, ctx: BenchmarkContext, requests: int, concurrency: int,
+             timeout: float = 30.0, accept_encoding: str | None = None) -> ScenarioResult:
+    """
+    시나리오의 요청을 `concurrency`개의 스레드로 `requests`번 보냅니다. 2xx가 아닌 응답과 연결 오류는 에러로 셉니다.
+    """
+
+    make_request = SCENARIOS[name]
+    result = ScenarioResult(name)
+    lock = threading.Lock()
+
+    def worker(_):
+        request = make_request(ctx)
+        started_at = perf_counter()
+        try:
+            status, size, lines = send(base_url, request, timeout, accept_encoding)
+            ok = 200 <= status < 300
+        except (URLError, OSError):
+            ok = False
+        latency = perf_counter() - started_at
+        with lock:
+            if ok:
+                result.latencies.append(latency)
+                result.bytes_received += size
+                result.lines_received += lines
+            else:
+                result.errors += 1
+
+    started_at = perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(worker, range(requests)))
+    result.elapsed = perf_counter() - started_at
+    return result
+
+
+def count_queries(name: str, ctx: BenchmarkContext, host: str = 'localhost') -> int:
+    """
+    장고 테스트 클라이언트로 시나리오의 요청을 한 번 보내 실행된 쿼리 수를 셉니다.
+
+    요청 중의 변경 사항(스탬프 적립 등)은 롤백합니다.
+    """
+
+    request = SCENARIOS[name](ctx)
+    client = Client(HTTP_HOST=host)
+    headers = {'Authorization': f'Bearer {request.token}'} if request.token else {}
+    data = json.dumps(request.body) if request.body is not None else ''
+
+    with transaction.atomic():
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as captured:
+            response = client.generic(request.method, request.path, data, content_type='application/json',
+                                      headers=headers)
+            if response.streaming:  # 스트리밍 응답의 쿼리는 본문을 읽을 때 실행됩니다.
+                for _ in response.streaming_content:
+                    pass
+        transaction.set_rollback(True)
+    return len(captured)
+
+
+def parse_thresholds(specs: list[str]) -> dict[tuple[str, str], float]:
+    """
+    'catalogue.p95=200' 형식의 문자열들을 {(시나리오, 지표): 값} 딕셔너리로 변환합니다.
+    """
+
+    thresholds = {}
+    for spec in specs:
+        try:
+            key, value = spec.split('=', 1)
+            scenario, metric = key.rsplit('.', 1)
+            value = float(value)
+        except ValueError:
+            raise ValueError(f"임계값 형식이 잘못되었습니다: '{spec}' (예: catalogue.p95=200)")
+        if scenario not in SCENARIOS:
+            raise ValueError(f"알 수 없는 시나리오입니다: '{scenario}'")
+        if metric not in METRICS:
+            raise ValueError(f"알 수 없는 지표입니다: '{metric}' (사용 가능: {', '.join(METRICS)})")
+        thresholds[(scenario, metric)] = value
+    return thresholds
+
+
+def check_thresholds(summaries: dict[str, dict], thresholds: dict[tuple[str, str], float]) -> list[str]:
+    """
+    시나리오별 측정 결과를 임계값과 비교하여, 임계값을 넘은 항목의 설명을 목록으로 반환합니다.
+    """
+
+    failures = []
+    for (scenario, metric), limit in thresholds.items():
+        if scenario not in summaries:
+            continue
+        value = summaries[scenario][metric]
+        if value is None:
+            continue
+        if metric in MIN_METRICS:
+            if value < limit:
+                failures.append(f"{scenario}.{metric}: {value:.2f} < {limit:g}")
+        elif value > limit:
+            failures.append(f"{scenario}.{metric}: {value:.2f} > {limit:g}")
+    return failures
+
+
+def host_of(base_url: str) -> str:
+    return urlsplit(base_url).netloc
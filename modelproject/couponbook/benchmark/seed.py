@@ -0,0 +1,160 @@
+# 벤치마크용 대량 데이터 생성기
+#
+# 모델의 save()는 카카오맵 API 호출, 유효성 검증 등을 실행하므로, bulk_create로 직접 INSERT 합니다.
+# MySQL은 bulk_create 후에 pk를 돌려주지 않으므로, INSERT 후에는 접두어로 다시 조회해서 id를 얻습니다.
+
+import random
+from dataclasses import dataclass
+from datetime import time, timedelta
+from decimal import Decimal
+
+from accounts.models import User
+from couponbook.models import *
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils.timezone import now
+
+BENCHMARK_PREFIX = 'bench-'  # 벤치마크 데이터 식별용 접두어 (유저 이름, 가게 이름, 영수증 번호)
+BENCHMARK_PASSWORD = 'bench-P@ssw0rd!'  # 로그인 시나리오에 사용하는 모든 벤치마크 유저의 비밀번호
+BENCHMARK_STAFF_USERNAME = f'{BENCHMARK_PREFIX}staff'  # 내보내기 시나리오에 사용하는 스태프 유저
+BENCHMARK_REWARD_AMOUNT = 1_000  # 스탬프 적립 시나리오 중에 쿠폰이 완성되지 않도록 넉넉하게 설정
+
+
+@dataclass
+class SeedConfig:
+    """
+    생성할 데이터의 규모입니다.
+    """
+
+    places: int = 2_000
+    templates_per_place: int = 2
+    users: int = 2_000
+    coupons_per_user: int = 5
+    stamps_per_coupon: int = 3
+    spare_receipts: int = 20_000  # 스탬프 적립 시나리오에서 사용할 미사용 영수증 수
+    batch_size: int = 1_000
+    random_seed: int = 42
+
+
+def clear_dataset():
+    """
+    이전에 생성한 벤치마크 데이터를 삭제합니다. 다른 데이터는 건드리지 않습니다.
+    """
+
+    with transaction.atomic():
+        User.objects.filter(username__startswith=BENCHMARK_PREFIX).delete()
+        Place.objects.filter(name__startswith=BENCHMARK_PREFIX).delete()
+        Receipt.objects.filter(receipt_number__startswith=BENCHMARK_PREFIX).delete()
+        LegalDistrict.objects.filter(code_in_law__startswith='99').delete()
+
+
+def _bulk_create(model, objs, batch_size: int):
+    model.objects.bulk_create(objs, batch_size=batch_size)
+
+
+def seed_dataset(config: SeedConfig, stdout=None) -> dict[str, int]:
+    """
+    설정한 규모만큼 가게, 쿠폰 템플릿, 유저, 쿠폰, 스탬프, 영수증을 생성하고 모델별 생성 개수를 반환합니다.
+    """
+
+    rng = random.Random(config.random_seed)
+    batch_size = config.batch_size
+
+    def log(message: str):
+        if stdout:
+            stdout.write(message)
+
+    with transaction.atomic():
+        # 법정동 주소 (실제 법정동 코드와 겹치지 않도록 99로 시작)
+        districts = [
+            LegalDistrict(code_in_law=f'99{i:08d}', province='벤치특별시', city=f'벤치{i % 25}구', district=f'벤치{i}동')
+            for i in range(100)
+        ]
+        _bulk_create(LegalDistrict, districts, batch_size)
+
+        # 가게
+        places = [
+            Place(
+                name=f'{BENCHMARK_PREFIX}{i}',
+                address_district=districts[i % len(districts)],
+                address_rest=str(i),
+                lat=Decimal('37.5') + Decimal(rng.randint(0, 99_999)) / Decimal(1_000_000),
+                lng=Decimal('127.0') + Decimal(rng.randint(0, 99_999)) / Decimal(1_000_000),
+                image_url=f'https://example.com/{BENCHMARK_PREFIX}{i}.jpg',
+                opens_at=time(9, 0),
+                closes_at=time(22, 0),
+                last_order=time(21, 30),
+                tags='카페,디저트',
+                tel='02-0000-0000',
+            )
+            for i in range(config.places)
+        ]
+        _bulk_create(Place, places, batch_size)
+        place_ids = list(Place.objects.filter(name__startswith=BENCHMARK_PREFIX).values_list('id', flat=True))
+        log(f"가게 {len(place_ids)}개 생성")
+
+        # 쿠폰 템플릿 + 리워드 정보
+        valid_until = now() + timedelta(days=365)
+        _bulk_create(CouponTemplate, [
+            CouponTemplate(place_id=place_id, valid_until=valid_until, first_n_persons=0, is_on=True)
+            for place_id in place_ids for _ in range(config.templates_per_place)
+        ], batch_size)
+        template_ids = list(CouponTemplate.objects.filter(place_id__in=place_ids).values_list('id', flat=True))
+        _bulk_create(RewardsInfo, [
+            RewardsInfo(coupon_template_id=template_id, amount=BENCHMARK_REWARD_AMOUNT, reward='아메리카노 1잔 무료')
+            for template_id in template_ids
+        ], batch_size)
+        log(f"쿠폰 템플릿 {len(template_ids)}개 생성")
+
+        # 유저 + 쿠폰북 (bulk_create는 post_save 시그널을 보내지 않으므로 쿠폰북도 직접 생성)
+        password = make_password(BENCHMARK_PASSWORD)  # 해싱은 비싸므로 한 번만 계산
+        _bulk_create(User, [
+            User(username=f'{BENCHMARK_PREFIX}{i}', email=f'{BENCHMARK_PREFIX}{i}@example.com',
+                 password=password, role=User.Role.CUSTOMER)
+            for i in range(config.users)
+        ], batch_size)
+        user_ids = list(User.objects.filter(username__startswith=BENCHMARK_PREFIX).values_list('id', flat=True))
+        _bulk_create(CouponBook, [CouponBook(user_id=user_id) for user_id in user_ids], batch_size)
+        couponbooks = list(CouponBook.objects.filter(user_id__in=user_ids).values_list('id', 'user_id'))
+        log(f"유저 {len(user_ids)}명 생성")
+
+        # 내보내기 시나리오에서 사용하는 스태프 유저 (쿠폰북 없음)
+        User.objects.bulk_create([
+            User(username=BENCHMARK_STAFF_USERNAME, email=f'{BENCHMARK_STAFF_USERNAME}@example.com',
+                 password=password, is_staff=True)
+        ])
+
+        # 쿠폰 (유저마다 서로 다른 템플릿)
+        coupons_per_user = min(config.coupons_per_user, len(template_ids))
+        _bulk_create(Coupon, [
+            Coupon(couponbook_id=couponbook_id, original_template_id=template_id)
+            for couponbook_id, _ in couponbooks
+            for template_id in rng.sample(template_ids, coupons_per_user)
+        ], batch_size)
+        coupons = list(Coupon.objects.filter(couponbook__user_id__in=user_ids)
+                       .values_list('id', 'couponbook__user_id', 'original_template__place_id'))
+        log(f"쿠폰 {len(coupons)}개 생성")
+
+        # 영수증 + 스탬프 (영수증은 쿠폰의 가게에서만 적립할 수 있으므로 가게를 지정합니다.)
+        receipts, stamps = [], []
+        for coupon_id, user_id, place_id in coupons:
+            for n in range(config.stamps_per_coupon):
+                receipt_number = f'{BENCHMARK_PREFIX}{coupon_id}-{n}'
+                receipts.append(Receipt(receipt_number=receipt_number, place_id=place_id))
+                stamps.append(Stamp(coupon_id=coupon_id, receipt_id=receipt_number, customer_id=user_id))
+        # 미사용 영수증은 쿠폰 순서대로 돌아가며 그 쿠폰의 가게에 배정합니다. (스탬프 시나리오도 쿠폰을 돌아가며 고릅니다.)
+        if coupons:
+            receipts += [Receipt(receipt_number=f'{BENCHMARK_PREFIX}free-{i}', place_id=coupons[i % len(coupons)][2])
+                         for i in range(config.spare_receipts)]
+        _bulk_create(Receipt, receipts, batch_size)
+        _bulk_create(Stamp, stamps, batch_size)
+        log(f"영수증 {len(receipts)}개, 스탬프 {len(stamps)}개 생성")
+
+    return {
+        'places': len(place_ids),
+        'coupon_templates': len(template_ids),
+        'users': len(user_ids),
+        'coupons': len(coupons),
+        'stamps': len(stamps),
+        'receipts': len(receipts),
+    }
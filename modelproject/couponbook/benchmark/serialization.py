@@ -0,0 +1,129 @@
+# 직렬화 마이크로벤치마크
+#
+# 목록 응답 하나를 만드는 데 드는 항목당 비용(쿼리 + 직렬화)을 기존 시리얼라이저와 가벼운 직렬화 경로(couponbook.fastpath)로
+# 각각 측정합니다. HTTP와 JSON 렌더링은 제외하고, 같은 쿼리셋을 여러 번 반복해서 가장 빠른 값을 사용합니다.
+# JSON 렌더링(DRF JSONRenderer와 utils.renderers.FastJSONRenderer)과 영업 시간 포맷(TimeField와 CachedTimeField)은
+# 같은 방식으로 따로 측정합니다. 항목별 상세 조회 URL(reverse와 utils.url_templates)은 1,000개 목록 기준으로 측정합니다.
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable
+
+from couponbook.fastpath.utils import (serialize_coupon_list,
+                                       serialize_coupon_template_list,
+                                       serialize_favorite_coupon_list)
+from couponbook.models import *
+from couponbook.serializers import (TIME_FORMAT, CachedTimeField,
+                                    CouponListResponseSerializer,
+                                    CouponTemplateListSerializer,
+                                    FavoriteCouponListResponseSerializer)
+from django.db.models import Prefetch, QuerySet
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory
+from utils.renderers import FastJSONRenderer
+from utils.url_templates import url_template
+
+
+@dataclass
+class SerializationCost:
+    items: int
+    before_us: float  # 기존 방식의 항목당 시간(마이크로초)
+    after_us: float  # 빠른 방식의 항목당 시간(마이크로초)
+
+    @property
+    def speedup(self) -> float:
+        return self.before_us / self.after_us if self.after_us else 0.0
+
+
+def best_of(fn: Callable[[], list], repeat: int) -> tuple[float, int]:
+    """
+    `fn`을 `repeat`번 실행해서 가장 짧은 시간(초)과 결과 항목 수를 반환합니다.
+    """
+    best, items = float('inf'), 0
+    for _ in range(repeat):
+        started_at = perf_counter()
+        items = len(fn())
+        best = min(best, perf_counter() - started_at)
+    return best, items
+
+
+def measure(queryset: QuerySet, serializer_class, fast_serializer, request: Request, repeat: int) -> SerializationCost:
+    context = {'request': request}
+    slow, items = best_of(lambda: serializer_class(list(queryset.all()), many=True, context=context).data, repeat)
+    fast, _ = best_of(lambda: fast_serializer(queryset.all(), request), repeat)
+    per_item = 1_000_000 / max(items, 1)
+    return SerializationCost(items, slow * per_item, fast * per_item)
+
+
+def measure_rendering(data: list, repeat: int) -> SerializationCost:
+    """
+    `data`를 DRF `JSONRenderer`와 `FastJSONRenderer`로 렌더링하는 항목당 시간을 측정합니다.
+    """
+    slow, _ = best_of(lambda: [JSONRenderer().render(data)], repeat)
+    fast, _ = best_of(lambda: [FastJSONRenderer().render(data)], repeat)
+    per_item = 1_000_000 / max(len(data), 1)
+    return SerializationCost(len(data), slow * per_item, fast * per_item)
+
+
+def measure_time_format(places: QuerySet, repeat: int) -> SerializationCost:
+    """
+    가게 영업 시간(opens_at, closes_at, last_order)을 `TimeField`와 `CachedTimeField`로 변환하는 가게당 시간을 측정합니다.
+    """
+    times = list(places.values_list('opens_at', 'closes_at', 'last_order'))
+    plain, cached = serializers.TimeField(TIME_FORMAT), CachedTimeField(TIME_FORMAT)
+    slow, _ = best_of(lambda: [plain.to_representation(value) for row in times for value in row], repeat)
+    fast, _ = best_of(lambda: [cached.to_representation(value) for row in times for value in row], repeat)
+    per_item = 1_000_000 / max(len(times), 1)
+    return SerializationCost(len(times), slow * per_item, fast * per_item)
+
+
+def measure_url_building(request: Request, items: int, repeat: int) -> SerializationCost:
+    """
+    쿠폰 상세 조회 URL `items`개를 `reverse`와 `url_template`으로 만드는 항목당 시간을 측정합니다.
+    `url_template`은 요청마다 템플릿을 새로 만드는 비용까지 포함합니다.
+    """
+
+    def build_with_reverse():
+        return [reverse('couponbook:coupon-detail', kwargs={'coupon_id': i}, request=request) for i in range(items)]
+
+    def build_with_template():
+        request.__dict__.pop('_url_templates', None)
+        template = url_template(request, 'couponbook:coupon-detail', 'coupon_id')
+        return [template(i) for i in range(items)]
+
+    slow, _ = best_of(build_with_reverse, repeat)
+    fast, _ = best_of(build_with_template, repeat)
+    per_item = 1_000_000 / max(items, 1)
+    return SerializationCost(items, slow * per_item, fast * per_item)
+
+
+def measure_serialization(user, items: int = 500, repeat: int = 5) -> dict[str, SerializationCost]:
+    """
+    쿠폰 목록, 즐겨찾기 목록, 쿠폰 템플릿 목록 응답의 항목당 비용, 쿠폰 목록의 JSON 렌더링 비용, 영업 시간 포맷 비용,
+    상세 조회 URL을 만드는 비용을 측정합니다.
+    데이터는 DB에 있는 쿠폰/즐겨찾기/템플릿/가게를 최대 `items`개 사용합니다.
+    """
+
+    request = Request(APIRequestFactory().get('/'))
+    request.user = user
+
+    coupons = Coupon.objects.with_card().order_by('id')[:items]
+    favorites = (FavoriteCoupon.objects
+                 .prefetch_related(Prefetch('coupon', queryset=Coupon.objects.with_card()))
+                 .order_by('id')[:items])
+    templates = (CouponTemplate.objects.active()
+                 .select_related('place', 'place__address_district', 'reward_info')
+                 .with_remaining().with_owned_by(user).order_by('id')[:items])
+    return {
+        'coupon-list': measure(coupons, CouponListResponseSerializer, serialize_coupon_list, request, repeat),
+        'favorite-list': measure(favorites, FavoriteCouponListResponseSerializer, serialize_favorite_coupon_list,
+                                 request, repeat),
+        'coupon-template-list': measure(templates, CouponTemplateListSerializer, serialize_coupon_template_list,
+                                        request, repeat),
+        'render-coupon-list': measure_rendering(serialize_coupon_list(coupons, request), repeat),
+        'place-time-format': measure_time_format(Place.objects.order_by('id')[:items], repeat),
+        'coupon-url': measure_url_building(request, 1_000, repeat),
+    }
@@ -0,0 +1,48 @@
+import asyncio
+from json import dumps
+from time import sleep
+
+from couponbook.curation.utils import AICurator
+from django.conf import settings
+
+# 벤치마크용 스텁
+# settings의 `AI_CURATOR_CLASS`에 'couponbook.benchmark.stubs.StubCurator'를 지정하면 제미나이 대신 사용됩니다.
+
+
+class StubResponse:
+    """
+    제미나이 응답을 흉내내는 객체입니다. `text` 속성만 사용합니다.
+    """
+
+    def __init__(self, coupon_template_ids: list[int]):
+        self.text = dumps({'coupon_template_ids': coupon_template_ids})
+
+
+class StubCurator(AICurator):
+    """
+    제미나이를 호출하지 않는 큐레이터입니다.
+
+    프롬프트 생성(통계, 쿠폰 템플릿 직렬화)은 실제와 똑같이 실행하고, 제미나이 응답만
+    `AI_CURATOR_STUB_DELAY`초(기본 0.5초) 기다린 후 후보 쿠폰 템플릿 중 앞의 3개를 추천합니다.
+    """
+
+    def __init__(self, gemini_api_key: str = ''):
+        self.api_key = gemini_api_key
+        self.delay = getattr(settings, 'AI_CURATOR_STUB_DELAY', 0.5)
+        self.candidate_ids: list[int] = []
+
+    def initialize_client(self):
+        self.client = None
+
+    def generate_curation_contents(self, statistics, coupon_templates) -> dict:
+        curation_contents = super().generate_curation_contents(statistics, coupon_templates)
+        self.candidate_ids = list(coupon_templates.values_list('id', flat=True)[:3])
+        return curation_contents
+
+    def generate_response(self, curation_contents):
+        sleep(self.delay)
+        return StubResponse(self.candidate_ids)
+
+    async def agenerate_response(self, curation_contents):
+        await asyncio.sleep(self.delay)
+        return StubResponse(self.candidate_ids)
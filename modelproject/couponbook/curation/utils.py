@@ -1,15 +1,23 @@
+import logging
 from datetime import datetime
 from json import dumps, loads
 
 from accounts.models import User
+from asgiref.sync import sync_to_async
 from couponbook.models import *
 from decouple import config
+from django.conf import settings
+from django.utils.module_loading import import_string
 from google import genai
 from google.genai import types
 from pydantic import BaseModel
+from utils.instrumentation import timed
+from utils.logs import log_event
 
 from .serializers import CouponTemplateDictSerializer
 
+logger = logging.getLogger(__name__)
+
 
 class UserStatistics:
     """
@@ -35,7 +43,8 @@ class UserStatistics:
             couponbook = CouponBook.objects.get(user=self.user)
             return couponbook
         except CouponBook.DoesNotExist:
-            print("유저의 쿠폰북이 존재하지 않습니다.")
+            log_event(logger, 'couponbook_missing', "유저의 쿠폰북이 존재하지 않습니다.",
+                      level=logging.WARNING, user_id=self.user.id)
 
     def format_time(self, time: datetime) -> str:
         """
@@ -206,6 +215,17 @@ class AICurator:
         )
 
         return response
+
+    async def agenerate_response(self, curation_contents):
+        """
+        `generate_response`의 비동기 버전입니다. 제미나이의 응답을 기다리는 동안 이벤트 루프를 막지 않습니다.
+        """
+        response = await self.client.aio.models.generate_content(
+            model='gemini-2.5-flash',
+            **curation_contents
+        )
+
+        return response
     
     def curate(self, statistics: UserStatistics, coupon_templates) -> list[int]:
         """
@@ -215,6 +235,34 @@ class AICurator:
         if not hasattr(self, 'client'):
             self.initialize_client()
         curation_contents = self.generate_curation_contents(statistics, coupon_templates)
-        response = self.generate_response(curation_contents)
+        with timed('gemini'):
+            response = self.generate_response(curation_contents)
+        coupon_template_ids = loads(response.text)['coupon_template_ids']
+        return coupon_template_ids
+
+    async def acurate(self, statistics: UserStatistics, coupon_templates) -> list[int]:
+        """
+        `curate`의 비동기 버전입니다. 비동기 뷰에서 사용합니다.
+
+        통계와 쿠폰 템플릿 직렬화는 ORM을 사용하므로 `sync_to_async`로 실행하고, 제미나이 호출만 await 합니다.
+        """
+
+        if not hasattr(self, 'client'):
+            self.initialize_client()
+        curation_contents = await sync_to_async(self.generate_curation_contents)(statistics, coupon_templates)
+        with timed('gemini'):
+            response = await self.agenerate_response(curation_contents)
         coupon_template_ids = loads(response.text)['coupon_template_ids']
         return coupon_template_ids
+
+
+def get_curator() -> AICurator:
+    """
+    settings의 `AI_CURATOR_CLASS`에 지정된 큐레이터 인스턴스를 생성합니다. 지정하지 않으면 `AICurator`를 사용합니다.
+
+    벤치마크처럼 제미나이를 호출하면 안 되는 환경에서 스텁 큐레이터로 교체하는 데에 사용합니다.
+    """
+
+    curator_path = getattr(settings, 'AI_CURATOR_CLASS', None)
+    curator_class = import_string(curator_path) if curator_path else AICurator
+    return curator_class()
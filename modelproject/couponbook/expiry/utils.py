@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable
+
+from couponbook.models import Coupon, CouponTemplate
+from couponbook.signals import coupon_expiring_soon
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils.timezone import now
+
+
+@dataclass
+class SweepResult:
+    templates_closed: int = 0  # 유효기간이 지나 비공개로 바꾼 쿠폰 템플릿 수
+    templates_reopened: int = 0  # 유효기간이 연장되어 다시 게시 중으로 바꾼 쿠폰 템플릿 수
+    coupons_expired: int = 0  # 만료 상태로 바꾼 쿠폰 수
+    coupons_revived: int = 0  # 유효기간이 연장되어 다시 사용 중으로 바꾼 쿠폰 수
+    coupons_notified: int = 0  # 만료 임박 알림을 보낸 쿠폰 수
+
+
+def _update_in_batches(queryset: QuerySet, batch_size: int, **values) -> int:
+    """
+    `queryset`에 해당하는 행을 id 기준으로 `batch_size`개씩 나눠 갱신하고, 갱신한 행 수를 반환합니다.
+    갱신한 행은 `queryset` 조건에서 빠져야 합니다. (그렇지 않으면 끝나지 않습니다.)
+    """
+    updated = 0
+    while ids := list(queryset.order_by('id').values_list('id', flat=True)[:batch_size]):
+        with transaction.atomic():
+            # 조회와 갱신 사이에 조건이 바뀐 행은 건너뛰도록 조건을 다시 겁니다.
+            updated += queryset.filter(id__in=ids).update(**values)
+        if len(ids) < batch_size:
+            break
+    return updated
+
+
+def close_expired_templates(at: datetime, batch_size: int) -> int:
+    """
+    유효기간이 지났는데 게시 중인 쿠폰 템플릿을 비공개로 바꿉니다. 만료 처리로 바꾼 것임을 `expiry_closed_at`에 기록합니다.
+    """
+    expired = CouponTemplate.objects.filter(is_on=True, valid_until__lt=at)
+    return _update_in_batches(expired, batch_size, is_on=False, expiry_closed_at=at)
+
+
+def reopen_extended_templates(at: datetime, batch_size: int) -> int:
+    """
+    만료 처리로 비공개가 되었지만 점주가 유효기간을 연장(또는 삭제)한 쿠폰 템플릿을 다시 게시 중으로 바꿉니다.
+    점주가 직접 비공개로 바꾼 템플릿(`expiry_closed_at`이 없음)은 그대로 둡니다.
+    `expiry_closed_at`이 생기기 전에 비공개가 된 템플릿은 누가 바꿨는지 알 수 없으므로 표시가 없고, 다시 게시되지 않습니다.
+    """
+    extended = CouponTemplate.objects.filter(Q(valid_until__gte=at) | Q(valid_until__isnull=True),
+                                             is_on=False, expiry_closed_at__isnull=False)
+    return _update_in_batches(extended, batch_size, is_on=True, expiry_closed_at=None)
+
+
+def expire_coupons(at: datetime, batch_size: int) -> int:
+    """
+    유효기간이 지난 쿠폰 템플릿으로 발급된 쿠폰을 만료 상태로 바꿉니다.
+    """
+    expired = Coupon.objects.filter(status=Coupon.Status.ACTIVE, original_template__valid_until__lt=at)
+    return _update_in_batches(expired, batch_size, status=Coupon.Status.EXPIRED)
+
+
+def revive_coupons(at: datetime, batch_size: int) -> int:
+    """
+    만료 상태지만 점주가 유효기간을 연장(또는 삭제)한 쿠폰을 다시 사용 중으로 바꿉니다.
+    """
+    revived = Coupon.objects.filter(Q(original_template__valid_until__gte=at)
+                                    | Q(original_template__valid_until__isnull=True),
+                                    status=Coupon.Status.EXPIRED)
+    return _update_in_batches(revived, batch_size, status=Coupon.Status.ACTIVE, expiry_notified_at=None)
+
+
+def notify_expiring_coupons(at: datetime, batch_size: int, days: int) -> int:
+    """
+    유효기간이 `days`일 안에 끝나는 사용 중인 쿠폰에 대해 `coupon_expiring_soon` 시그널을 배치 단위로 보냅니다.
+    알림을 보낸 쿠폰은 `expiry_notified_at`을 기록해서 다시 보내지 않습니다.
+    수신자에서 예외가 발생하면 해당 배치는 기록되지 않으므로 다음 실행 때 다시 보냅니다.
+    """
+    expiring = Coupon.objects.filter(status=Coupon.Status.ACTIVE,
+                                     expiry_notified_at__isnull=True,
+                                     original_template__valid_until__gte=at,
+                                     original_template__valid_until__lte=at + timedelta(days=days))
+    notified = 0
+    while coupons := list(expiring.select_related('original_template', 'couponbook').order_by('id')[:batch_size]):
+        coupon_expiring_soon.send(sender=Coupon, coupons=coupons)
+        notified += Coupon.objects.filter(id__in=[coupon.id for coupon in coupons]).update(expiry_notified_at=at)
+        if len(coupons) < batch_size:
+            break
+    return notified
+
+
+def sweep_coupon_expiry(at: datetime | None = None, batch_size: int | None = None,
+                        notify: bool = True, on_step: Callable[[str, int], None] | None = None) -> SweepResult:
+    """
+    쿠폰 만료 처리를 한 번 실행합니다. sweep_coupon_expiry 명령어가 주기적으로 호출합니다.
+
+    1. 유효기간이 지난 쿠폰 템플릿을 비공개(`is_on=False`)로 바꿉니다.
+    2. 유효기간이 지난 쿠폰을 만료(`Coupon.Status.EXPIRED`)로 바꿉니다.
+    3. 유효기간이 연장된 쿠폰 템플릿을 다시 게시 중으로, 만료 쿠폰을 다시 사용 중으로 바꿉니다.
+    4. `notify`가 참이면 만료가 임박한 쿠폰에 대해 알림 시그널을 보냅니다. (`COUPON_EXPIRING_SOON_DAYS`)
+
+    각 단계는 id 기준 배치로 짧은 트랜잭션에서 갱신하므로 테이블을 오래 잠그지 않습니다.
+    """
+
+    at = at or now()
+    batch_size = batch_size or settings.COUPON_EXPIRY_BATCH_SIZE
+    result = SweepResult()
+
+    steps = [
+        ('templates_closed', lambda: close_expired_templates(at, batch_size)),
+        ('coupons_expired', lambda: expire_coupons(at, batch_size)),
+        ('templates_reopened', lambda: reopen_extended_templates(at, batch_size)),
+        ('coupons_revived', lambda: revive_coupons(at, batch_size)),
+    ]
+    if notify:
+        steps.append(('coupons_notified',
+                      lambda: notify_expiring_coupons(at, batch_size, settings.COUPON_EXPIRING_SOON_DAYS)))
+
+    for name, step in steps:
+        count = step()
+        setattr(result, name, count)
+        if on_step:
+            on_step(name, count)
+
+    return result
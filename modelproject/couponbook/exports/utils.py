@@ -0,0 +1,182 @@
+import csv
+import json
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Iterable, Iterator
+
+from couponbook.models import Coupon, Stamp
+from couponbook.stats.utils import day_bounds
+from django.db.models import Q, QuerySet
+from django.utils.timezone import get_current_timezone
+
+EXPORT_CHUNK_SIZE = 2_000  # DB에서 한 번에 가져오는 행 수 (쿼리 한 번의 LIMIT)
+EXPORT_BUFFER_SIZE = 64 * 1024  # 응답으로 한 번에 내보내는 바이트 수 (대략)
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    name: str
+    lookup: str  # values_list에 넘기는 필드 이름 (관계는 __로 조인)
+    is_datetime: bool = False
+
+
+# ---- 내보낼 데이터 ----
+# 행마다 모델 인스턴스를 만들면(select_related) 직렬화보다 인스턴스 생성이 훨씬 오래 걸리므로,
+# 같은 조인을 values_list로 실행해서 튜플로 가져옵니다.
+COUPON_COLUMNS = [
+    ExportColumn('coupon_id', 'id'),
+    ExportColumn('template_id', 'original_template_id'),
+    ExportColumn('place_id', 'original_template__place_id'),
+    ExportColumn('place_name', 'original_template__place__name'),
+    ExportColumn('customer_id', 'couponbook__user_id'),
+    ExportColumn('stamp_count', 'stamp_counts'),
+    ExportColumn('reward_amount', 'original_template__reward_info__amount'),
+    ExportColumn('saved_at', 'saved_at', is_datetime=True),
+]
+
+STAMP_COLUMNS = [
+    ExportColumn('stamp_id', 'id'),
+    ExportColumn('coupon_id', 'coupon_id'),
+    ExportColumn('template_id', 'coupon__original_template_id'),
+    ExportColumn('place_id', 'coupon__original_template__place_id'),
+    ExportColumn('place_name', 'coupon__original_template__place__name'),
+    ExportColumn('customer_id', 'customer_id'),
+    ExportColumn('receipt_number', 'receipt_id'),
+    ExportColumn('created_at', 'created_at', is_datetime=True),
+]
+
+
+def _date_range_filter(field: str, since: date | None, until: date | None) -> Q:
+    # __date 조회는 MySQL에서 CONVERT_TZ를 사용하므로(타임존 테이블이 없으면 NULL), 현지 날짜의 시각 범위로 비교합니다.
+    q = Q()
+    if since:
+        q &= Q(**{f'{field}__gte': day_bounds(since)[0]})
+    if until:
+        q &= Q(**{f'{field}__lt': day_bounds(until)[1]})
+    return q
+
+
+def coupon_export_queryset(place_id: int | None = None, since: date | None = None,
+                           until: date | None = None) -> QuerySet:
+    """
+    내보낼 쿠폰 쿼리셋입니다. 쿠폰마다 적립된 스탬프 수를 함께 셉니다.
+
+    스탬프 수는 JOIN + GROUP BY 대신 상관 서브쿼리(with_stamp_counts)로 세므로, 전체 이력을 묶지 않고
+    한 번에 가져오는 행들만 계산합니다.
+    """
+
+    queryset = (Coupon.objects
+                .filter(_date_range_filter('saved_at', since, until))
+                .with_stamp_counts()
+                .order_by('id'))
+    if place_id is not None:
+        queryset = queryset.filter(original_template__place_id=place_id)
+    return queryset
+
+
+def stamp_export_queryset(place_id: int | None = None, since: date | None = None,
+                          until: date | None = None) -> QuerySet:
+    """
+    내보낼 스탬프 쿼리셋입니다.
+    """
+
+    queryset = Stamp.objects.filter(_date_range_filter('created_at', since, until)).order_by('id')
+    if place_id is not None:
+        queryset = queryset.filter(coupon__original_template__place_id=place_id)
+    return queryset
+
+
+EXPORTS: dict[str, tuple[Callable[..., QuerySet], list[ExportColumn]]] = {
+    'coupons': (coupon_export_queryset, COUPON_COLUMNS),
+    'stamps': (stamp_export_queryset, STAMP_COLUMNS),
+}
+
+
+def iter_export_rows(queryset: QuerySet, columns: list[ExportColumn], chunk_size: int) -> Iterator[list]:
+    """
+    쿼리셋에서 열 값들을 `chunk_size`개씩 가져와 한 행(list)씩 돌려줍니다. 날짜/시간은 현지 시각 ISO 8601 문자열입니다.
+
+    `.iterator(chunk_size)`는 MySQL 드라이버가 결과 전체를 클라이언트에 받아 두므로 메모리를 아끼지 못합니다.
+    대신 id 순서로 `id > 마지막 id`인 행을 `chunk_size`개씩 조회합니다(keyset pagination). 열에는 `id`가 있어야 합니다.
+    """
+
+    tz = get_current_timezone()  # 행마다 현재 타임존을 찾지 않도록 한 번만 가져옵니다.
+    lookups = [column.lookup for column in columns]
+    id_index = lookups.index('id')
+    datetime_indexes = [i for i, column in enumerate(columns) if column.is_datetime]
+    queryset = queryset.order_by('id').values_list(*lookups)
+    last_id = None
+
+    while True:
+        chunk = queryset if last_id is None else queryset.filter(id__gt=last_id)
+        rows = list(chunk[:chunk_size])
+        for row in rows:
+            row = list(row)
+            for i in datetime_indexes:
+                if row[i] is not None:
+                    row[i] = row[i].astimezone(tz).isoformat()
+            yield row
+        if len(rows) < chunk_size:
+            break
+        last_id = rows[-1][id_index]
+
+
+# ---- 형식별 직렬화 ----
+class _Echo:
+    """
+    csv.writer가 쓴 문자열을 그대로 돌려주는 파일 흉내 객체입니다. 한 줄씩 만들어 바로 내보낼 수 있습니다.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_csv_lines(rows: Iterable[list], columns: list[ExportColumn]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow([column.name for column in columns])
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_ndjson_lines(rows: Iterable[list], columns: list[ExportColumn]) -> Iterator[str]:
+    names = [column.name for column in columns]
+    for row in rows:
+        yield json.dumps(dict(zip(names, row)), ensure_ascii=False) + '\n'
+
+
+OUTPUTS: dict[str, tuple[Callable[[Iterable, list[ExportColumn]], Iterator[str]], str]] = {
+    'csv': (iter_csv_lines, 'text/csv; charset=utf-8'),
+    'ndjson': (iter_ndjson_lines, 'application/x-ndjson; charset=utf-8'),
+}
+
+
+def _buffered(lines: Iterable[str], buffer_size: int) -> Iterator[bytes]:
+    """
+    줄들을 모아서 대략 `buffer_size` 바이트씩 내보냅니다. 줄마다 내보내면 응답 쓰기 호출이 너무 많아집니다.
+    """
+
+    buffer, size = [], 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= buffer_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+def stream_export(dataset: str, output: str, place_id: int | None = None, since: date | None = None,
+                  until: date | None = None, chunk_size: int = EXPORT_CHUNK_SIZE,
+                  buffer_size: int = EXPORT_BUFFER_SIZE) -> Iterator[bytes]:
+    """
+    데이터(coupons, stamps)를 형식(csv, ndjson)에 맞게 직렬화한 바이트 조각들을 만듭니다.
+
+    행을 `chunk_size`개씩만 가져오므로(iter_export_rows), 행 수와 관계없이 메모리 사용량이 일정합니다.
+    관계는 모두 조각마다 한 쿼리에서 조인합니다.
+    """
+
+    make_queryset, columns = EXPORTS[dataset]
+    serialize, _ = OUTPUTS[output]
+    rows = iter_export_rows(make_queryset(place_id, since, until), columns, chunk_size)
+    return _buffered(serialize(rows, columns), buffer_size)
@@ -0,0 +1,186 @@
+"""
+자주 호출되는 조회 응답(쿠폰 목록, 즐겨찾기 목록, 쿠폰 템플릿 목록)을 위한 가벼운 직렬화 경로입니다.
+
+`ModelSerializer`는 항목마다 필드 객체를 순회하고, `SerializerMethodField`마다 메소드를 호출하고,
+중첩된 시리얼라이저(가게, 리워드 정보)를 새로 만들기 때문에 목록이 길어지면 CPU 시간의 대부분을 차지합니다.
+여기서는 쿼리셋을 `.values()`로 필요한 컬럼만 딕셔너리 행으로 가져온 후, 미리 만들어 둔 필드 계획(plan)으로
+응답 딕셔너리를 만듭니다.
+
+- 필드 변환은 원래 시리얼라이저의 필드 객체(`to_representation`)를 그대로 사용하므로, 결과 JSON은 기존 시리얼라이저와
+  바이트 단위로 같습니다. (키 순서 포함, tests/fastpathtests.py에서 확인)
+- 뷰에서는 `FastListMixin`의 `fast_serializer`로 켜고 끕니다. settings의 `FAST_READ_SERIALIZERS = False`로 모두 끌 수 있습니다.
+"""
+
+from typing import Callable, Iterable
+
+from couponbook.images.utils import place_image_url, place_thumbnail_url
+from couponbook.models import Coupon, Stamp, subquery_count
+from couponbook.serializers import (FavoriteCouponListResponseSerializer,
+                                    PlaceDetailResponseSerializer,
+                                    RewardsInfoDetailResponseSerializer)
+from django.conf import settings
+from django.db.models import OuterRef, QuerySet
+from django.utils.timezone import now
+from rest_framework.response import Response
+from utils.url_templates import url_template
+
+
+def _plan(serializer_class, names: Iterable[str]) -> list[tuple[str, Callable]]:
+    """
+    시리얼라이저의 필드 객체에서 (필드 이름, 변환 함수) 목록을 만듭니다.
+    """
+    fields = serializer_class().fields
+    return [(name, fields[name].to_representation) for name in names]
+
+
+# 가게 정보 (PlaceDetailResponseSerializer와 같은 순서)
+PLACE_OUTPUT = ['image_url', 'thumbnail_url', 'name', 'address', 'opens_at', 'closes_at', 'last_order', 'tel', 'lat',
+                'lng']
+PLACE_PLAN = _plan(PlaceDetailResponseSerializer,
+                   [name for name in PLACE_OUTPUT if name not in ('address', 'image_url', 'thumbnail_url')])
+PLACE_LOOKUPS = [name for name, _ in PLACE_PLAN] + [
+    'image_url', 'thumbnails', 'address_rest', 'address_district__province', 'address_district__city', 'address_district__district',
+]
+
+# 리워드 정보 (RewardsInfoDetailResponseSerializer와 같은 순서)
+REWARD_PLAN = _plan(RewardsInfoDetailResponseSerializer, ['amount', 'reward'])
+REWARD_LOOKUPS = ['reward_info__id'] + [f'reward_info__{name}' for name, _ in REWARD_PLAN]
+
+
+def build_place(row: dict, prefix: str) -> dict:
+    """
+    `.values()` 행에서 `PlaceDetailResponseSerializer(place).data`와 같은 딕셔너리를 만듭니다.
+    """
+    values = {}
+    for name, to_representation in PLACE_PLAN:
+        value = row[prefix + name]
+        values[name] = None if value is None else to_representation(value)
+    values['image_url'] = place_image_url(row[prefix + 'image_url'], row[prefix + 'thumbnails'])
+    values['thumbnail_url'] = place_thumbnail_url(row[prefix + 'image_url'], row[prefix + 'thumbnails'])
+    values['address'] = (f"{row[prefix + 'address_district__province']} {row[prefix + 'address_district__city']} "
+                         f"{row[prefix + 'address_district__district']} {row[prefix + 'address_rest']}")
+    return {name: values[name] for name in PLACE_OUTPUT}
+
+
+def build_reward(row: dict, prefix: str) -> dict | None:
+    """
+    `.values()` 행에서 `RewardsInfoDetailResponseSerializer(reward_info).data`와 같은 딕셔너리를 만듭니다.
+    리워드 정보가 없으면 None입니다.
+    """
+    if row[prefix + 'reward_info__id'] is None:
+        return None
+    return {name: to_representation(row[f'{prefix}reward_info__{name}'])
+            for name, to_representation in REWARD_PLAN}
+
+
+# ---- 쿠폰 목록 (CouponListResponseSerializer) ----
+# 스탬프 수(stamp_counts)는 어노테이션이라 관계 이름(prefix)을 붙일 수 없으므로 따로 가져옵니다.
+COUPON_CARD_LOOKUPS = [
+    'id', 'status', 'original_template__valid_until',
+    *(f'original_template__place__{lookup}' for lookup in PLACE_LOOKUPS),
+    *(f'original_template__{lookup}' for lookup in REWARD_LOOKUPS),
+]
+COUPON_LOOKUPS = ['stamp_counts', *COUPON_CARD_LOOKUPS]
+
+
+def build_coupon(row: dict, prefix: str, stamp_counts: int, coupon_url: Callable, current) -> dict:
+    """
+    `.values()` 행에서 `CouponListResponseSerializer(coupon).data`와 같은 딕셔너리를 만듭니다.
+    """
+    template_prefix = f'{prefix}original_template__'
+    reward_info = build_reward(row, template_prefix)
+    valid_until = row[f'{template_prefix}valid_until']
+    return {
+        'id': row[f'{prefix}id'],
+        'coupon_url': coupon_url(row[f'{prefix}id']),
+        'place': build_place(row, f'{template_prefix}place__'),
+        'reward_info': reward_info,
+        'current_stamps': stamp_counts,
+        'days_remaining': (valid_until - current).days if valid_until else None,
+        'is_completed': None if reward_info is None else reward_info['amount'] == stamp_counts,
+        'is_expired': row[f'{prefix}status'] == Coupon.Status.EXPIRED,
+    }
+
+
+def serialize_coupon_list(queryset: QuerySet, request) -> list[dict]:
+    """
+    `Coupon.objects.with_card()` 쿼리셋을 `CouponListResponseSerializer(many=True).data`와 같은 리스트로 직렬화합니다.
+    """
+    current = now()
+    coupon_url = url_template(request, 'couponbook:coupon-detail', 'coupon_id')
+    return [build_coupon(row, '', row['stamp_counts'], coupon_url, current)
+            for row in queryset.values(*COUPON_LOOKUPS)]
+
+
+# ---- 즐겨찾기 목록 (FavoriteCouponListResponseSerializer) ----
+FAVORITE_PLAN = _plan(FavoriteCouponListResponseSerializer, ['added_at'])
+FAVORITE_LOOKUPS = ['id', 'added_at', 'coupon_stamp_counts', *(f'coupon__{lookup}' for lookup in COUPON_CARD_LOOKUPS)]
+
+
+def serialize_favorite_coupon_list(queryset: QuerySet, request) -> list[dict]:
+    """
+    즐겨찾기 쿼리셋을 `FavoriteCouponListResponseSerializer(many=True).data`와 같은 리스트로 직렬화합니다.
+
+    기존 시리얼라이저용 prefetch(쿠폰 카드) 대신 쿠폰, 가게, 리워드 정보를 조인하고 스탬프 수를 어노테이션해서 쿼리 한 번으로 가져옵니다.
+    """
+    current = now()
+    coupon_url = url_template(request, 'couponbook:coupon-detail', 'coupon_id')
+    rows = (queryset.prefetch_related(None)
+            .annotate(coupon_stamp_counts=subquery_count(Stamp.objects.filter(coupon=OuterRef('coupon_id')), 'coupon'))
+            .values(*FAVORITE_LOOKUPS))
+    data = []
+    for row in rows:
+        item = {'id': row['id']}
+        for name, to_representation in FAVORITE_PLAN:
+            item[name] = None if row[name] is None else to_representation(row[name])
+        item['coupon'] = build_coupon(row, 'coupon__', row['coupon_stamp_counts'], coupon_url, current)
+        data.append(item)
+    return data
+
+
+# ---- 쿠폰 템플릿 목록 (CouponTemplateListSerializer) ----
+TEMPLATE_LOOKUPS = [
+    'id', 'n_remaining', 'is_owned',
+    *(f'place__{lookup}' for lookup in PLACE_LOOKUPS),
+    *REWARD_LOOKUPS,
+]
+
+
+def serialize_coupon_template_list(queryset: QuerySet, request) -> list[dict]:
+    """
+    `with_remaining().with_owned_by()`를 적용한 쿠폰 템플릿 쿼리셋을
+    `CouponTemplateListSerializer(many=True).data`와 같은 리스트로 직렬화합니다.
+    """
+    coupon_template_url = url_template(request, 'couponbook:coupon-template-detail', 'coupon_template_id')
+    return [
+        {
+            'id': row['id'],
+            'coupon_template_url': coupon_template_url(row['id']),
+            'place': build_place(row, 'place__'),
+            'reward_info': build_reward(row, ''),
+            'current_n_remaining': row['n_remaining'],
+            'already_owned': row['is_owned'],
+        }
+        for row in queryset.values(*TEMPLATE_LOOKUPS)
+    ]
+
+
+class FastListMixin:
+    """
+    목록 조회(GET)를 `fast_serializer` 함수로 직렬화하는 믹스인입니다. `ListAPIView` 계열 뷰에 섞어서 사용합니다.
+
+    `fast_serializer = staticmethod(serialize_coupon_list)`처럼 지정합니다.
+    `fast_serializer = None`이거나 settings의 `FAST_READ_SERIALIZERS`가 거짓이면 기존 시리얼라이저를 사용합니다.
+    API 문서(drf-spectacular)는 기존 시리얼라이저를 그대로 사용합니다.
+    """
+
+    fast_serializer: Callable[[QuerySet, object], list[dict]] | None = None
+
+    def use_fast_serializer(self) -> bool:
+        return self.fast_serializer is not None and getattr(settings, 'FAST_READ_SERIALIZERS', True)
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_fast_serializer():
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(self.fast_serializer(queryset, request))
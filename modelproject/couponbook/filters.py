@@ -77,11 +77,8 @@ class CouponFilter(filters.FilterSet):
 
         if value is None:
             return queryset
-        now_dt = timezone.now()
-        expired = Q(original_template__valid_until__isnull=False) & Q(
-            original_template__valid_until__lt=now_dt
-        )
-        return queryset.filter(expired) if value else queryset
+        # 만료 여부는 sweep_coupon_expiry 명령어가 미리 계산해둔 상태(인덱스)로 판단합니다.
+        return queryset.filter(status=Coupon.Status.EXPIRED) if value else queryset
     
     class Meta:
         model = Coupon
@@ -142,9 +139,10 @@ class CouponTemplateFilter(filters.FilterSet):
         if not user or not user.is_authenticated:
             return queryset.none() if value else queryset
 
-        # Coupon.couponbook(user) -> Coupon.original_template(=CouponTemplate) 경로
-        owned_qs = queryset.filter(coupons__couponbook__user=user).distinct()
-        return owned_qs if value else queryset
+        # 보유 여부는 CouponTemplate.objects.with_owned_by()의 EXISTS 서브쿼리로 판단합니다. (조인/distinct 불필요)
+        if "is_owned" not in queryset.query.annotations:
+            queryset = queryset.with_owned_by(user)
+        return queryset.filter(is_owned=True) if value else queryset
     
     class Meta:
         model = CouponTemplate
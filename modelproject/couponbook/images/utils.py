@@ -0,0 +1,212 @@
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Callable, Iterable
+from uuid import uuid4
+
+from couponbook.models import Place, PlaceImageUpload
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, default_storage
+from django.db import transaction
+from django.utils.timezone import now
+
+# 올릴 수 있는 이미지 형식 (Content-Type -> 확장자)
+CONTENT_TYPES = {'image/jpeg': 'jpg', 'image/png': 'png', 'image/webp': 'webp'}
+# Place.thumbnails에서 원본 이미지의 스토리지 이름을 담는 키
+ORIGINAL_KEY = 'original'
+
+
+class DirectUploadUnavailable(Exception):
+    """
+    스토리지가 presigned POST를 지원하지 않을 때(S3 스토리지가 아닐 때) 발생합니다.
+    """
+
+
+@dataclass
+class PresignedPost:
+    url: str  # 업로드할 주소
+    fields: dict[str, str]  # multipart/form-data에 파일보다 먼저 넣어야 하는 필드
+    expires_in: int  # 유효 시간(초)
+
+
+@dataclass
+class ThumbnailResult:
+    processed: int = 0  # 썸네일을 만든 이미지 수
+    failed: int = 0  # 이미지가 아니거나 읽을 수 없어서 실패한 이미지 수
+
+
+# ---- 직접 업로드 ----
+def presigned_post(storage: Storage, name: str, content_type: str, max_bytes: int, expires_in: int) -> PresignedPost:
+    """
+    `name`으로 `content_type` 파일을 최대 `max_bytes`까지 S3에 직접 올릴 수 있는 presigned POST를 만듭니다.
+    Content-Type과 파일 크기는 S3가 정책(policy)으로 검사합니다.
+    """
+
+    if not (hasattr(storage, 'bucket_name') and hasattr(storage, 'connection')):
+        raise DirectUploadUnavailable("S3 스토리지에서만 이미지를 직접 올릴 수 있습니다.")
+
+    post = storage.connection.meta.client.generate_presigned_post(
+        storage.bucket_name,
+        storage._normalize_name(name),
+        Fields={'Content-Type': content_type},
+        Conditions=[{'Content-Type': content_type}, ['content-length-range', 1, max_bytes]],
+        ExpiresIn=expires_in,
+    )
+    return PresignedPost(post['url'], post['fields'], expires_in)
+
+
+def start_upload(place_id: int, content_type: str,
+                 storage: Storage | None = None) -> tuple[PlaceImageUpload, PresignedPost]:
+    """
+    가게 이미지 원본을 올릴 presigned POST를 만들고, 업로드 대기 상태의 `PlaceImageUpload`를 기록합니다.
+    """
+
+    storage = storage or default_storage
+    name = f"places/{place_id}/originals/{uuid4().hex}.{CONTENT_TYPES[content_type]}"
+    post = presigned_post(storage, name, content_type,
+                          settings.PLACE_IMAGE_MAX_BYTES, settings.PLACE_IMAGE_UPLOAD_EXPIRE)
+    upload = PlaceImageUpload.objects.create(place_id=place_id, name=name, content_type=content_type)
+    return upload, post
+
+
+def complete_upload(upload: PlaceImageUpload, storage: Storage | None = None) -> bool:
+    """
+    클라이언트가 업로드를 마친 이미지를 썸네일 생성 대기 상태로 바꿉니다.
+    스토리지에 원본이 없으면 False를 반환합니다. 이미 완료한 업로드는 그대로 둡니다.
+    """
+
+    storage = storage or default_storage
+    if upload.status != PlaceImageUpload.Status.PENDING:
+        return True
+    if not storage.exists(upload.name):
+        return False
+
+    PlaceImageUpload.objects.filter(id=upload.id, status=PlaceImageUpload.Status.PENDING).update(
+        status=PlaceImageUpload.Status.UPLOADED)
+    upload.status = PlaceImageUpload.Status.UPLOADED
+    return True
+
+
+# ---- 썸네일 ----
+def make_thumbnails(data: bytes, sizes: Iterable[int], quality: int) -> dict[int, bytes]:
+    """
+    이미지를 긴 변이 `sizes`(px) 이하가 되도록 줄인 WebP 썸네일들을 만듭니다. 원본보다 크게 늘리지는 않습니다.
+
+    Pillow가 필요합니다. 이미지가 아니거나 깨진 경우 `ValueError`가 발생합니다.
+    """
+
+    from PIL import Image, ImageOps
+
+    try:
+        with Image.open(BytesIO(data)) as image:
+            if image.format not in ('JPEG', 'PNG', 'WEBP'):
+                raise ValueError(f"지원하지 않는 이미지 형식입니다: {image.format}")
+            image = ImageOps.exif_transpose(image)  # 휴대폰 사진의 회전 정보를 반영
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if image.has_transparency_data else 'RGB')
+
+            thumbnails = {}
+            for size in sizes:
+                thumbnail = image.copy()
+                thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS)
+                output = BytesIO()
+                thumbnail.save(output, 'WEBP', quality=quality)
+                thumbnails[size] = output.getvalue()
+            return thumbnails
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError(f"이미지를 읽을 수 없습니다: {e}") from e
+
+
+def process_upload(upload: PlaceImageUpload, storage: Storage, sizes: Iterable[int], quality: int) -> dict[str, str]:
+    """
+    업로드된 원본으로 썸네일을 만들어 스토리지에 저장하고, 크기(문자열) -> 스토리지 이름 딕셔너리를 반환합니다.
+    중간에 저장이 실패하면 그때까지 저장한 썸네일을 지우고 예외를 그대로 전달합니다.
+    """
+
+    with storage.open(upload.name, 'rb') as f:
+        data = f.read()
+
+    thumbnails = {}
+    try:
+        for size, content in make_thumbnails(data, sizes, quality).items():
+            thumbnails[str(size)] = storage.save(f"places/{upload.place_id}/thumbnails/{upload.id}-{size}.webp",
+                                                 ContentFile(content))
+    except Exception:
+        delete_files(storage, thumbnails.values())
+        raise
+    return thumbnails
+
+
+def delete_files(storage: Storage, names: Iterable[str]):
+    """
+    정리용으로 파일들을 지웁니다. 지우다가 실패해도 원래 작업의 예외를 가리지 않도록 무시합니다.
+    """
+    for name in names:
+        try:
+            storage.delete(name)
+        except Exception:
+            pass
+
+
+def generate_thumbnails(batch_size: int = 20, storage: Storage | None = None,
+                        on_item: Callable[[PlaceImageUpload], None] | None = None) -> ThumbnailResult:
+    """
+    썸네일 생성 대기 중인 업로드를 id 순서로 처리합니다. generate_thumbnails 명령어가 주기적으로 호출합니다.
+
+    썸네일을 만들면 가게의 `image_url`(원본의 스토리지 이름)과 `thumbnails`를 한 번에 바꾸고 이전 썸네일 파일을 지웁니다.
+    원본의 이름은 `thumbnails['original']`에도 넣어서, 응답에서 `image_url`을 스토리지 URL로 바꿀 수 있게 합니다. (`place_image_url`)
+    이미지가 아니거나 원본이 없으면 실패로 기록하고, 스토리지 오류는 그대로 전달해서 다음 실행 때 다시 시도합니다.
+    """
+
+    storage = storage or default_storage
+    sizes, quality = settings.PLACE_THUMBNAIL_SIZES, settings.PLACE_THUMBNAIL_QUALITY
+    result = ThumbnailResult()
+
+    pending = PlaceImageUpload.objects.filter(status=PlaceImageUpload.Status.UPLOADED).order_by('id')
+    while uploads := list(pending[:batch_size]):
+        for upload in uploads:
+            try:
+                thumbnails = process_upload(upload, storage, sizes, quality)
+            except (ValueError, FileNotFoundError) as e:
+                PlaceImageUpload.objects.filter(id=upload.id).update(
+                    status=PlaceImageUpload.Status.FAILED, error=str(e)[:255], processed_at=now())
+                result.failed += 1
+                continue
+
+            thumbnails[ORIGINAL_KEY] = upload.name
+            try:
+                with transaction.atomic():
+                    # Place.save()는 위도/경도를 다시 계산하므로 update()로 바꿉니다.
+                    place = Place.objects.select_for_update().only('thumbnails').get(id=upload.place_id)
+                    previous = place.thumbnails or {}
+                    Place.objects.filter(id=upload.place_id).update(image_url=upload.name, thumbnails=thumbnails)
+                    PlaceImageUpload.objects.filter(id=upload.id).update(
+                        status=PlaceImageUpload.Status.READY, processed_at=now())
+            except Exception:
+                delete_files(storage, [name for size, name in thumbnails.items() if size != ORIGINAL_KEY])
+                raise
+            # 이전 원본은 업로드 기록(PlaceImageUpload)이 가리키므로 남겨 둡니다.
+            delete_files(storage, {name for size, name in previous.items() if size != ORIGINAL_KEY}
+                         - set(thumbnails.values()))
+
+            result.processed += 1
+            if on_item:
+                on_item(upload)
+    return result
+
+
+def place_image_url(image_url: str, thumbnails: dict | None) -> str:
+    """
+    응답에 쓸 가게 이미지 URL입니다. 업로드한 원본이면 스토리지 URL로 바꾸고, 아니면 `image_url`을 그대로 사용합니다.
+    """
+    if thumbnails and image_url and thumbnails.get(ORIGINAL_KEY) == image_url:
+        return default_storage.url(image_url)
+    return image_url
+
+
+def place_thumbnail_url(image_url: str, thumbnails: dict | None) -> str:
+    """
+    목록 응답에 쓸 가게 썸네일 URL입니다. 썸네일이 없으면 가게 이미지 URL을 그대로 사용합니다.
+    """
+    name = thumbnails.get(str(settings.PLACE_THUMBNAIL_LIST_SIZE)) if thumbnails else None
+    return default_storage.url(name) if name else place_image_url(image_url, thumbnails)
@@ -1,7 +1,9 @@
 from decimal import Decimal
 
 import requests
+from asgiref.sync import sync_to_async
 from decouple import config
+from utils.instrumentation import timed
 
 
 class KakaoMapPlace:
@@ -61,10 +63,19 @@ class KakaoMapAPIClient:
         """
         payload = {'query': keyword, **kwargs}
         header = self.generate_auth_header()
-        r = requests.get('https://dapi.kakao.com/v2/local/search/keyword', params=payload, headers=header)
+        with timed('kakao'):
+            r = requests.get('https://dapi.kakao.com/v2/local/search/keyword', params=payload, headers=header)
 
         documents: dict = r.json()['documents']
         if documents:
             return KakaoMapPlace(documents[0])
         
-        return None
\ No newline at end of file
+        return None
+
+    async def afind_place_by_keyword(self, keyword: str, **kwargs) -> KakaoMapPlace | None:
+        """
+        `find_place_by_keyword`의 비동기 버전입니다.
+
+        HTTP 요청은 ORM과 무관하므로 thread_sensitive=False로 별도 스레드에서 실행하여, 응답을 기다리는 동안 이벤트 루프를 막지 않습니다.
+        """
+        return await sync_to_async(self.find_place_by_keyword, thread_sensitive=False)(keyword, **kwargs)
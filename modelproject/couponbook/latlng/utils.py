@@ -1,7 +1,12 @@
+import logging
 from decimal import Decimal
 
+from utils.logs import log_event
+
 from .models import KakaoMapAPIClient, KakaoMapPlace
 
+logger = logging.getLogger(__name__)
+
 
 def get_place_latlng(place_name: str) -> tuple([Decimal, Decimal]):
     """
@@ -13,4 +18,17 @@ def get_place_latlng(place_name: str) -> tuple([Decimal, Decimal]):
     if place:
         return place.get_latlng()
     
-    print(f"장소의 검색 결과가 없습니다. ({place_name})")
\ No newline at end of file
+    log_event(logger, 'place_search_empty', f"장소의 검색 결과가 없습니다. ({place_name})", keyword=place_name)
+
+
+async def aget_place_latlng(place_name: str) -> tuple([Decimal, Decimal]):
+    """
+    `get_place_latlng`의 비동기 버전입니다. 카카오맵 API의 응답을 기다리는 동안 이벤트 루프를 막지 않습니다.
+    """
+    client = KakaoMapAPIClient()
+    place: KakaoMapPlace | None = await client.afind_place_by_keyword(place_name)
+
+    if place:
+        return place.get_latlng()
+
+    log_event(logger, 'place_search_empty', f"장소의 검색 결과가 없습니다. ({place_name})", keyword=place_name)
@@ -0,0 +1,88 @@
+import json
+import threading
+
+from couponbook.benchmark.runner import (SCENARIOS, BenchmarkContext,
+                                         check_thresholds, count_queries,
+                                         host_of, parse_thresholds, run_load)
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import (ThreadedWSGIServer,
+                                          WSGIRequestHandler,
+                                          get_internal_wsgi_application)
+
+
+class QuietWSGIRequestHandler(WSGIRequestHandler):
+    """요청마다 출력되는 접근 로그를 끕니다."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = ("시나리오별로 동시 요청을 보내 처리량, 지연 시간(p50/p95/p99), 에러율, 요청당 쿼리 수를 측정합니다. "
+            "seed_benchmark_data 명령어로 데이터를 먼저 생성해야 합니다.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000',
+                            help="부하를 줄 서버 주소 (--serve를 사용하면 무시됩니다.)")
+        parser.add_argument('--serve', action='store_true',
+                            help="벤치마크 동안 이 프로세스에서 WSGI 서버를 띄워 측정합니다.")
+        parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                            help="실행할 시나리오 (여러 번 지정 가능, 기본값: 전체)")
+        parser.add_argument('--requests', type=int, default=200, help="시나리오당 요청 수")
+        parser.add_argument('--concurrency', type=int, default=10, help="동시 요청 수")
+        parser.add_argument('--timeout', type=float, default=30.0, help="요청 타임아웃(초)")
+        parser.add_argument('--accept-encoding', help="요청에 보낼 Accept-Encoding (예: gzip). 응답당 전송량은 압축된 크기로 셉니다.")
+        parser.add_argument('--threshold', action='append', default=[],
+                            help="'시나리오.지표=값' 형식의 임계값 (예: catalogue.p95=200). "
+                                 "처리량(rps, mbps, rows_per_s)은 최솟값, 나머지는 최댓값입니다. 넘으면 실패로 종료합니다.")
+        parser.add_argument('--no-queries', action='store_true', help="요청당 쿼리 수를 측정하지 않습니다.")
+        parser.add_argument('--json', dest='json_path', help="결과를 JSON 파일로 저장할 경로")
+
+    def handle(self, *args, **options):
+        try:
+            thresholds = parse_thresholds(options['threshold'])
+            ctx = BenchmarkContext.load()
+        except ValueError as e:
+            raise CommandError(e)
+
+        server = None
+        base_url = options['base_url'].rstrip('/')
+        if options['serve']:
+            server = ThreadedWSGIServer(('127.0.0.1', 0), QuietWSGIRequestHandler)
+            server.set_app(get_internal_wsgi_application())
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            base_url = f'http://127.0.0.1:{server.server_port}'
+
+        summaries = {}
+        try:
+            for name in options['scenario'] or SCENARIOS:
+                result = run_load(base_url, name, ctx, options['requests'], options['concurrency'], options['timeout'],
+                                  options['accept_encoding'])
+                if not options['no_queries']:
+                    result.queries = count_queries(name, ctx, host=host_of(base_url))
+                summaries[name] = result.summary()
+                self.stdout.write(self.format_summary(name, summaries[name]))
+        except RuntimeError as e:
+            raise CommandError(e)
+        finally:
+            if server:
+                server.shutdown()
+                server.server_close()
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as f:
+                json.dump(summaries, f, ensure_ascii=False, indent=2)
+
+        failures = check_thresholds(summaries, thresholds)
+        if failures:
+            raise CommandError("임계값을 넘은 항목이 있습니다:\n" + "\n".join(failures))
+        self.stdout.write(self.style.SUCCESS("벤치마크 완료"))
+
+    def format_summary(self, name: str, summary: dict) -> str:
+        queries = '-' if summary['queries'] is None else summary['queries']
+        line = (f"{name:<14} {summary['requests']:>6} req  {summary['rps']:>8.1f} req/s  "
+                f"p50 {summary['p50']:>7.1f}ms  p95 {summary['p95']:>7.1f}ms  p99 {summary['p99']:>7.1f}ms  "
+                f"error {summary['error_rate']:>6.1%}  queries {queries}  {summary['kb_per_response']:>8.1f} KB/res")
+        if name.startswith('export'):
+            line += f"  {summary['mbps']:>7.1f} MB/s  {summary['rows_per_s']:>9.0f} rows/s"
+        return line
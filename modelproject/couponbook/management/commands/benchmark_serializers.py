@@ -0,0 +1,27 @@
+from accounts.models import User
+from couponbook.benchmark.serialization import measure_serialization
+from django.core.management.base import BaseCommand, CommandError
+from utils.renderers import is_fast_json_available
+
+
+class Command(BaseCommand):
+    help = ("쿠폰 목록, 즐겨찾기 목록, 쿠폰 템플릿 목록 응답의 항목당 직렬화 비용을 기존 시리얼라이저와 가벼운 직렬화 경로로 비교합니다. "
+            "JSON 렌더링(JSONRenderer/FastJSONRenderer), 영업 시간 포맷(TimeField/CachedTimeField), "
+            "상세 조회 URL(reverse/url_template) 비용도 비교합니다. "
+            "seed_benchmark_data 명령어로 데이터를 먼저 생성해 두면 좋습니다.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=500, help="측정에 사용할 최대 항목 수")
+        parser.add_argument('--repeat', type=int, default=5, help="반복 횟수 (가장 빠른 값을 사용합니다.)")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(is_staff=False).order_by('id').first()
+        if user is None:
+            raise CommandError("유저가 없습니다. 벤치마크 데이터를 먼저 생성해 주세요.")
+
+        results = measure_serialization(user, options['items'], options['repeat'])
+        for name, cost in results.items():
+            self.stdout.write(f"{name:<22} {cost.items:>5} items  before {cost.before_us:>8.1f}us/item  "
+                              f"after {cost.after_us:>7.1f}us/item  x{cost.speedup:.1f}")
+        if not is_fast_json_available():
+            self.stdout.write("orjson이 설치되어 있지 않아서 FastJSONRenderer는 JSONRenderer와 같게 동작합니다.")
@@ -0,0 +1,22 @@
+from importlib.util import find_spec
+
+from couponbook.images.utils import generate_thumbnails
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = ("업로드를 마친 가게 이미지의 WebP 썸네일을 만들고 가게 정보에 연결합니다. Pillow가 필요합니다. "
+            "docker-compose의 thumbnailer 서비스가 주기적으로 실행합니다.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=20, help="한 번에 조회할 업로드 수")
+
+    def handle(self, *args, **options):
+        if find_spec('PIL') is None:
+            raise CommandError("썸네일을 만들려면 Pillow가 필요합니다. (pip install pillow)")
+
+        result = generate_thumbnails(
+            batch_size=options['batch_size'],
+            on_item=lambda upload: self.stdout.write(f"썸네일 생성: 가게 {upload.place_id}, 업로드 {upload.id}"),
+        )
+        self.stdout.write(self.style.SUCCESS(f"썸네일 생성 {result.processed}개, 실패 {result.failed}개"))
@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+from couponbook.models import Place
+from couponbook.receipts.utils import (DEFAULT_BATCH_SIZE, ingest_receipts,
+                                       iter_receipt_numbers_from_file)
+from django.core.management.base import BaseCommand, CommandError
+
+FORMATS_BY_SUFFIX = {'.json': 'json', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.csv': 'csv'}
+
+
+class Command(BaseCommand):
+    help = "파일(JSON 배열, CSV, NDJSON)의 영수증 번호들을 가게의 영수증으로 대량 등록합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', help="영수증 번호 파일 경로. '-'이면 표준 입력에서 읽습니다.")
+        parser.add_argument('--place', type=int, required=True, help="영수증을 발행한 가게 id")
+        parser.add_argument('--format', choices=sorted(set(FORMATS_BY_SUFFIX.values())),
+                            help="파일 형식. 지정하지 않으면 확장자로 판단하고, 표준 입력은 ndjson으로 읽습니다.")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="bulk_create 배치 크기")
+        parser.add_argument('--verbose-results', action='store_true',
+                            help="등록되지 않은 영수증 번호와 사유를 출력합니다.")
+
+    def handle(self, *args, **options):
+        place_id = options['place']
+        if not Place.objects.filter(id=place_id).exists():
+            raise CommandError(f"가게가 없습니다: {place_id}")
+
+        path = options['file']
+        file_format = options['format'] or FORMATS_BY_SUFFIX.get(Path(path).suffix.lower(), 'ndjson')
+
+        try:
+            if path == '-':
+                result = self._ingest(sys.stdin, file_format, place_id, options)
+            else:
+                with open(path, encoding='utf-8-sig', newline='') as file:
+                    result = self._ingest(file, file_format, place_id, options)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"영수증 파일을 읽을 수 없습니다: {e}") from e
+
+        if options['verbose_results']:
+            for item in result.results:
+                if item['status'] != 'created':
+                    self.stdout.write(f"{item['receipt_number']}\t{item['status']}")
+        self.stdout.write(self.style.SUCCESS(
+            "영수증 등록 완료: " + ", ".join(f"{name} {n}" for name, n in result.counts.items())
+        ))
+
+    def _ingest(self, file, file_format, place_id, options):
+        return ingest_receipts(iter_receipt_numbers_from_file(file, file_format), place_id,
+                               batch_size=options['batch_size'], keep_results=options['verbose_results'])
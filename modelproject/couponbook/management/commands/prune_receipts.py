@@ -0,0 +1,35 @@
+from couponbook.models import Receipt
+from couponbook.receipts.utils import get_receipt_prune_cutoff, prune_receipts
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = ("보관 기간(RECEIPT_TTL_DAYS)이 지났는데 스탬프가 적립되지 않은 영수증을 배치 단위로 삭제합니다. "
+            "docker-compose의 receipt-pruner 서비스가 하루에 한 번 실행합니다.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.RECEIPT_PRUNE_BATCH_SIZE,
+                            help="한 트랜잭션에서 삭제할 영수증 수")
+        parser.add_argument('--pause', type=float, default=0.0, help="배치 사이에 쉬는 시간(초)")
+        parser.add_argument('--archive', help="삭제한 영수증을 NDJSON으로 덧붙여 기록할 파일 경로")
+        parser.add_argument('--dry-run', action='store_true', help="삭제하지 않고 대상 영수증 수만 출력합니다.")
+
+    def handle(self, *args, **options):
+        cutoff = get_receipt_prune_cutoff()
+
+        if options['dry_run']:
+            count = Receipt.objects.filter(created_at__lt=cutoff, stamp__isnull=True).count()
+            self.stdout.write(f"{cutoff:%Y-%m-%d %H:%M} 이전에 등록된 미사용 영수증 {count}개가 삭제 대상입니다.")
+            return
+
+        def on_batch(count: int):
+            self.stdout.write(f"영수증 {count}개 삭제")
+
+        if options['archive']:
+            with open(options['archive'], 'a', encoding='utf-8') as archive:
+                deleted = prune_receipts(cutoff, options['batch_size'], archive, options['pause'], on_batch)
+        else:
+            deleted = prune_receipts(cutoff, options['batch_size'], pause=options['pause'], on_batch=on_batch)
+
+        self.stdout.write(self.style.SUCCESS(f"보관 기간이 지난 영수증 {deleted}개를 정리했습니다."))
@@ -0,0 +1,22 @@
+from datetime import date
+
+from couponbook.stats.utils import rebuild_daily_stats
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "쿠폰과 스탬프를 집계해서 쿠폰 템플릿의 일별 통계(TemplateDailyStats)를 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', type=date.fromisoformat, help="다시 만들 기간의 시작 날짜 (YYYY-MM-DD)")
+        parser.add_argument('--until', type=date.fromisoformat, help="다시 만들 기간의 끝 날짜 (YYYY-MM-DD, 포함)")
+        parser.add_argument('--template', type=int, action='append', dest='templates',
+                            help="다시 만들 쿠폰 템플릿 id. 여러 번 지정할 수 있습니다.")
+
+    def handle(self, *args, **options):
+        since, until = options['since'], options['until']
+        if since and until and since > until:
+            raise CommandError("시작 날짜가 끝 날짜보다 늦습니다.")
+
+        count = rebuild_daily_stats(since, until, options['templates'])
+        self.stdout.write(self.style.SUCCESS(f"쿠폰 템플릿 일별 통계 {count}행을 다시 만들었습니다."))
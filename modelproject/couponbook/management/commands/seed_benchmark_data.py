@@ -0,0 +1,42 @@
+from couponbook.benchmark.seed import SeedConfig, clear_dataset, seed_dataset
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "벤치마크용 대량 데이터(가게, 쿠폰 템플릿, 유저, 쿠폰, 스탬프, 영수증)를 생성합니다."
+
+    def add_arguments(self, parser):
+        defaults = SeedConfig()
+        parser.add_argument('--places', type=int, default=defaults.places, help="생성할 가게 수")
+        parser.add_argument('--templates-per-place', type=int, default=defaults.templates_per_place,
+                            help="가게당 쿠폰 템플릿 수")
+        parser.add_argument('--users', type=int, default=defaults.users, help="생성할 유저 수")
+        parser.add_argument('--coupons-per-user', type=int, default=defaults.coupons_per_user,
+                            help="유저당 쿠폰 수")
+        parser.add_argument('--stamps-per-coupon', type=int, default=defaults.stamps_per_coupon,
+                            help="쿠폰당 스탬프 수")
+        parser.add_argument('--spare-receipts', type=int, default=defaults.spare_receipts,
+                            help="스탬프 적립 시나리오에서 사용할 미사용 영수증 수")
+        parser.add_argument('--batch-size', type=int, default=defaults.batch_size, help="bulk_create 배치 크기")
+        parser.add_argument('--seed', type=int, default=defaults.random_seed, help="난수 시드")
+        parser.add_argument('--clear', action='store_true', help="기존 벤치마크 데이터를 삭제한 후 생성합니다.")
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            clear_dataset()
+            self.stdout.write("기존 벤치마크 데이터를 삭제했습니다.")
+
+        config = SeedConfig(
+            places=options['places'],
+            templates_per_place=options['templates_per_place'],
+            users=options['users'],
+            coupons_per_user=options['coupons_per_user'],
+            stamps_per_coupon=options['stamps_per_coupon'],
+            spare_receipts=options['spare_receipts'],
+            batch_size=options['batch_size'],
+            random_seed=options['seed'],
+        )
+        counts = seed_dataset(config, stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(
+            "벤치마크 데이터 생성 완료: " + ", ".join(f"{name} {n}" for name, n in counts.items())
+        ))
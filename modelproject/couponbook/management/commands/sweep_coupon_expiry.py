@@ -0,0 +1,28 @@
+from couponbook.expiry.utils import sweep_coupon_expiry
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = ("유효기간이 지난 쿠폰 템플릿을 비공개로, 쿠폰을 만료 상태로 바꾸고 만료가 임박한 쿠폰에 알림 시그널을 보냅니다. "
+            "docker-compose의 coupon-expiry-sweeper 서비스가 주기적으로 실행합니다.")
+
+    STEP_LABELS = {
+        'templates_closed': "비공개로 바꾼 쿠폰 템플릿",
+        'coupons_expired': "만료 처리한 쿠폰",
+        'templates_reopened': "유효기간이 연장되어 다시 게시한 쿠폰 템플릿",
+        'coupons_revived': "유효기간이 연장되어 되살린 쿠폰",
+        'coupons_notified': "만료 임박 알림을 보낸 쿠폰",
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.COUPON_EXPIRY_BATCH_SIZE,
+                            help="한 트랜잭션에서 갱신할 행 수")
+        parser.add_argument('--no-notify', action='store_true', help="만료 임박 알림을 보내지 않습니다.")
+
+    def handle(self, *args, **options):
+        def on_step(name: str, count: int):
+            self.stdout.write(f"{self.STEP_LABELS[name]}: {count}개")
+
+        sweep_coupon_expiry(batch_size=options['batch_size'], notify=not options['no_notify'], on_step=on_step)
+        self.stdout.write(self.style.SUCCESS("쿠폰 만료 처리를 완료했습니다."))
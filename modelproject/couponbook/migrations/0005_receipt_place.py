@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-19 03:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('couponbook', '0004_place_tags'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='receipt',
+            name='place',
+            field=models.ForeignKey(blank=True, help_text='영수증을 발행한 가게 id입니다. 관리자가 등록한 예전 영수증은 비어 있습니다.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='receipts', to='couponbook.place'),
+        ),
+    ]
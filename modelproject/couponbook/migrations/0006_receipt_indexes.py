@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-19 03:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('couponbook', '0005_receipt_place'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='receipt',
+            index=models.Index(fields=['place', 'receipt_number'], name='receipt_place_number_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='receipt',
+            index=models.Index(fields=['created_at'], name='receipt_created_at_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-19 03:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('couponbook', '0006_receipt_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TemplateDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='집계한 날짜입니다.')),
+                ('coupons_issued', models.PositiveIntegerField(default=0, help_text='이 날 발급(등록)된 쿠폰 수입니다.')),
+                ('stamps_earned', models.PositiveIntegerField(default=0, help_text='이 날 적립된 스탬프 수입니다.')),
+                ('completions', models.PositiveIntegerField(default=0, help_text='이 날 완성된 쿠폰 수입니다.')),
+                ('unique_customers', models.PositiveIntegerField(default=0, help_text='이 날 스탬프를 적립한 고객 수입니다.')),
+                ('template', models.ForeignKey(help_text='통계를 집계한 쿠폰 템플릿 id입니다.', on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='couponbook.coupontemplate')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('template', 'date'), name='unique_template_daily_stats')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 03:47
+
+from django.db import migrations, models
+from django.utils.timezone import now
+
+
+def mark_expired_coupons(apps, schema_editor):
+    """
+    이미 유효기간이 지난 쿠폰 템플릿의 쿠폰을 만료 상태로 표시합니다.
+    """
+    Coupon = apps.get_model('couponbook', 'Coupon')
+    Coupon.objects.filter(original_template__valid_until__lt=now()).update(status='EXPIRED')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('couponbook', '0007_templatedailystats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coupon',
+            name='expiry_notified_at',
+            field=models.DateTimeField(blank=True, help_text='만료 임박 알림을 보낸 날짜와 시간입니다. 알림은 한 번만 보냅니다.', null=True),
+        ),
+        migrations.AddField(
+            model_name='coupon',
+            name='status',
+            field=models.CharField(choices=[('ACTIVE', '사용 중'), ('EXPIRED', '만료')], db_index=True, default='ACTIVE', help_text='쿠폰의 상태입니다. 조회 시 만료 여부는 유효기간 대신 이 값으로 판단합니다.', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='coupontemplate',
+            index=models.Index(fields=['is_on', 'valid_until'], name='template_on_valid_until_idx'),
+        ),
+        migrations.RunPython(mark_expired_coupons, migrations.RunPython.noop),
+    ]
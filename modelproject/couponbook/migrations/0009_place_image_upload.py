@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('couponbook', '0008_coupon_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='thumbnails',
+            field=models.JSONField(blank=True, default=dict, help_text='업로드한 가게 이미지의 썸네일입니다. 크기(px) -> 스토리지 이름이며, generate_thumbnails 명령어가 채웁니다.'),
+        ),
+        migrations.CreateModel(
+            name='PlaceImageUpload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='원본 이미지의 스토리지 이름입니다.', max_length=255, unique=True)),
+                ('content_type', models.CharField(help_text='원본 이미지의 Content-Type입니다.', max_length=20)),
+                ('status', models.CharField(choices=[('pending', '업로드 대기'), ('uploaded', '썸네일 생성 대기'), ('ready', '완료'), ('failed', '실패')], db_index=True, default='pending', help_text='업로드와 썸네일 생성 상태입니다.', max_length=10)),
+                ('error', models.CharField(blank=True, default='', help_text='썸네일 생성에 실패한 이유입니다.', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='업로드 URL을 발급한 날짜와 시간입니다.')),
+                ('processed_at', models.DateTimeField(blank=True, help_text='썸네일 생성을 마친 날짜와 시간입니다.', null=True)),
+                ('place', models.ForeignKey(help_text='이미지를 올린 가게입니다.', on_delete=django.db.models.deletion.CASCADE, related_name='image_uploads', to='couponbook.place')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('couponbook', '0009_place_image_upload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coupontemplate',
+            name='expiry_closed_at',
+            field=models.DateTimeField(blank=True, help_text='유효기간이 지나 만료 처리에서 비공개로 바꾼 날짜와 시간입니다. 유효기간이 연장되면 다시 게시 중으로 바뀝니다.', null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 04:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_receipt_place(apps, schema_editor):
+    """
+    가게 정보가 없는 예전 영수증 중 스탬프가 적립된 영수증은 그 스탬프가 적립된 쿠폰의 가게로 채웁니다.
+    적립되지 않은 영수증은 어느 가게의 것인지 알 수 없으므로 그대로 두고, 더 이상 적립할 수 없게 합니다.
+    (보관 기간이 지나면 prune_receipts가 정리합니다.)
+    """
+    Receipt = apps.get_model('couponbook', 'Receipt')
+    Stamp = apps.get_model('couponbook', 'Stamp')
+    place_of_stamp = Stamp.objects.filter(receipt_id=OuterRef('pk')).values('coupon__original_template__place_id')[:1]
+    Receipt.objects.filter(place__isnull=True, stamp__isnull=False).update(place_id=Subquery(place_of_stamp))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('couponbook', '0010_coupontemplate_expiry_closed_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='receipt',
+            name='receipt_place_number_idx',
+        ),
+        migrations.AlterField(
+            model_name='receipt',
+            name='place',
+            field=models.ForeignKey(blank=True, help_text='영수증을 발행한 가게 id입니다. 관리자가 등록한 예전 영수증은 비어 있고, 이런 영수증으로는 스탬프를 적립할 수 없습니다.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='receipts', to='couponbook.place'),
+        ),
+        migrations.RunPython(backfill_receipt_place, migrations.RunPython.noop),
+    ]
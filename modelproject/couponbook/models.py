@@ -1,10 +1,90 @@
+import logging
+
+from asgiref.sync import sync_to_async
 from django.db import models
+from django.db.models.functions import Coalesce, Greatest, Now
 from django.utils.timezone import now
 
-from .latlng.utils import get_place_latlng
+from utils.identity_map import related
+from utils.logs import log_event
+
+from .latlng.utils import aget_place_latlng, get_place_latlng
+
+logger = logging.getLogger(__name__)
 
 # Create your models here.
 
+def subquery_count(queryset: models.QuerySet, group_by: str):
+    """
+    `OuterRef`로 바깥 행에 묶인 `queryset`의 행 수를 세는 서브쿼리 식을 반환합니다. 행이 없으면 0입니다.
+
+    조인 후 Count로 세면 여러 개를 셀 때 행이 곱해지고 GROUP BY가 필요하지만, 서브쿼리는 서로 영향을 주지 않습니다.
+    """
+    counts = queryset.order_by().values(group_by).annotate(n=models.Count('*')).values('n')
+    return Coalesce(models.Subquery(counts), 0)
+
+
+class CouponBookQuerySet(models.QuerySet):
+    """
+    쿠폰북 조회에서 사용하는 어노테이션입니다.
+    """
+
+    def with_summary(self):
+        """
+        쿠폰북 요약 정보를 한 쿼리에서 어노테이션합니다.
+
+        - `favorite_counts`: 즐겨찾기한 쿠폰 수
+        - `coupon_counts`: 쿠폰북에 등록한 쿠폰 수 (= 아래 세 상태의 합)
+        - `completed_counts`: 스탬프를 모두 모은 쿠폰 수
+        - `expired_counts`: 완성하지 못하고 만료된 쿠폰 수
+        - `active_counts`: 완성하지 않았고 만료되지 않은 쿠폰 수
+        - `stamp_counts`: 쿠폰북 주인이 지금까지 적립한 스탬프 수
+        """
+        coupons = Coupon.objects.filter(couponbook=models.OuterRef('pk')).annotate(
+            n_stamps=subquery_count(Stamp.objects.filter(coupon=models.OuterRef('pk')), 'coupon'))
+        completed = models.Q(n_stamps__gte=models.F('original_template__reward_info__amount'))
+        # 리워드 정보가 없는 쿠폰은 완성될 수 없습니다. (exclude(completed)는 NULL 비교 때문에 이 경우를 빠뜨립니다.)
+        in_progress = (models.Q(original_template__reward_info__isnull=True)
+                       | models.Q(n_stamps__lt=models.F('original_template__reward_info__amount')))
+
+        return self.annotate(
+            favorite_counts=subquery_count(FavoriteCoupon.objects.filter(couponbook=models.OuterRef('pk')), 'couponbook'),
+            coupon_counts=subquery_count(coupons, 'couponbook'),
+            completed_counts=subquery_count(coupons.filter(completed), 'couponbook'),
+            expired_counts=subquery_count(coupons.filter(in_progress, status=Coupon.Status.EXPIRED), 'couponbook'),
+            active_counts=subquery_count(coupons.filter(in_progress, status=Coupon.Status.ACTIVE), 'couponbook'),
+            stamp_counts=subquery_count(Stamp.objects.filter(customer=models.OuterRef('user_id')), 'customer'),
+        )
+
+
+class CouponQuerySet(models.QuerySet):
+    """
+    쿠폰 조회에서 사용하는 어노테이션입니다.
+    """
+
+    def with_card(self):
+        """
+        쿠폰 카드(가게, 리워드, 스탬프 수, 유효기간)를 직렬화하는 데 필요한 정보를 한 쿼리로 불러옵니다.
+
+        템플릿, 가게, 법정동 주소, 리워드 정보를 조인하고, 적립된 스탬프 수를 `stamp_counts`로 어노테이션합니다.
+        """
+        return (self.select_related('original_template__place__address_district', 'original_template__reward_info')
+                .with_stamp_counts())
+
+    def with_stamp_counts(self):
+        """
+        적립된 스탬프 수를 `stamp_counts`로 어노테이션합니다.
+        """
+        return self.annotate(stamp_counts=subquery_count(Stamp.objects.filter(coupon=models.OuterRef('pk')), 'coupon'))
+
+    def with_favorite_id(self):
+        """
+        쿠폰을 즐겨찾기에 등록했으면 그 즐겨찾기 id를 `favorite_id`로 어노테이션합니다. 등록하지 않았으면 None입니다.
+        """
+        favorites = FavoriteCoupon.objects.filter(coupon=models.OuterRef('pk')).values('id')[:1]
+        return self.annotate(favorite_id=models.Subquery(favorites))
+
+
 class CouponBook(models.Model):
     """
     쿠폰북 모델입니다. 실제 사용되는 쿠폰들은 쿠폰북에서 쿠폰을 역참조하는 형태로 조회됩니다.
@@ -14,6 +94,8 @@ class CouponBook(models.Model):
                                  on_delete=models.CASCADE,
                                  help_text="쿠폰북을 소유한 유저 id입니다.")
 
+    objects = CouponBookQuerySet.as_manager()
+
 class Coupon(models.Model):
     """
     실제 사용되는 쿠폰입니다.
@@ -28,6 +110,31 @@ class Coupon(models.Model):
                                           help_text="쿠폰 발행에 사용된 쿠폰 템플릿 id입니다. 유효성 검증에 사용합니다.")
     saved_at = models.DateTimeField(auto_now_add=True, help_text="쿠폰을 등록한 날짜와 시간입니다.")
 
+    objects = CouponQuerySet.as_manager()
+
+    class Status(models.TextChoices):
+        """
+        쿠폰의 상태입니다. 유효기간이 지나면 sweep_coupon_expiry 명령어가 EXPIRED로 바꿉니다.
+        """
+
+        ACTIVE = "ACTIVE", "사용 중"
+        EXPIRED = "EXPIRED", "만료"
+
+    status = models.CharField(max_length=10,
+                              choices=Status.choices,
+                              default=Status.ACTIVE,
+                              db_index=True,
+                              help_text="쿠폰의 상태입니다. 조회 시 만료 여부는 유효기간 대신 이 값으로 판단합니다.")
+    expiry_notified_at = models.DateTimeField(null=True, blank=True,
+                                              help_text="만료 임박 알림을 보낸 날짜와 시간입니다. 알림은 한 번만 보냅니다.")
+
+    def log_rejection(self, reason: str, message: str):
+        """
+        검증에 실패해서 쿠폰을 등록하지 않았다는 구조화 로그(coupon_rejected)를 남깁니다.
+        """
+        log_event(logger, 'coupon_rejected', message, level=logging.WARNING, reason=reason,
+                  template_id=self.original_template_id, couponbook_id=self.couponbook_id)
+
     def save(self, *args, **kwargs):
         """
         쿠폰 등록 전 모델 단계에서 검증을 진행합니다.
@@ -40,23 +147,23 @@ class Coupon(models.Model):
 
         # 1. 원본 쿠폰 템플릿이 존재하는지 확인합니다.
         if not CouponTemplate.objects.filter(id=self.original_template.id).exists():
-            print("원본 쿠폰 템플릿이 존재하지 않아 쿠폰이 등록되지 않았습니다.")
+            self.log_rejection('template_missing', "원본 쿠폰 템플릿이 존재하지 않아 쿠폰이 등록되지 않았습니다.")
             return
 
         # 2. 유효 기간이 만료되지 않았는지 확인합니다.
         if self.original_template.valid_until and self.original_template.valid_until < now():
-            print("쿠폰 템플릿의 유효 기간이 만료되어 쿠폰이 등록되지 않았습니다.")
+            self.log_rejection('template_expired', "쿠폰 템플릿의 유효 기간이 만료되어 쿠폰이 등록되지 않았습니다.")
             return
 
         # 3. 선착순 인원이 있다면 마감되지 않았는지 확인합니다.
         if self.original_template.first_n_persons \
         and Coupon.objects.filter(original_template=self.original_template).count() >= self.original_template.first_n_persons:
-            print("선착순 인원이 마감되어 쿠폰이 등록되지 않았습니다.")
+            self.log_rejection('sold_out', "선착순 인원이 마감되어 쿠폰이 등록되지 않았습니다.")
             return
 
         # 4. 이미 해당 유저가 해당 쿠폰 템플릿으로 등록한 쿠폰이 존재하는지 확인합니다.
         if Coupon.objects.filter(couponbook=self.couponbook, original_template=self.original_template).exists():
-            print("이미 해당 쿠폰 템플릿으로 등록된 쿠폰이 있어 쿠폰이 등록되지 않았습니다.")
+            self.log_rejection('duplicate', "이미 해당 쿠폰 템플릿으로 등록된 쿠폰이 있어 쿠폰이 등록되지 않았습니다.")
             return
         
         return super().save(*args, **kwargs)
@@ -75,6 +182,46 @@ class FavoriteCoupon(models.Model):
                                   help_text="즐겨찾기 등록한 쿠폰 id입니다.")
     added_at = models.DateTimeField(auto_now_add=True, help_text="즐겨찾기에 등록한 날짜와 시간입니다.")
 
+class CouponTemplateQuerySet(models.QuerySet):
+    """
+    쿠폰 템플릿 조회에서 공통으로 쓰는 필터와 어노테이션입니다. 목록, 상세, 큐레이션 뷰가 같은 쿼리를 사용합니다.
+    """
+
+    def active(self):
+        """
+        현재 게시 중이고 유효기간이 지나지 않은 쿠폰 템플릿만 남깁니다.
+
+        기준 시각은 쿼리가 실행될 때 DB의 `Now()`로 계산되므로, 쿼리셋을 클래스 속성에 두어도 시각이 고정되지 않습니다.
+        """
+        return self.filter(models.Q(valid_until__isnull=True) | models.Q(valid_until__gte=Now()), is_on=True)
+
+    def with_remaining(self):
+        """
+        발급된 쿠폰 수(`n_issued`)와 남은 선착순 인원 수(`n_remaining`)를 어노테이션합니다.
+        선착순 인원이 없는 템플릿의 `n_remaining`은 None입니다.
+
+        쿠폰 수는 템플릿마다 서브쿼리로 세므로, 다른 조인과 섞여 GROUP BY가 생기지 않습니다.
+        """
+        issued = Coupon.objects.filter(original_template=models.OuterRef('pk'))
+        return self.annotate(
+            n_issued=subquery_count(issued, 'original_template'),
+            n_remaining=models.Case(
+                models.When(first_n_persons=0, then=None),
+                default=Greatest(models.F('first_n_persons') - models.F('n_issued'), 0),
+            ),
+        )
+
+    def with_owned_by(self, user):
+        """
+        `user`가 이 템플릿으로 발급받은 쿠폰을 보유하고 있는지(`is_owned`)를 어노테이션합니다.
+        로그인하지 않은 유저는 항상 거짓입니다.
+        """
+        if not getattr(user, 'is_authenticated', False):
+            return self.annotate(is_owned=models.Value(False))
+        owned = Coupon.objects.filter(original_template=models.OuterRef('pk'), couponbook__user_id=user.id)
+        return self.annotate(is_owned=models.Exists(owned))
+
+
 class CouponTemplate(models.Model):
     """
     점주가 등록해서 게시중인 쿠폰 템플릿입니다.
@@ -82,6 +229,9 @@ class CouponTemplate(models.Model):
     valid_until = models.DateTimeField(null=True, blank=True, help_text="쿠폰의 유효기간입니다.")
     first_n_persons = models.PositiveIntegerField(default=0, help_text="선착순 몇명까지 쿠폰이 발급한지를 의미합니다.")
     is_on = models.BooleanField(default=True, help_text="게시 중/비공개 여부를 불리언으로 나타냅니다.")
+    expiry_closed_at = models.DateTimeField(null=True, blank=True,
+                                            help_text="유효기간이 지나 만료 처리에서 비공개로 바꾼 날짜와 시간입니다. "
+                                                      "유효기간이 연장되면 다시 게시 중으로 바뀝니다.")
     created_at = models.DateTimeField(auto_now_add=True, help_text="점주가 쿠폰 템플릿을 등록한 날짜와 시간입니다.")
     
     # 쿠폰 템플릿이 어느 가게에 속하는지 명시적으로 연결합니다.
@@ -93,6 +243,14 @@ class CouponTemplate(models.Model):
                               blank=False,
                               )
 
+    objects = CouponTemplateQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 유효기간이 지났는데 게시 중인 템플릿을 찾을 때(sweep_coupon_expiry) 사용합니다.
+            models.Index(fields=["is_on", "valid_until"], name="template_on_valid_until_idx"),
+        ]
+
 class RewardsInfo(models.Model):
     """
     한 쿠폰의 리워드 정보를 나타냅니다.
@@ -119,35 +277,43 @@ class Stamp(models.Model):
     customer = models.ForeignKey("accounts.User", on_delete=models.CASCADE, help_text="스탬프를 적립받은 고객 id입니다.")
     created_at = models.DateTimeField(auto_now_add=True, help_text="스탬프가 적립된 날짜와 시간입니다.")
 
+    def log_rejection(self, reason: str, message: str):
+        """
+        검증에 실패해서 스탬프를 등록하지 않았다는 구조화 로그(stamp_rejected)를 남깁니다.
+        """
+        log_event(logger, 'stamp_rejected', message, level=logging.WARNING, reason=reason,
+                  coupon_id=self.coupon_id, receipt_id=self.receipt_id)
+
     def save(self, *args, **kwargs):
         """
         스탬프 등록 시에 모델 레벨에서 유효성 검증을 실행합니다.
 
         1) 쿠폰의 기간이 만료되진 않았는지?
         2) 이미 완성된 쿠폰인지?
-        3) 일치하는 영수증이 존재하는지?
+        3) 쿠폰의 가게에 등록된 영수증이 존재하는지?
         4) 이미 해당되는 영수증으로 스탬프가 등록되진 않았는지?
         """
-        coupon = self.coupon
+        coupon = related(self, 'coupon') # 요청 안에서 이미 조회한 쿠폰이면 다시 조회하지 않습니다.
 
         # 1) 쿠폰의 기간이 만료되진 않았는지?
         if coupon.original_template.valid_until and coupon.original_template.valid_until < now():
-            print("쿠폰의 기간이 만료되어 스탬프 인스턴스가 등록되지 않았습니다.")
+            self.log_rejection('coupon_expired', "쿠폰의 기간이 만료되어 스탬프 인스턴스가 등록되지 않았습니다.")
             return
         
         # 2) 이미 완성된 쿠폰인지?
         if Stamp.objects.filter(coupon=coupon).count() >= coupon.original_template.reward_info.amount:
-            print("이미 완성된 쿠폰이어서 스탬프 인스턴스가 등록되지 않았습니다.")
+            self.log_rejection('coupon_completed', "이미 완성된 쿠폰이어서 스탬프 인스턴스가 등록되지 않았습니다.")
             return
         
-        # 3) 일치하는 영수증이 존재하는지?
-        if not Receipt.objects.filter(receipt_number=self.receipt.receipt_number).exists():
-            print("일치하는 영수증이 없어서 스탬프 인스턴스가 등록되지 않았습니다.")
+        # 3) 쿠폰의 가게에 등록된 영수증이 존재하는지?
+        if not Receipt.objects.filter(receipt_number=self.receipt.receipt_number,
+                                      place_id=coupon.original_template.place_id).exists():
+            self.log_rejection('receipt_missing', "쿠폰의 가게에 등록된 영수증이 없어서 스탬프 인스턴스가 등록되지 않았습니다.")
             return
         
         # 4) 이미 해당되는 영수증으로 스탬프가 등록되진 않았는지?
         if Stamp.objects.filter(receipt=self.receipt).exists():
-            print("이미 해당되는 영수증으로 등록된 스탬프가 있어 스탬프 인스턴스가 등록되지 않았습니다.")
+            self.log_rejection('receipt_used', "이미 해당되는 영수증으로 등록된 스탬프가 있어 스탬프 인스턴스가 등록되지 않았습니다.")
             return
 
         return super().save(*args, **kwargs)
@@ -158,8 +324,21 @@ class Receipt(models.Model):
     """
     receipt_number = models.CharField(max_length=30, help_text="영수증 번호입니다. 중복되지 않습니다.",
                                                       unique=True, primary_key=True)
+    place = models.ForeignKey("couponbook.Place",
+                              related_name="receipts",
+                              on_delete=models.CASCADE,
+                              null=True, blank=True,
+                              help_text="영수증을 발행한 가게 id입니다. 관리자가 등록한 예전 영수증은 비어 있고, "
+                                        "이런 영수증으로는 스탬프를 적립할 수 없습니다.")
     created_at = models.DateTimeField(auto_now_add=True, help_text="점주에 의해 영수증이 등록된 날짜와 시간입니다.")
 
+    class Meta:
+        # 스탬프 적립 시 (가게, 영수증 번호)로 조회하지만, 영수증 번호가 기본 키이므로 별도의 인덱스는 두지 않습니다.
+        indexes = [
+            # 보관 기간이 지난 영수증 정리(prune_receipts)에 사용합니다.
+            models.Index(fields=["created_at"], name="receipt_created_at_idx"),
+        ]
+
 class LegalDistrict(models.Model):
     """
     전국의 주소를 법정동 단위까지 담는 모델입니다. Fixture를 사용해서 미리 데이터를 로딩해둬야 합니다.
@@ -191,23 +370,101 @@ class Place(models.Model):
                                                    help_text="가게의 태그들입니다. 콤마로 구분해서 입력하세요.")
     last_order = models.TimeField(help_text="라스트오더 시간입니다.")
     tel = models.CharField(max_length=20, help_text="가게 전화번호입니다.")
+    thumbnails = models.JSONField(default=dict, blank=True,
+                                  help_text="업로드한 가게 이미지의 썸네일입니다. 크기(px) -> 스토리지 이름이며, "
+                                            "generate_thumbnails 명령어가 채웁니다.")
     # 점주와 가게를 1:1로 연결
     owner = models.OneToOneField("accounts.User", on_delete=models.CASCADE, related_name="place",
                                                       null=True, blank=True, help_text="이 매장의 점주 사용자입니다.")
 
-    def save(self, *args, **kwargs):
+    def get_search_keyword(self) -> str:
         """
-        위도와 경도 정보를 카카오맵 API를 이용해서 계산해서 저장합니다.
+        카카오맵 검색에 사용할 키워드입니다. (법정동 주소 + 가게 이름)
         """
         keyword = self.name
         address_district = f"{self.address_district.province} {self.address_district.city} " \
              f"{self.address_district.district}"
-        
-        latlng = get_place_latlng(f"{address_district} {keyword}")
+        return f"{address_district} {keyword}"
+
+    def log_rejection(self, keyword: str):
+        """
+        카카오맵에서 찾을 수 없어서 가게를 등록하지 않았다는 구조화 로그(place_rejected)를 남깁니다.
+        """
+        log_event(logger, 'place_rejected',
+                  "존재하지 않는 가게여서 등록되지 않았습니다. 실존하는 가게임에도 등록이 되지 않는다면, 카카오맵에서 검색 가능한 가게인지 확인해보세요.",
+                  level=logging.WARNING, reason='not_found', place_id=self.id, keyword=keyword)
+
+    def save(self, *args, **kwargs):
+        """
+        위도와 경도 정보를 카카오맵 API를 이용해서 계산해서 저장합니다.
+        """
+        keyword = self.get_search_keyword()
+        latlng = get_place_latlng(keyword)
 
         if latlng:
             self.lat, self.lng = latlng
             return super().save(*args, **kwargs)
         
-        print("존재하지 않는 가게여서 등록되지 않았습니다. 실존하는 가게임에도 등록이 되지 않는다면, 카카오맵에서 검색 가능한 가게인지 확인해보세요.")
+        self.log_rejection(keyword)
+        return
+
+    async def asave(self, *args, **kwargs):
+        """
+        비동기 뷰에서 사용하는 저장 메소드입니다.
+
+        카카오맵 API의 응답은 이벤트 루프 위에서 기다리고, 좌표 계산이 끝난 뒤의 INSERT/UPDATE만 스레드에서 실행합니다.
+        """
+        keyword = await sync_to_async(self.get_search_keyword)()
+        latlng = await aget_place_latlng(keyword)
+
+        if latlng:
+            self.lat, self.lng = latlng
+            # save()를 다시 호출하면 지오코딩이 한 번 더 일어나므로 부모 클래스의 save를 직접 호출합니다.
+            return await sync_to_async(super().save)(*args, **kwargs)
+
+        self.log_rejection(keyword)
         return
+
+class TemplateDailyStats(models.Model):
+    """
+    쿠폰 템플릿의 하루 단위 통계(롤업)입니다. 점주 통계 API는 쿠폰과 스탬프 대신 이 테이블만 조회합니다.
+
+    쿠폰/스탬프가 생성될 때 시그널(couponbook.signals)로 갱신되고, rebuild_template_stats 명령어로 다시 계산할 수 있습니다.
+    날짜는 TIME_ZONE(Asia/Seoul) 기준입니다.
+    """
+    template = models.ForeignKey(CouponTemplate,
+                                 related_name='daily_stats',
+                                 on_delete=models.CASCADE,
+                                 help_text="통계를 집계한 쿠폰 템플릿 id입니다.")
+    date = models.DateField(help_text="집계한 날짜입니다.")
+    coupons_issued = models.PositiveIntegerField(default=0, help_text="이 날 발급(등록)된 쿠폰 수입니다.")
+    stamps_earned = models.PositiveIntegerField(default=0, help_text="이 날 적립된 스탬프 수입니다.")
+    completions = models.PositiveIntegerField(default=0, help_text="이 날 완성된 쿠폰 수입니다.")
+    unique_customers = models.PositiveIntegerField(default=0, help_text="이 날 스탬프를 적립한 고객 수입니다.")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["template", "date"], name="unique_template_daily_stats"),
+        ]
+
+
+class PlaceImageUpload(models.Model):
+    """
+    점주가 S3로 직접 올리는 가게 이미지 모델입니다. 썸네일 생성(generate_thumbnails 명령어)의 작업 목록으로도 사용합니다.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', '업로드 대기'
+        UPLOADED = 'uploaded', '썸네일 생성 대기'
+        READY = 'ready', '완료'
+        FAILED = 'failed', '실패'
+
+    place = models.ForeignKey(Place, on_delete=models.CASCADE, related_name='image_uploads',
+                              help_text="이미지를 올린 가게입니다.")
+    name = models.CharField(max_length=255, unique=True, help_text="원본 이미지의 스토리지 이름입니다.")
+    content_type = models.CharField(max_length=20, help_text="원본 이미지의 Content-Type입니다.")
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING, db_index=True,
+                              help_text="업로드와 썸네일 생성 상태입니다.")
+    error = models.CharField(max_length=255, blank=True, default='', help_text="썸네일 생성에 실패한 이유입니다.")
+    created_at = models.DateTimeField(auto_now_add=True, help_text="업로드 URL을 발급한 날짜와 시간입니다.")
+    processed_at = models.DateTimeField(null=True, blank=True, help_text="썸네일 생성을 마친 날짜와 시간입니다.")
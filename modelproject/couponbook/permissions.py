@@ -1,8 +1,41 @@
+from django.db.models import QuerySet
+from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.permissions import BasePermission
+from utils.identity_map import get_or_compute, lookup, remember
 
 from .models import Coupon, CouponBook
 
 
+def get_own_couponbook_id(user) -> int | None:
+    """
+    유저의 쿠폰북 id를 반환합니다. 토큰 클레임으로 만든 유저는 쿼리 없이 클레임 값을 사용합니다.
+
+    그 외의 유저는 조회한 값을 요청 단위 identity map에 보관하므로, 배치 요청을 포함해 요청마다 한 번만 조회합니다.
+    (유저 객체에 저장하면 같은 유저 객체를 다시 쓰는 다음 요청이나 테스트에 값이 남습니다.)
+    """
+    if not user.is_authenticated:
+        return None
+    if getattr(user, 'from_token_claims', False):
+        return user.couponbook_id
+    return get_or_compute('own_couponbook_id', user.pk,
+                          lambda: CouponBook.objects.filter(user=user).values_list('id', flat=True).first())
+
+
+def get_owned_object(queryset: QuerySet, user, owner_field: str, **lookup):
+    """
+    `owner_field`(예: couponbook__user_id)가 요청한 유저의 id인 객체만 조회하여, 소유권 확인과 조회를 쿼리 한 번으로 처리합니다.
+
+    조회되지 않으면 그때만 객체가 존재하는지 확인해서, 남의 객체면 403(PermissionDenied), 없는 객체면 404(NotFound)를 일으킵니다.
+    """
+
+    obj = queryset.filter(**{owner_field: user.id}, **lookup).first()
+    if obj is None:
+        if queryset.model._default_manager.filter(**lookup).exists():
+            raise PermissionDenied
+        raise NotFound
+    return obj
+
+
 class IsMyCouponBook(BasePermission):
     """
     본인의 쿠폰북인지 확인합니다.
@@ -12,38 +45,58 @@ class IsMyCouponBook(BasePermission):
 
     def has_object_permission(self, request, view, obj: CouponBook) -> bool:
         """
-        쿠폰북 인스턴스의 유저와 요청의 유저를 비교합니다.
+        쿠폰북 인스턴스의 유저 id와 요청의 유저 id를 비교합니다.
         """
-        return obj.user == request.user
+        return obj.user_id == request.user.id
 
     def has_permission(self, request, view) -> bool:
         """
-        Path Parameter인 couponbook_id를 바탕으로 쿠폰북 인스턴스를 얻어 해당 쿠폰북의 유저와 현재 요청의 유저를 비교합니다.
+        Path Parameter인 couponbook_id를 요청한 유저의 쿠폰북 id와 비교합니다.
+
+        토큰 클레임 인증(ClaimsJWTAuthentication)을 사용하면 쿠폰북 id가 토큰에 들어 있으므로 쿼리가 없습니다.
+        본인의 쿠폰북이 아닐 때만 쿠폰북이 존재하는지 확인해서, 없는 쿠폰북이면 404가 반환됩니다.
         """
+        if not request.user.is_authenticated:
+            return False
+
         couponbook_id = view.kwargs['couponbook_id']
-        couponbook = CouponBook.objects.get(id=couponbook_id)
-        return self.has_object_permission(request, view, couponbook)
+        if couponbook_id == get_own_couponbook_id(request.user):
+            return True
+        if not CouponBook.objects.filter(id=couponbook_id).exists():
+            raise NotFound
+        return False
 
 class IsMyCoupon(BasePermission):
     """
     본인의 쿠폰인지 확인합니다.
-    
-    사용되는 뷰: CouponDetailView (object permission), StampListView (permission)
+
+    소유권 확인과 함께 조회한 쿠폰은 `view.coupon`과 요청 단위 identity map에 저장되므로, 뷰와 시리얼라이저에서 다시 조회하지 않아도 됩니다.
+    조회에 사용할 쿼리셋은 뷰의 `get_coupon_queryset()`으로 바꿀 수 있습니다. (select_related 등)
+
+    사용되는 뷰: CouponDetailView (permission), StampListView (permission)
     """
 
     def has_object_permission(self, request, view, obj: Coupon) -> bool:
         """
-        쿠폰 인스턴스에 연결된 쿠폰북의 유저와 요청의 유저를 비교합니다.
+        쿠폰 인스턴스의 쿠폰북 id와 요청한 유저의 쿠폰북 id를 비교합니다.
         """
-        return obj.couponbook.user == request.user
+        return obj.couponbook_id == get_own_couponbook_id(request.user)
 
     def has_permission(self, request, view) -> bool:
         """
-        Path Parameter인 coupon_id를 바탕으로 쿠폰 인스턴스를 얻어 해당 쿠폰이 있는 쿠폰북의 유저와 현재 요청의 유저를 비교합니다.
+        Path Parameter인 coupon_id에 해당하는 쿠폰을 요청한 유저의 쿠폰 중에서 조회합니다.
         """
-        coupon_id = view.kwargs['coupon_id']
-        coupon = Coupon.objects.get(id=coupon_id)
-        return self.has_object_permission(request, view, coupon)
+        if not request.user.is_authenticated:
+            return False
+
+        # 같은 요청(배치 요청 등)에서 이미 조회한 본인의 쿠폰이면 다시 조회하지 않습니다.
+        coupon = lookup(Coupon, view.kwargs['coupon_id'])
+        if coupon is None or coupon.couponbook_id != get_own_couponbook_id(request.user):
+            get_coupon_queryset = getattr(view, 'get_coupon_queryset', Coupon.objects.all)
+            coupon = remember(get_owned_object(get_coupon_queryset(), request.user, 'couponbook__user_id',
+                                               id=view.kwargs['coupon_id']))
+        view.coupon = coupon
+        return True
 
 class IsMyCouponForFavoriteAdd(IsMyCouponBook):
     """
@@ -55,14 +108,34 @@ class IsMyCouponForFavoriteAdd(IsMyCouponBook):
         쿠폰 또는 쿠폰북 인스턴스에 연결된 쿠폰북의 유저와 요청의 유저를 비교합니다.
         """
         if isinstance(obj, Coupon):
-            return obj.couponbook.user == request.user
+            return obj.couponbook_id == get_own_couponbook_id(request.user)
         else:
-            return obj.user == request.user
-    
+            return obj.user_id == request.user.id
+
+    def has_permission(self, request, view) -> bool:
+        """
+        POST 요청이면, 요청 본문의 쿠폰이 요청한 유저의 쿠폰인지 확인합니다.
+
+        쿠폰 id가 없거나 숫자가 아니면 시리얼라이저의 유효성 검증에서 400이 반환되도록 통과시킵니다.
+        """
+        if not super().has_permission(request, view):
+            return False
+
+        if request.method == 'POST':
+            try:
+                coupon_id = int(request.data['coupon'])
+            except (KeyError, TypeError, ValueError):
+                return True
+            view.coupon = remember(get_owned_object(Coupon.objects.all(), request.user, 'couponbook__user_id', id=coupon_id))
+        return True
+
+class IsStaffOrOwner(BasePermission):
+    """
+    스태프 유저이거나 점주인지 확인합니다. 점주는 자신의 가게 데이터만 다뤄야 하므로, 뷰에서 가게로 범위를 제한합니다.
+
+    사용되는 뷰: CouponExportView (permission), StampExportView (permission)
+    """
+
     def has_permission(self, request, view) -> bool:
-        if request.method == 'POST' and super().has_permission(request, view):
-            coupon_id = request.data['coupon']
-            coupon = Coupon.objects.get(id=coupon_id)
-            
-            return self.has_object_permission(request, view, coupon)
-        return super().has_permission(request, view)
+        user = request.user
+        return bool(user and user.is_authenticated and (user.is_staff or user.is_owner()))
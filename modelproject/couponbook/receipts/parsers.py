@@ -0,0 +1,25 @@
+from rest_framework.parsers import BaseParser
+
+from .utils import iter_csv_receipt_numbers, iter_ndjson_receipt_numbers
+
+
+class ReceiptCSVParser(BaseParser):
+    """
+    text/csv 본문을 영수증 번호 제너레이터로 파싱합니다. 본문을 한 번에 읽지 않고 줄 단위로 읽습니다.
+    """
+
+    media_type = 'text/csv'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return iter_csv_receipt_numbers(stream or ())
+
+
+class ReceiptNDJSONParser(BaseParser):
+    """
+    application/x-ndjson 본문을 영수증 번호 제너레이터로 파싱합니다. 본문을 한 번에 읽지 않고 줄 단위로 읽습니다.
+    """
+
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return iter_ndjson_receipt_numbers(stream or ())
@@ -0,0 +1,211 @@
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import IO, Callable, Iterable, Iterator
+
+from couponbook.models import Receipt
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.timezone import now
+
+RECEIPT_NUMBER_MAX_LENGTH = Receipt._meta.get_field('receipt_number').max_length
+DEFAULT_BATCH_SIZE = 2_000
+
+# 항목별 처리 결과
+CREATED = 'created'  # 새로 등록됨
+DUPLICATE = 'duplicate'  # 이미 이 가게에 등록되어 있거나, 요청 안에서 중복됨
+CONFLICT = 'conflict'  # 다른 가게(또는 가게 정보가 없는 예전 영수증)에 이미 등록된 번호
+INVALID = 'invalid'  # 비어 있거나 너무 긴 번호
+
+
+# ---- 입력 형식별 파서 ----
+# 모두 영수증 번호(str)를 하나씩 돌려주는 제너레이터이므로, 큰 입력도 한 번에 메모리에 올리지 않습니다.
+def _receipt_number_of(item) -> str:
+    """
+    JSON 항목에서 영수증 번호를 꺼냅니다. 문자열/숫자 또는 {"receipt_number": ...} 객체를 받습니다.
+    """
+    if isinstance(item, dict):
+        item = item.get('receipt_number', '')
+    return '' if item is None else str(item)
+
+
+def iter_json_receipt_numbers(data) -> Iterator[str]:
+    """
+    JSON 배열 또는 {"receipt_numbers": [...]} 객체에서 영수증 번호를 꺼냅니다.
+    """
+    if isinstance(data, dict):
+        data = data.get('receipt_numbers', [])
+    if not isinstance(data, list):
+        raise ValueError("영수증 번호 배열이 필요합니다.")
+    for item in data:
+        yield _receipt_number_of(item)
+
+
+def iter_ndjson_receipt_numbers(lines: Iterable[bytes | str]) -> Iterator[str]:
+    """
+    한 줄에 JSON 값(문자열 또는 객체) 하나씩 있는 NDJSON에서 영수증 번호를 꺼냅니다. 빈 줄은 건너뜁니다.
+    """
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield _receipt_number_of(json.loads(line))
+        except json.JSONDecodeError:
+            yield line  # 따옴표 없이 번호만 적은 줄도 허용합니다.
+
+
+def iter_csv_receipt_numbers(lines: Iterable[bytes | str]) -> Iterator[str]:
+    """
+    CSV의 첫 번째 열(또는 receipt_number 열)에서 영수증 번호를 꺼냅니다.
+    첫 줄이 `receipt_number` 헤더이면 해당 열을 사용합니다. CSV 형식이 잘못되었으면(`csv.Error`) `ValueError`가 발생합니다.
+    """
+    text_lines = (line.decode('utf-8-sig') if isinstance(line, bytes) else line for line in lines)
+    column = 0
+    try:
+        for index, row in enumerate(csv.reader(text_lines)):
+            if not row:
+                continue
+            if index == 0 and 'receipt_number' in row:
+                column = row.index('receipt_number')
+                continue
+            yield row[column] if column < len(row) else ''
+    except csv.Error as e:
+        raise ValueError(f"CSV 형식이 잘못되었습니다: {e}") from e
+
+
+def iter_receipt_numbers_from_file(file: IO, file_format: str) -> Iterator[str]:
+    """
+    파일을 형식(json, ndjson, csv)에 맞게 읽어 영수증 번호를 꺼냅니다. 관리 명령어에서 사용합니다.
+    """
+    if file_format == 'json':
+        return iter_json_receipt_numbers(json.load(file))
+    if file_format == 'ndjson':
+        return iter_ndjson_receipt_numbers(file)
+    if file_format == 'csv':
+        return iter_csv_receipt_numbers(file)
+    raise ValueError(f"지원하지 않는 형식입니다: {file_format}")
+
+
+# ---- 등록 ----
+@dataclass
+class IngestResult:
+    results: list[dict] = field(default_factory=list)  # [{"receipt_number": ..., "status": ...}, ...]
+    counts: dict[str, int] = field(default_factory=lambda: {CREATED: 0, DUPLICATE: 0, CONFLICT: 0, INVALID: 0})
+
+    def add(self, receipt_number: str, status: str, keep_results: bool):
+        self.counts[status] += 1
+        if keep_results:
+            self.results.append({'receipt_number': receipt_number, 'status': status})
+
+
+def _batched(iterable: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def ingest_receipts(receipt_numbers: Iterable[str], place_id: int,
+                    batch_size: int = DEFAULT_BATCH_SIZE, keep_results: bool = True) -> IngestResult:
+    """
+    영수증 번호들을 가게의 영수증으로 대량 등록하고, 항목별 처리 결과를 반환합니다.
+
+    배치마다 이미 등록된 번호를 한 번에 조회한 후, 새 번호만 `bulk_create(ignore_conflicts=True)`로 등록합니다.
+    조회와 등록 사이에 다른 요청이 같은 번호를 등록하더라도 충돌은 무시되므로 실패하지 않습니다.
+    (이 경우 해당 항목은 created로 보고될 수 있습니다.)
+
+    `keep_results=False`이면 항목별 결과 없이 개수만 집계합니다.
+
+    입력을 끝까지 읽은 후에 등록을 시작하므로, 입력을 읽다가 실패(ValueError 등)하면 아무것도 등록하지 않습니다.
+    (API가 400을 돌려줬는데 일부만 등록되어 있는 일이 없도록) 느린 클라이언트가 본문을 보내는 동안 트랜잭션을 열어 두지 않고,
+    등록은 배치마다 바로 커밋됩니다.
+    """
+
+    receipt_numbers = [number.strip() for number in receipt_numbers]
+    result = IngestResult()
+    seen: set[str] = set()
+
+    for batch in _batched(receipt_numbers, batch_size):
+        statuses: dict[int, str] = {}
+        candidates: dict[str, int] = {}  # 영수증 번호 -> 배치 내 위치
+        for index, number in enumerate(batch):
+            if not number or len(number) > RECEIPT_NUMBER_MAX_LENGTH:
+                statuses[index] = INVALID
+            elif number in seen:
+                statuses[index] = DUPLICATE
+            else:
+                seen.add(number)
+                candidates[number] = index
+
+        existing = dict(Receipt.objects.filter(receipt_number__in=list(candidates))
+                        .values_list('receipt_number', 'place_id'))
+        new_receipts = []
+        for number, index in candidates.items():
+            if number not in existing:
+                statuses[index] = CREATED
+                new_receipts.append(Receipt(receipt_number=number, place_id=place_id))
+            elif existing[number] == place_id:
+                statuses[index] = DUPLICATE
+            else:
+                statuses[index] = CONFLICT
+
+        Receipt.objects.bulk_create(new_receipts, batch_size=batch_size, ignore_conflicts=True)
+
+        for index, number in enumerate(batch):
+            result.add(number, statuses[index], keep_results)
+
+    return result
+
+
+# ---- 보관 기간이 지난 영수증 정리 ----
+def get_receipt_prune_cutoff() -> datetime:
+    """
+    이 시각 이전에 등록되고 스탬프가 적립되지 않은 영수증이 정리 대상입니다. (`RECEIPT_TTL_DAYS`)
+    """
+    return now() - timedelta(days=settings.RECEIPT_TTL_DAYS)
+
+
+def prune_receipts(cutoff: datetime, batch_size: int | None = None, archive: IO | None = None,
+                   pause: float = 0.0, on_batch: Callable[[int], None] | None = None) -> int:
+    """
+    `cutoff` 이전에 등록되고 스탬프가 적립되지 않은 영수증을 배치 단위로 삭제하고, 삭제한 개수를 반환합니다.
+
+    - 배치마다 삭제할 영수증 번호를 먼저 조회한 후, 그 번호들만 짧은 트랜잭션에서 삭제하므로 테이블을 오래 잠그지 않습니다.
+      삭제할 때 스탬프가 없는지 다시 확인하므로, 조회와 삭제 사이에 적립된 영수증은 삭제되지 않습니다.
+    - `archive`가 주어지면 삭제하기 전에 영수증을 한 줄에 하나씩 NDJSON으로 기록합니다.
+    - `pause`초만큼 배치 사이에 쉬어서 운영 중인 DB의 부하를 줄일 수 있습니다.
+    """
+
+    batch_size = batch_size or settings.RECEIPT_PRUNE_BATCH_SIZE
+    expired = Receipt.objects.filter(created_at__lt=cutoff, stamp__isnull=True)
+    deleted = 0
+
+    while True:
+        numbers = list(expired.order_by('created_at').values_list('receipt_number', flat=True)[:batch_size])
+        if not numbers:
+            break
+
+        with transaction.atomic():
+            batch = expired.filter(receipt_number__in=numbers)
+            if archive is not None:
+                # 실제로 삭제될 영수증만 기록하도록, 잠근 후 다시 조회합니다.
+                rows = batch.select_for_update(of=('self',)).values('receipt_number', 'place_id', 'created_at')
+                for row in rows:
+                    archive.write(json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n')
+            count, _ = batch.delete()
+        deleted += count
+
+        if on_batch:
+            on_batch(count)
+        if len(numbers) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return deleted
@@ -1,11 +1,17 @@
-from django.utils.timezone import now
+from datetime import time, timedelta
+from functools import lru_cache
+
+from django.utils.timezone import localdate, now
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (OpenApiExample, extend_schema_field,
                                    extend_schema_serializer)
 from rest_framework import serializers
-from rest_framework.reverse import reverse
+from utils.identity_map import get_or_load, related
+from utils.url_templates import url_template
 
+from .images.utils import CONTENT_TYPES, place_image_url, place_thumbnail_url
 from .models import *
+from .permissions import get_own_couponbook_id
 
 # 시리얼라이저는 역순으로 정의되어 있습니다.
 
@@ -13,6 +19,192 @@ DATETIME_FORMAT = "%Y-%m-%d %H:%M"  # 기본 datetime 출력 포맷
 TIME_FORMAT = "%H:%M"  # 기본 time 출력 포맷
 
 
+@lru_cache(maxsize=4096)
+def format_time(value: time, output_format: str) -> str:
+    """
+    `value.strftime(output_format)`의 결과를 캐시합니다. 가게 영업 시간은 종류가 적어서 대부분 캐시에서 반환됩니다.
+    """
+    return value.strftime(output_format)
+
+
+class CachedTimeField(serializers.TimeField):
+    """
+    출력 포맷이 지정된 경우, 같은 시간 값은 한 번만 `strftime`으로 변환하는 `TimeField`입니다.
+    """
+
+    def to_representation(self, value):
+        output_format = getattr(self, 'format', None)
+        if type(value) is time and isinstance(output_format, str) and output_format.lower() != 'iso-8601':
+            return format_time(value, output_format)
+        return super().to_representation(value)
+
+
+# -------------------------- 가게 이미지 업로드 ----------------------------------
+class PlaceImageUploadRequestSerializer(serializers.Serializer):
+    """
+    가게 이미지 업로드 URL을 요청할 때 사용하는 시리얼라이저입니다.
+    """
+
+    content_type = serializers.ChoiceField(choices=list(CONTENT_TYPES), help_text="올릴 이미지의 Content-Type입니다.")
+
+
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            "예시",
+            {
+                "id": 1,
+                "status": "pending",
+                "upload_url": "https://bucket.s3.amazonaws.com/",
+                "upload_fields": {
+                    "Content-Type": "image/jpeg",
+                    "key": "media/places/1/originals/0f8e....jpg",
+                    "x-amz-algorithm": "AWS4-HMAC-SHA256",
+                    "x-amz-credential": "...",
+                    "x-amz-date": "20250821T000000Z",
+                    "policy": "...",
+                    "x-amz-signature": "...",
+                },
+                "expires_in": 600,
+                "max_bytes": 10485760,
+            },
+            response_only=True,
+        )
+    ]
+)
+class PlaceImageUploadResponseSerializer(serializers.Serializer):
+    """
+    가게 이미지를 S3에 직접 올릴 presigned POST 정보입니다.
+    `upload_fields`를 모두 multipart/form-data 필드로 넣고, 마지막에 `file` 필드로 이미지를 넣어 `upload_url`로 POST합니다.
+    """
+
+    id = serializers.IntegerField(help_text="업로드 id입니다. 업로드를 마친 후 완료 요청에 사용합니다.")
+    status = serializers.CharField(help_text="업로드 상태입니다.")
+    upload_url = serializers.URLField(help_text="이미지를 올릴 주소입니다.")
+    upload_fields = serializers.DictField(child=serializers.CharField(), help_text="파일보다 먼저 넣어야 하는 폼 필드입니다.")
+    expires_in = serializers.IntegerField(help_text="업로드 URL의 유효 시간(초)입니다.")
+    max_bytes = serializers.IntegerField(help_text="올릴 수 있는 최대 파일 크기(바이트)입니다.")
+
+
+class PlaceImageUploadStatusSerializer(serializers.ModelSerializer):
+    """
+    가게 이미지 업로드 상태입니다. `uploaded`이면 썸네일을 만드는 중이고, `ready`이면 가게 목록에 썸네일이 표시됩니다.
+    """
+
+    class Meta:
+        model = PlaceImageUpload
+        fields = ['id', 'status']
+
+
+# -------------------------- 영수증 대량 등록 ----------------------------------
+# 등록은 couponbook.receipts.utils.ingest_receipts에서 처리하므로, 아래 시리얼라이저는 API 문서화에만 사용됩니다.
+class ReceiptBulkCreateItemSerializer(serializers.Serializer):
+    """
+    영수증 번호별 등록 결과입니다.
+    """
+
+    receipt_number = serializers.CharField(help_text="요청한 영수증 번호입니다. (앞뒤 공백 제거)")
+    status = serializers.ChoiceField(choices=["created", "duplicate", "conflict", "invalid"],
+                                     help_text="created: 등록됨, duplicate: 이미 내 가게에 등록됨 또는 요청 안에서 중복, "
+                                               "conflict: 다른 가게에 등록된 번호, invalid: 비어 있거나 30자를 넘는 번호")
+
+
+class ReceiptBulkCreateResponseSerializer(serializers.Serializer):
+    """
+    영수증 대량 등록 응답입니다.
+    """
+
+    created = serializers.IntegerField()
+    duplicate = serializers.IntegerField()
+    conflict = serializers.IntegerField()
+    invalid = serializers.IntegerField()
+    results = ReceiptBulkCreateItemSerializer(many=True)
+
+
+# -------------------------- 내보내기 ----------------------------------
+class ExportQuerySerializer(serializers.Serializer):
+    """
+    쿠폰/스탬프 내보내기의 쿼리 파라미터를 검증합니다.
+
+    `format`은 DRF가 렌더러 선택에 사용하므로 출력 형식은 `output`으로 받습니다.
+    """
+
+    output = serializers.ChoiceField(choices=["csv", "ndjson"], default="csv", help_text="출력 형식")
+    place = serializers.IntegerField(required=False, help_text="(스태프 전용) 특정 가게의 데이터만 내보낼 때 사용합니다.")
+    since = serializers.DateField(required=False, help_text="이 날짜부터 (YYYY-MM-DD)")
+    until = serializers.DateField(required=False, help_text="이 날짜까지 (YYYY-MM-DD, 포함)")
+
+
+# -------------------------- 점주 통계 ----------------------------------
+class PlaceStatsQuerySerializer(serializers.Serializer):
+    """
+    점주 통계 조회의 쿼리 파라미터를 검증합니다. 기간을 지정하지 않으면 오늘까지 최근 30일입니다.
+    """
+
+    MAX_DAYS = 731  # 한 번에 조회할 수 있는 최대 기간(일)
+
+    start = serializers.DateField(required=False, help_text="조회 시작 날짜 (YYYY-MM-DD)")
+    end = serializers.DateField(required=False, help_text="조회 끝 날짜 (YYYY-MM-DD, 포함)")
+    template = serializers.IntegerField(required=False, help_text="특정 쿠폰 템플릿의 통계만 조회할 때 사용합니다.")
+
+    def validate(self, attrs) -> dict:
+        attrs.setdefault("end", localdate())
+        attrs.setdefault("start", attrs["end"] - timedelta(days=29))
+        if attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError("시작 날짜가 끝 날짜보다 늦습니다.")
+        if (attrs["end"] - attrs["start"]).days >= self.MAX_DAYS:
+            raise serializers.ValidationError(f"한 번에 {self.MAX_DAYS}일까지 조회할 수 있습니다.")
+        return attrs
+
+
+class DailyStatsSerializer(serializers.Serializer):
+    """
+    하루 또는 기간의 통계 값입니다.
+    """
+
+    coupons_issued = serializers.IntegerField(help_text="발급된 쿠폰 수")
+    stamps_earned = serializers.IntegerField(help_text="적립된 스탬프 수")
+    completions = serializers.IntegerField(help_text="완성된 쿠폰 수")
+    unique_customers = serializers.IntegerField(help_text="스탬프를 적립한 고객 수 (템플릿별로 센 값의 합)")
+
+
+class DailyStatsSeriesItemSerializer(DailyStatsSerializer):
+    date = serializers.DateField()
+
+
+class TemplateStatsTotalSerializer(DailyStatsSerializer):
+    template_id = serializers.IntegerField()
+
+
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            "예시",
+            {
+                "start": "2025-08-01",
+                "end": "2025-08-02",
+                "series": [
+                    {"date": "2025-08-01", "coupons_issued": 3, "stamps_earned": 10, "completions": 1, "unique_customers": 8},
+                    {"date": "2025-08-02", "coupons_issued": 0, "stamps_earned": 0, "completions": 0, "unique_customers": 0},
+                ],
+                "templates": [
+                    {"template_id": 1, "coupons_issued": 3, "stamps_earned": 10, "completions": 1, "unique_customers": 8},
+                ],
+            }
+        )
+    ]
+)
+class PlaceStatsResponseSerializer(serializers.Serializer):
+    """
+    점주 통계 응답입니다.
+    """
+
+    start = serializers.DateField()
+    end = serializers.DateField()
+    series = DailyStatsSeriesItemSerializer(many=True, help_text="날짜별 통계 (기간의 모든 날짜)")
+    templates = TemplateStatsTotalSerializer(many=True, help_text="쿠폰 템플릿별 기간 합계")
+
+
 # -------------------------- 스탬프 적립 ----------------------------------
 @extend_schema_serializer(
     examples=[
@@ -24,6 +216,9 @@ class StampCreateRequestSerializer(serializers.ModelSerializer):
     스탬프를 생성(적립)하는 데에 사용되는 시리얼라이저입니다. 입력받은 영수증 번호를 바탕으로 스탬프를 생성합니다.
     """
 
+    # 영수증은 쿠폰의 가게를 알아야 조회할 수 있으므로, PrimaryKeyRelatedField 대신 번호만 받아서 validate에서 조회합니다.
+    receipt = serializers.CharField(max_length=30, help_text="적립할 영수증 번호입니다.")
+
     def validate(self, attrs) -> dict:
         """
         쿠폰 확인, 영수증 확인을 거쳐 스탬프 적립의 유효성을 검증합니다.
@@ -32,13 +227,18 @@ class StampCreateRequestSerializer(serializers.ModelSerializer):
         """
         
         # 쿠폰 확인
-        coupon_id = self.context['coupon_id']
-        coupon = Coupon.objects.get(id=coupon_id)
+        # 뷰의 권한 확인(IsMyCoupon)에서 조회한 쿠폰이 있으면 다시 조회하지 않습니다.
+        coupon = self.context.get('coupon') or get_or_load(
+            Coupon, self.context['coupon_id'],
+            lambda: Coupon.objects.select_related('original_template__reward_info').get(id=self.context['coupon_id']))
         original_template = coupon.original_template
 
         # 1. 쿠폰이 완성된 쿠폰인지 확인합니다.
-        if hasattr(coupon, 'stamps') and \
-        (coupon.stamps.count() >= original_template.reward_info.amount):
+        # 쿠폰을 조회할 때 스탬프 수를 어노테이션했으면(with_stamp_counts) 다시 세지 않습니다.
+        stamp_counts = getattr(coupon, 'stamp_counts', None)
+        if stamp_counts is None:
+            stamp_counts = coupon.stamps.count()
+        if stamp_counts >= original_template.reward_info.amount:
             raise serializers.ValidationError("쿠폰이 이미 완성되었습니다.")
 
         # 2. 쿠폰의 유효기간이 경과하지 않았는지 확인합니다.
@@ -46,16 +246,22 @@ class StampCreateRequestSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("쿠폰의 유효기간이 지났습니다.")
 
         # 영수증 확인
-        receipt = attrs.get("receipt")
-
-        # 1. 영수증 번호가 등록되어 있는 영수증인지 확인합니다.
+        # 영수증 번호(기본 키)와 가게로 한 번에 조회하고, 발급된 스탬프도 함께 가져옵니다.
+        # 가게 정보가 없는 예전 영수증은 어느 가게의 것인지 알 수 없으므로 적립할 수 없습니다.
+        receipt = (Receipt.objects
+                   .select_related("stamp")
+                   .filter(place_id=original_template.place_id, receipt_number=attrs.get("receipt"))
+                   .first())
+
+        # 1. 영수증 번호가 쿠폰의 가게에 등록되어 있는 영수증인지 확인합니다.
         if not receipt:
-            raise serializers.ValidationError("DB에 등록되지 않은 영수증 번호입니다.")
+            raise serializers.ValidationError("이 가게에 등록되지 않은 영수증 번호입니다.")
         
         # 2. 영수증 번호에 해당하는 스탬프가 이미 등록되어 있는지 확인합니다.
         if hasattr(receipt, "stamp"):
             raise serializers.ValidationError("이미 스탬프가 발급된 영수증 번호입니다.")
 
+        attrs["receipt"] = receipt
         return super().validate(attrs)
 
     def create(self, validated_data) -> Stamp:
@@ -63,10 +269,12 @@ class StampCreateRequestSerializer(serializers.ModelSerializer):
         유효성 검증을 통과한 영수증 번호를 바탕으로 쿠폰 id와 유저를 바탕으로 스탬프 인스턴스를 생성하고 돌려줍니다.
         """
         receipt = validated_data.pop("receipt")
-        coupon_id = self.context["coupon_id"]
         user = self.context["request"].user
 
-        return Stamp.objects.create(receipt=receipt, coupon_id=coupon_id, customer=user)
+        coupon = self.context.get("coupon")
+        if coupon:
+            return Stamp.objects.create(receipt=receipt, coupon=coupon, customer=user)
+        return Stamp.objects.create(receipt=receipt, coupon_id=self.context["coupon_id"], customer=user)
 
     class Meta:
         model = Stamp
@@ -84,19 +292,25 @@ class StampCreateResponseSerializer(serializers.ModelSerializer):
 
     current_stamps = serializers.SerializerMethodField()
     is_completed = serializers.SerializerMethodField()
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 쿠폰 id -> 스탬프 개수. current_stamps와 is_completed가 함께 사용하고, 목록에서는 같은 쿠폰의 스탬프들이 공유합니다.
+        self.stamp_counts: dict[int, int] = {}
+
     def get_current_stamps(self, obj: Stamp) -> int:
         """
         스탬프 적립 후, 이 쿠폰의 스탬프 개수입니다.
         """
-        coupon_id = self.context['coupon_id']
-        return Coupon.objects.get(id=coupon_id).stamps.count()
+        if obj.coupon_id not in self.stamp_counts:
+            self.stamp_counts[obj.coupon_id] = Stamp.objects.filter(coupon_id=obj.coupon_id).count()
+        return self.stamp_counts[obj.coupon_id]
     
     def get_is_completed(self, obj: Stamp) -> bool:
         """
         스탬프 적립 후, 이 쿠폰이 완성되었는지를 의미합니다.
         """
-        return self.get_current_stamps(obj) >= obj.coupon.original_template.reward_info.amount
+        return self.get_current_stamps(obj) >= related(obj, 'coupon').original_template.reward_info.amount
     
     class Meta:
         model = Stamp
@@ -161,6 +375,7 @@ class RewardsInfoDetailResponseSerializer(serializers.ModelSerializer):
             "예시", 
             {
                 "image_url": "(이미지 파일 URL)", 
+                "thumbnail_url": "(썸네일 이미지 URL)",
                 "name": "매머드 커피", 
                 "lat": "37.21412582140", 
                 "lng": "127.3432032904"
@@ -175,9 +390,24 @@ class PlaceListResponseSerializer(serializers.ModelSerializer):
     목록과 지도 겸용으로 설계되었습니다.
     """
 
+    image_url = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
+
+    def get_image_url(self, obj: Place) -> str:
+        """
+        가게 이미지 URL입니다. 점주가 올린 이미지면 스토리지의 원본 URL입니다.
+        """
+        return place_image_url(obj.image_url, obj.thumbnails)
+
+    def get_thumbnail_url(self, obj: Place) -> str:
+        """
+        목록에 표시할 가게 썸네일 URL입니다. 업로드한 이미지의 썸네일이 없으면 image_url과 같습니다.
+        """
+        return place_thumbnail_url(obj.image_url, obj.thumbnails)
+
     class Meta:
         model = Place
-        fields = ['image_url', 'name', 'lat', 'lng']
+        fields = ['image_url', 'thumbnail_url', 'name', 'lat', 'lng']
 
 @extend_schema_serializer(
     examples=[
@@ -185,6 +415,7 @@ class PlaceListResponseSerializer(serializers.ModelSerializer):
             "예시",
             {
                 "image_url": "(이미지 파일 URL)",
+                "thumbnail_url": "(썸네일 이미지 URL)",
                 "name": "매머드 커피",
                 "address": "서울 동대문구 이문동 264-223",
                 "opens_at": "08:00",
@@ -203,9 +434,9 @@ class PlaceDetailResponseSerializer(PlaceListResponseSerializer):
     """
 
     address = serializers.SerializerMethodField()
-    opens_at = serializers.TimeField(TIME_FORMAT)
-    closes_at = serializers.TimeField(TIME_FORMAT)
-    last_order = serializers.TimeField(TIME_FORMAT)
+    opens_at = CachedTimeField(TIME_FORMAT)
+    closes_at = CachedTimeField(TIME_FORMAT)
+    last_order = CachedTimeField(TIME_FORMAT)
 
     def get_address(self, obj: Place) -> str:
         """
@@ -217,7 +448,7 @@ class PlaceDetailResponseSerializer(PlaceListResponseSerializer):
 
     class Meta(PlaceListResponseSerializer.Meta):
         fields =  [
-            'image_url', 'name', 'address',
+            'image_url', 'thumbnail_url', 'name', 'address',
             'opens_at', 'closes_at', 'last_order', 'tel', 'lat', 'lng'
         ]
 
@@ -231,6 +462,7 @@ class PlaceDetailResponseSerializer(PlaceListResponseSerializer):
                 "coupon_template_url": "http://127.0.0.1/couponbook/coupon-templates/1/",
                 "place": {
                     "image_url": "(이미지 파일 URL)",
+                    "thumbnail_url": "(썸네일 이미지 URL)",
                     "name": "매머드 커피",
                     "address": "서울 동대문구 이문동 264-223",
                     "opens_at": "08:00",
@@ -267,14 +499,14 @@ class CouponTemplateListSerializer(serializers.ModelSerializer):
         해당 쿠폰 템플릿의 상세 조회 url입니다.
         """
         request = self.context['request']
-        return reverse(
-            'couponbook:coupon-template-detail', kwargs={'coupon_template_id': obj.id}, request=request
-        )
+        return url_template(request, 'couponbook:coupon-template-detail', 'coupon_template_id')(obj.id)
 
     def get_current_n_remaining(self, obj: CouponTemplate) -> int | None:
         """
         현재 기준 남은 선착순 인원 수입니다.
         """
+        if hasattr(obj, 'n_remaining'): # CouponTemplate.objects.with_remaining()으로 미리 계산한 경우
+            return obj.n_remaining
         if obj.first_n_persons and hasattr(obj, 'coupons'):
             return max(0, obj.first_n_persons - obj.coupons.count())
         elif obj.first_n_persons:
@@ -286,6 +518,8 @@ class CouponTemplateListSerializer(serializers.ModelSerializer):
         """
         이미 해당 쿠폰 템플릿으로 생성한 쿠폰을 보유하고 있는지의 여부입니다.
         """
+        if hasattr(obj, 'is_owned'): # CouponTemplate.objects.with_owned_by()로 미리 계산한 경우
+            return obj.is_owned
         if hasattr(obj, 'coupons'):
             return obj.coupons.filter(couponbook__user=self.context['request'].user).exists()
         
@@ -307,6 +541,7 @@ class CouponTemplateListSerializer(serializers.ModelSerializer):
                 "id": 1,
                 "place": {
                     "image_url": "(이미지 파일 URL)",
+                    "thumbnail_url": "(썸네일 이미지 URL)",
                     "name": "매머드 커피",
                     "address": "서울 동대문구 이문동 264-223",
                     "opens_at": "08:00",
@@ -371,6 +606,7 @@ class CouponTemplateCreateSerializer(serializers.ModelSerializer):
                 "coupon_url": "http://127.0.0.1/couponbook/coupons/1/",
                 "place": {
                     "image_url": "(이미지 파일 URL)",
+                    "thumbnail_url": "(썸네일 이미지 URL)",
                     "name": "매머드 커피",
                     "address": "서울 동대문구 이문동 264-223",
                     "opens_at": "08:00",
@@ -427,9 +663,7 @@ class CouponListResponseSerializer(serializers.ModelSerializer):
         개별 쿠폰의 URL입니다.
         """
         request = self.context["request"]
-        return reverse(
-            "couponbook:coupon-detail", kwargs={"coupon_id": obj.id}, request=request
-        )
+        return url_template(request, "couponbook:coupon-detail", "coupon_id")(obj.id)
 
     def get_place(self, obj: Coupon) -> PlaceDetailResponseSerializer:
         """
@@ -454,6 +688,8 @@ class CouponListResponseSerializer(serializers.ModelSerializer):
         """
         해당 쿠폰에 현재 적립되어 있는 스탬프 개수입니다.
         """
+        if hasattr(obj, 'stamp_counts'): # Coupon.objects.with_card()로 미리 계산한 경우
+            return obj.stamp_counts
         stamps = Stamp.objects.filter(coupon=obj)
         return stamps.count()
     
@@ -474,17 +710,16 @@ class CouponListResponseSerializer(serializers.ModelSerializer):
 
         if reward_info:
             max_stamps: int = reward_info.amount
-            current_stamps: int = Stamp.objects.filter(coupon=obj).count()
+            current_stamps: int = self.get_current_stamps(obj)
 
             return max_stamps == current_stamps
         return None
 
     def get_is_expired(self, obj: Coupon) -> bool:
         """
-        해당 쿠폰의 유효기간이 만료되었는지를 의미합니다.
+        해당 쿠폰의 유효기간이 만료되었는지를 의미합니다. sweep_coupon_expiry 명령어가 갱신하는 쿠폰 상태를 사용합니다.
         """
-        valid_until = obj.original_template.valid_until
-        return bool(valid_until and valid_until < now())
+        return obj.status == Coupon.Status.EXPIRED
 
     class Meta:
         model = Coupon
@@ -509,6 +744,7 @@ class CouponListResponseSerializer(serializers.ModelSerializer):
                 "current_stamps": 5,
                 "place": {
                     "image_url": "(이미지 파일 URL)",
+                    "thumbnail_url": "(썸네일 이미지 URL)",
                     "name": "매머드 커피",
                     "address": "서울 동대문구 이문동 264-223",
                     "opens_at": "08:00",
@@ -536,35 +772,41 @@ class CouponDetailResponseSerializer(CouponListResponseSerializer):
         쿠폰 주인의 쿠폰북 인스턴스를 가져옵니다.
 
         특이한 경우 None이 반환될 수 있지만, 정상적인 상황에서는 쿠폰북 인스턴스가 반환되어야 합니다.
+        뷰에서 넘겨준 쿠폰북이나 요청 안에서 이미 조회한 쿠폰북이 있으면 다시 조회하지 않습니다.
         """
-        user = self.context["request"].user
-        couponbook = CouponBook.objects.filter(user=user).first()
-        
-        return couponbook
+        if self.context.get("couponbook") is not None:
+            return self.context["couponbook"]
+
+        couponbook_id = get_own_couponbook_id(self.context["request"].user)
+        if couponbook_id is None:
+            return None
+        return get_or_load(CouponBook, couponbook_id, lambda: CouponBook.objects.filter(id=couponbook_id).first())
+
+    def get_coupon_favorite_id(self, obj: Coupon) -> int | None:
+        """
+        해당 쿠폰의 즐겨찾기 id를 조회합니다. 즐겨찾기에 등록되어 있지 않으면 None입니다.
+
+        쿠폰을 조회할 때 어노테이션했으면(Coupon.objects.with_favorite_id()) 다시 조회하지 않습니다.
+        어노테이션이 없으면 한 번만 조회해서 같은 이름으로 쿠폰에 넣어 둡니다. (is_favorite와 favorite_id가 함께 사용)
+        """
+        if not hasattr(obj, 'favorite_id'):
+            couponbook = self.get_coupon_owner_couponbook(obj)
+            obj.favorite_id = None
+            if hasattr(couponbook, 'favorite_coupons'): # 쿠폰북이 없으면 즐겨찾기 쿠폰들도 없음
+                obj.favorite_id = couponbook.favorite_coupons.filter(coupon=obj).values_list('id', flat=True).first()
+        return obj.favorite_id
 
     def get_is_favorite(self, obj: Coupon) -> bool:
         """
         해당 쿠폰을 즐겨찾기에 등록했는지의 여부입니다.
         """
-        couponbook = self.get_coupon_owner_couponbook(obj)
-
-        if hasattr(couponbook, 'favorite_coupons'):
-            favorite_coupon = couponbook.favorite_coupons.filter(coupon=obj)
-
-            return favorite_coupon.exists()
-        return False # 쿠폰북의 즐겨찾기 쿠폰들이 없기 때문에 무조건 False일 수밖에 없음
+        return self.get_coupon_favorite_id(obj) is not None
     
     def get_favorite_id(self, obj: Coupon) -> int | None:
         """
         해당 쿠폰이 즐겨찾기에 등록되어 있을 때의 즐겨찾기 id입니다. 즐겨찾기 삭제에 사용합니다.
         """
-        if self.get_is_favorite(obj):
-            couponbook = self.get_coupon_owner_couponbook(obj)
-            # get_is_favorite이 True가 반환되려면 favorite_coupons가 존재해야 하기 때문에 여기선 hasattr 사용하지 않아도 됨
-            favorite_coupon_id = couponbook.favorite_coupons.get(coupon=obj).id
-
-            return favorite_coupon_id
-        return None
+        return self.get_coupon_favorite_id(obj)
     
     class Meta(CouponListResponseSerializer.Meta):
         fields = [
@@ -644,11 +886,14 @@ class CouponCreateRequestSerializer(serializers.ModelSerializer):
         OpenApiExample(
             "즐겨찾기 목록 응답 예시",
             {
+                "id": 1,
+                "added_at": "2025-08-20T14:00:00+09:00",
                 "coupon": {
                     "id": 1,
                     "coupon_url": "http://127.0.0.1/couponbook/coupons/1/",
                     "place": {
                         "image_url": "(이미지 파일 URL)",
+                        "thumbnail_url": "(썸네일 이미지 URL)",
                         "name": "매머드 커피",
                         "address": "서울 동대문구 이문동 264-223",
                         "opens_at": "08:00",
@@ -674,13 +919,16 @@ class CouponCreateRequestSerializer(serializers.ModelSerializer):
 class FavoriteCouponListResponseSerializer(serializers.ModelSerializer):
     """
     즐겨찾기 등록한 쿠폰을 조회하는 응답에 사용되는 시리얼라이저입니다.
+
+    쿠폰 카드 전체를 포함하므로 클라이언트가 즐겨찾기마다 단일 쿠폰 조회를 다시 요청할 필요가 없습니다.
+    `id`는 즐겨찾기 id로, 즐겨찾기 삭제에 사용합니다.
     """
 
     coupon = CouponListResponseSerializer()
 
     class Meta:
         model = FavoriteCoupon
-        fields = ['coupon']
+        fields = ['id', 'added_at', 'coupon']
 
 @extend_schema_serializer(
     examples=[
@@ -761,8 +1009,11 @@ class FavoriteCouponCreateResponseSerializer(serializers.ModelSerializer):
             {
                 "id": 1,
                 "favorite_counts": 1,
-                "coupon_counts": 1,
-                "stamp_counts": 1,
+                "coupon_counts": 3,
+                "active_counts": 1,
+                "completed_counts": 1,
+                "expired_counts": 1,
+                "stamp_counts": 12,
                 "user": 1,
             },
         )
@@ -771,33 +1022,16 @@ class FavoriteCouponCreateResponseSerializer(serializers.ModelSerializer):
 class CouponBookDetailResponseSerializer(serializers.ModelSerializer):
     """
     쿠폰북을 조회하는 응답에 사용되는 시리얼라이저입니다.
-    """
-
-    favorite_counts = serializers.SerializerMethodField()
-    coupon_counts = serializers.SerializerMethodField()
-    stamp_counts = serializers.SerializerMethodField()
-
-    def get_favorite_counts(self, obj: CouponBook) -> int:
-        """
-        즐겨찾기한 쿠폰의 개수입니다.
-        """
-        coupons = FavoriteCoupon.objects.filter(couponbook=obj)
-        return coupons.count()
 
-    def get_coupon_counts(self, obj: CouponBook) -> int:
-        """
-        쿠폰북에 등록한 쿠폰의 개수입니다.
-        """
-        coupons = Coupon.objects.filter(couponbook=obj)
-        return coupons.count()
+    개수들은 `CouponBook.objects.with_summary()`로 조회 쿼리에서 함께 계산한 값을 사용합니다.
+    """
 
-    def get_stamp_counts(self, obj: CouponBook) -> int:
-        """
-        지금까지 적립한 스탬프의 개수입니다.
-        """
-        user = self.context["request"].user
-        stamps = Stamp.objects.filter(customer=user)
-        return stamps.count()
+    favorite_counts = serializers.IntegerField(read_only=True, help_text="즐겨찾기한 쿠폰의 개수입니다.")
+    coupon_counts = serializers.IntegerField(read_only=True, help_text="쿠폰북에 등록한 쿠폰의 개수입니다.")
+    active_counts = serializers.IntegerField(read_only=True, help_text="사용 중인(완성하지 않았고 만료되지 않은) 쿠폰의 개수입니다.")
+    completed_counts = serializers.IntegerField(read_only=True, help_text="스탬프를 모두 모은 쿠폰의 개수입니다.")
+    expired_counts = serializers.IntegerField(read_only=True, help_text="완성하지 못하고 만료된 쿠폰의 개수입니다.")
+    stamp_counts = serializers.IntegerField(read_only=True, help_text="지금까지 적립한 스탬프의 개수입니다.")
 
     class Meta:
         model = CouponBook
@@ -0,0 +1,28 @@
+from django.db.models.signals import post_save
+from django.dispatch import Signal, receiver
+
+from .models import Coupon, Stamp
+from .stats.utils import record_coupon_issued, record_stamp_earned
+
+# 유효기간이 곧 끝나는 쿠폰들이 있을 때 sweep_coupon_expiry 명령어가 보냅니다.
+# 수신자는 coupons(Coupon 리스트, original_template과 couponbook을 미리 불러옴) 인자를 받습니다.
+# 쿠폰마다 한 번만 보내며, 푸시 알림 등은 이 시그널에 연결하면 됩니다.
+coupon_expiring_soon = Signal()
+
+
+@receiver(post_save, sender=Coupon)
+def update_stats_on_coupon_issued(sender, instance: Coupon, created: bool, **kwargs):
+    """
+    쿠폰이 발급되면 쿠폰 템플릿의 일별 통계(TemplateDailyStats)를 갱신합니다.
+    """
+    if created:
+        record_coupon_issued(instance)
+
+
+@receiver(post_save, sender=Stamp)
+def update_stats_on_stamp_earned(sender, instance: Stamp, created: bool, **kwargs):
+    """
+    스탬프가 적립되면 쿠폰 템플릿의 일별 통계(TemplateDailyStats)를 갱신합니다.
+    """
+    if created:
+        record_stamp_earned(instance)
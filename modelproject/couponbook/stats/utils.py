@@ -0,0 +1,200 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+from couponbook.models import Coupon, Stamp, TemplateDailyStats
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import RowNumber
+from django.db.models.expressions import Window
+from django.utils.timezone import localdate, make_aware
+
+STAT_FIELDS = ('coupons_issued', 'stamps_earned', 'completions', 'unique_customers')
+
+
+def day_bounds(day: date) -> tuple[datetime, datetime]:
+    """
+    현재 타임존(TIME_ZONE) 기준으로 하루의 시작 시각과 다음 날의 시작 시각을 반환합니다.
+    """
+    start = make_aware(datetime.combine(day, time.min))
+    return start, make_aware(datetime.combine(day + timedelta(days=1), time.min))
+
+
+# ---- 증분 갱신 (시그널) ----
+def increment_daily_stats(template_id: int, day: date, **deltas: int):
+    """
+    (템플릿, 날짜) 롤업 행의 통계 값들을 더합니다. 행이 없으면 만듭니다.
+
+    UPDATE ... SET field = field + n으로 더하므로, 여러 요청이 동시에 갱신해도 값을 잃어버리지 않습니다.
+    """
+
+    deltas = {field: n for field, n in deltas.items() if n}
+    if not deltas:
+        return
+
+    rows = TemplateDailyStats.objects.filter(template_id=template_id, date=day)
+    updates = {field: F(field) + n for field, n in deltas.items()}
+    if rows.update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            TemplateDailyStats.objects.create(template_id=template_id, date=day, **deltas)
+    except IntegrityError:  # 다른 요청이 먼저 행을 만든 경우
+        rows.update(**updates)
+
+
+def record_coupon_issued(coupon: Coupon):
+    """
+    쿠폰이 발급되면 발급일의 coupons_issued를 1 더합니다.
+    """
+    increment_daily_stats(coupon.original_template_id, localdate(coupon.saved_at), coupons_issued=1)
+
+
+def record_stamp_earned(stamp: Stamp):
+    """
+    스탬프가 적립되면 적립일의 stamps_earned를 1 더하고, 필요하면 completions와 unique_customers도 더합니다.
+
+    쿠폰은 유저와 템플릿마다 하나이므로, 이 쿠폰에 오늘 적립된 첫 스탬프이면 오늘 처음 온 고객입니다.
+    쿠폰의 스탬프 개수가 리워드 스탬프 개수와 같아지면 쿠폰이 완성된 것입니다.
+    """
+
+    template = stamp.coupon.original_template
+    day = localdate(stamp.created_at)
+    start, end = day_bounds(day)
+    counts = Stamp.objects.filter(coupon_id=stamp.coupon_id).aggregate(
+        total=Count('id'),
+        today=Count('id', filter=Q(created_at__gte=start, created_at__lt=end)),
+    )
+
+    increment_daily_stats(
+        template.id, day,
+        stamps_earned=1,
+        completions=int(counts['total'] == template.reward_info.amount),
+        unique_customers=int(counts['today'] == 1),
+    )
+
+
+# ---- 다시 계산 (배치) ----
+def _datetime_range_filter(field: str, start: date | None, end: date | None) -> Q:
+    q = Q()
+    if start:
+        q &= Q(**{f'{field}__gte': day_bounds(start)[0]})
+    if end:
+        q &= Q(**{f'{field}__lt': day_bounds(end)[1]})
+    return q
+
+
+def _iter_values(queryset, fields: tuple[str, ...], batch_size: int):
+    """
+    `(id, *fields)` 튜플을 id 순서로 `batch_size`개씩 조회해서 돌려줍니다.
+    (`.iterator()`는 MySQL 드라이버가 결과 전체를 클라이언트에 받아 두므로 사용하지 않습니다.)
+    """
+    queryset = queryset.order_by('id').values_list('id', *fields)
+    last_id = None
+    while True:
+        rows = list((queryset if last_id is None else queryset.filter(id__gt=last_id))[:batch_size])
+        yield from rows
+        if len(rows) < batch_size:
+            break
+        last_id = rows[-1][0]
+
+
+def rebuild_daily_stats(start: date | None = None, end: date | None = None,
+                        template_ids: list[int] | None = None, batch_size: int = 1_000) -> int:
+    """
+    쿠폰과 스탬프를 집계해서 기간(start~end, 양 끝 포함) 안의 롤업을 다시 만들고, 만든 행 수를 반환합니다.
+
+    시그널이 누락되었거나(bulk_create, 관리자 페이지의 일괄 삭제 등) 롤업을 처음 만들 때 사용합니다.
+    기간을 지정하지 않으면 전체 기간을 다시 만듭니다.
+
+    날짜는 DB의 TruncDate 대신 파이썬(localdate)에서 나눕니다. MySQL에 타임존 테이블이 없으면
+    CONVERT_TZ가 NULL을 돌려주어 날짜가 없는 행이 생기기 때문입니다.
+    """
+
+    template_filter = Q(original_template_id__in=template_ids) if template_ids else Q()
+    stamp_template_filter = Q(coupon__original_template_id__in=template_ids) if template_ids else Q()
+    rows: dict[tuple[int, date], dict[str, int]] = {}
+
+    def row(template_id: int, day: date) -> dict[str, int]:
+        return rows.setdefault((template_id, day), dict.fromkeys(STAT_FIELDS, 0))
+
+    # 발급된 쿠폰 수
+    coupons = Coupon.objects.filter(_datetime_range_filter('saved_at', start, end), template_filter)
+    for _, template_id, saved_at in _iter_values(coupons, ('original_template_id', 'saved_at'), batch_size):
+        row(template_id, localdate(saved_at))['coupons_issued'] += 1
+
+    # 적립된 스탬프 수, 스탬프를 적립한 고객 수
+    stamps_in_range = Stamp.objects.filter(_datetime_range_filter('created_at', start, end), stamp_template_filter)
+    customers: dict[tuple[int, date], set[int]] = {}
+    stamp_fields = ('coupon__original_template_id', 'created_at', 'customer_id')
+    for _, template_id, created_at, customer_id in _iter_values(stamps_in_range, stamp_fields, batch_size):
+        day = localdate(created_at)
+        row(template_id, day)['stamps_earned'] += 1
+        customers.setdefault((template_id, day), set()).add(customer_id)
+    for key, ids in customers.items():
+        rows[key]['unique_customers'] = len(ids)
+
+    # 완성된 쿠폰 수: 쿠폰의 n번째(리워드 스탬프 개수) 스탬프가 적립된 날에 완성된 것으로 봅니다.
+    # 순번은 쿠폰의 전체 스탬프에서 매겨야 하므로, 기간 조건은 순번을 매긴 후에 적용합니다.
+    completing_stamps = (Stamp.objects
+                         .filter(coupon_id__in=stamps_in_range.values('coupon_id'))
+                         .annotate(rank=Window(RowNumber(), partition_by=F('coupon_id'),
+                                               order_by=[F('created_at').asc(), F('id').asc()]))
+                         .filter(rank=F('coupon__original_template__reward_info__amount'))
+                         .values_list('coupon__original_template_id', 'created_at'))
+    for template_id, created_at in completing_stamps:
+        day = localdate(created_at)
+        if (start is None or day >= start) and (end is None or day <= end):
+            row(template_id, day)['completions'] += 1
+
+    with transaction.atomic():
+        existing = TemplateDailyStats.objects.all()
+        if start:
+            existing = existing.filter(date__gte=start)
+        if end:
+            existing = existing.filter(date__lte=end)
+        if template_ids:
+            existing = existing.filter(template_id__in=template_ids)
+        existing.delete()
+        TemplateDailyStats.objects.bulk_create(
+            [TemplateDailyStats(template_id=template_id, date=day, **stats)
+             for (template_id, day), stats in rows.items()],
+            batch_size=batch_size,
+        )
+
+    return len(rows)
+
+
+# ---- 조회 (점주 통계 API) ----
+@dataclass
+class PlaceStats:
+    series: list[dict]  # 날짜별 통계 (기간의 모든 날짜, 없는 날은 0)
+    templates: list[dict]  # 템플릿별 기간 합계
+
+
+def get_place_stats(place_owner_id: int, start: date, end: date, template_id: int | None = None) -> PlaceStats:
+    """
+    점주의 가게 템플릿들의 기간(start~end, 양 끝 포함) 통계를 롤업 테이블만 한 번 조회해서 만듭니다.
+
+    날짜별 통계는 템플릿들의 합계입니다. 여러 템플릿에 적립한 고객은 unique_customers에 템플릿마다 세어집니다.
+    """
+
+    rollups = TemplateDailyStats.objects.filter(template__place__owner_id=place_owner_id, date__range=(start, end))
+    if template_id is not None:
+        rollups = rollups.filter(template_id=template_id)
+    rollups = rollups.values('template_id', 'date').annotate(**{field: Sum(field) for field in STAT_FIELDS})
+
+    by_date: dict[date, dict[str, int]] = {}
+    by_template: dict[int, dict[str, int]] = {}
+    for item in rollups:
+        daily = by_date.setdefault(item['date'], dict.fromkeys(STAT_FIELDS, 0))
+        totals = by_template.setdefault(item['template_id'], dict.fromkeys(STAT_FIELDS, 0))
+        for field in STAT_FIELDS:
+            daily[field] += item[field]
+            totals[field] += item[field]
+
+    series = []
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        series.append({'date': day, **by_date.get(day, dict.fromkeys(STAT_FIELDS, 0))})
+    templates = [{'template_id': template_id, **totals} for template_id, totals in sorted(by_template.items())]
+    return PlaceStats(series, templates)
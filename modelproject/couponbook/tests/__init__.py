@@ -1,3 +1,13 @@
 from .apitests import *
 from .modeltests import *
-from .curationtests import *
\ No newline at end of file
+from .curationtests import *
+from .asynctests import *
+from .benchmarktests import *
+from .receipttests import *
+from .statstests import *
+from .exporttests import *
+from .expirytests import *
+from .templatetests import *
+from .couponbooktests import *
+from .fastpathtests import *
+from .imagetests import *
\ No newline at end of file
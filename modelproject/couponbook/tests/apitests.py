@@ -169,6 +169,36 @@ class FavoriteCouponTestCase(APITestCase):
         r = self.client.post('/couponbook/couponbooks/2/favorites/', {'coupon': 1})
         self.assertEqual(r.status_code, 403, "타인의 쿠폰을 어떻게 즐겨찾기에 등록한걸까요..")
 
+    @print_success_message("남의 즐겨찾기 쿠폰을 삭제할 수 없는지 테스트")
+    def test_delete_others_favorite_coupon(self):
+        """
+        본인의 쿠폰북에 등록된 즐겨찾기 쿠폰만 삭제할 수 있는지 테스트하는 테스트 메소드입니다.
+        """
+
+        # 유저 1의 즐겨찾기 쿠폰 등록
+        r = self.client.post('/couponbook/couponbooks/1/favorites/', {'coupon': 1})
+        self.assertEqual(r.status_code, 201)
+        favorite_id = r.json()['id']
+
+        # 유저 2가 유저 1의 즐겨찾기 쿠폰 삭제 시도
+        user2 = User.objects.create(username='test2', password='1234')
+        self.client.force_authenticate(user=user2)
+        r = self.client.delete(f'/couponbook/own-couponbook/favorites/{favorite_id}/')
+        self.assertEqual(r.status_code, 403, "남의 즐겨찾기 쿠폰이 삭제되었습니다!")
+        self.assertTrue(FavoriteCoupon.objects.filter(id=favorite_id).exists())
+
+    @print_success_message("존재하지 않는 쿠폰, 쿠폰북, 즐겨찾기에 404가 반환되는지 테스트")
+    def test_missing_ids_return_404(self):
+        """
+        존재하지 않는 id로 요청하면 500이 아니라 404가 반환되는지 테스트하는 테스트 메소드입니다.
+        """
+
+        self.assertEqual(self.client.get('/couponbook/coupons/999/').status_code, 404)
+        self.assertEqual(self.client.post('/couponbook/coupons/999/stamps/', {'receipt': '00000000'}).status_code, 404)
+        self.assertEqual(self.client.get('/couponbook/couponbooks/999/coupons/').status_code, 404)
+        self.assertEqual(self.client.post('/couponbook/couponbooks/1/favorites/', {'coupon': 999}).status_code, 404)
+        self.assertEqual(self.client.delete('/couponbook/own-couponbook/favorites/999/').status_code, 404)
+
 class ResponseTestCase(APITestCase):
     """
     필요한 데이터를 반환하고 있는지 테스트하는 테스트 케이스입니다.
@@ -227,9 +257,9 @@ class ResponseTestCase(APITestCase):
         }
         RewardsInfo.objects.create(**reward_info_dict)
 
-        # 영수증 생성
+        # 영수증 생성 (스탬프는 영수증을 등록한 가게의 쿠폰에만 적립됩니다.)
         for i in range(3):
-            Receipt.objects.create(receipt_number=f'{i:08d}')
+            Receipt.objects.create(receipt_number=f'{i:08d}', place=place)
 
         # 유저 생성 및 로그인
         user = User.objects.create(username='test', password='1234')
@@ -375,11 +405,11 @@ class StampTestCase(APITestCase):
             'tel': '02-xxxx-xxxx',
             'owner': None,
         }
-        Place.objects.create(**place_dict)
+        place = Place.objects.create(**place_dict)
 
-        # 영수증 생성
+        # 영수증 생성 (스탬프는 영수증을 등록한 가게의 쿠폰에만 적립됩니다.)
         for i in range(3):
-            Receipt.objects.create(receipt_number=f'{i:08d}')
+            Receipt.objects.create(receipt_number=f'{i:08d}', place=place)
 
         # 유저 생성 및 로그인
         user = User.objects.create(username='test', password='1234')
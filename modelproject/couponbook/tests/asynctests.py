@@ -0,0 +1,109 @@
+import asyncio
+from json import dumps
+from time import perf_counter
+from unittest.mock import patch
+
+from accounts.models import User
+from couponbook.curation.utils import AICurator
+from couponbook.models import *
+from django.test import TestCase
+from django.utils.timezone import now
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .decorators import print_success_message
+
+# 비동기 뷰(ASGI) 관련 테스트케이스
+
+SLOW_UPSTREAM_SECONDS = 0.5  # 느린 외부 API를 흉내내는 지연 시간
+CONCURRENT_REQUESTS = 5
+
+
+class SlowGeminiResponse:
+    """
+    제미나이 응답을 흉내내는 객체입니다. `text` 속성만 사용합니다.
+    """
+
+    def __init__(self, coupon_template_ids: list[int]):
+        self.text = dumps({'coupon_template_ids': coupon_template_ids})
+
+
+async def slow_agenerate_response(self, curation_contents):
+    """
+    제미나이 대신 일정 시간 동안 기다린 후 빈 추천 결과를 돌려주는 느린 업스트림 스텁입니다.
+    """
+
+    await asyncio.sleep(SLOW_UPSTREAM_SECONDS)
+    return SlowGeminiResponse([])
+
+
+class AsyncCurationTestCase(TestCase):
+    """
+    큐레이션 뷰가 외부 API를 기다리는 동안 다른 요청을 막지 않는지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        # 법정동 주소 생성
+        legal_district_dict = {
+            'code_in_law': '1123011000',
+            'province': '서울특별시',
+            'city': '동대문구',
+            'district': '이문동',
+        }
+        legal_district = LegalDistrict.objects.create(**legal_district_dict)
+
+        # 가게 생성
+        place_dict = {
+            'name': '한국외대 서울캠퍼스',
+            'address_district': legal_district,
+            'address_rest': '1234',
+            'image_url': 'aaa.jpg',
+            'opens_at': now().time(),
+            'closes_at': now().time(),
+            'tags': '대학교',
+            'last_order': now().time(),
+            'tel': '02-xxxx-xxxx',
+            'owner': None,
+        }
+        place = Place.objects.create(**place_dict)
+
+        # 쿠폰 템플릿 생성
+        coupon_template = CouponTemplate.objects.create(first_n_persons=10, is_on=True, place=place)
+        RewardsInfo.objects.create(coupon_template=coupon_template, amount=5, reward='대학원 무료')
+
+        # 유저 생성 및 Access 토큰 발급
+        self.user = User.objects.create(username='test', password='1234')
+        self.auth_headers = {'Authorization': f'Bearer {AccessToken.for_user(self.user)}'}
+
+        return super().setUp()
+
+    @print_success_message("비동기 큐레이션 뷰가 느린 외부 API를 동시에 기다리는지 테스트")
+    async def test_concurrent_curation_with_slow_upstream(self):
+        """
+        느린 제미나이 스텁을 사용해 큐레이션 요청을 동시에 보냈을 때,
+        전체 소요 시간이 (요청 수 x 지연 시간)보다 훨씬 짧은지 확인합니다.
+        """
+
+        with patch.object(AICurator, 'agenerate_response', slow_agenerate_response):
+            started_at = perf_counter()
+            responses = await asyncio.gather(*[
+                self.async_client.get('/couponbook/own-couponbook/curation/', headers=self.auth_headers)
+                for _ in range(CONCURRENT_REQUESTS)
+            ])
+            elapsed = perf_counter() - started_at
+
+        for r in responses:
+            self.assertEqual(r.status_code, 200, "큐레이션 요청이 실패했습니다...")
+            self.assertEqual(r.json(), [], "스텁이 돌려준 추천 결과와 다릅니다!")
+
+        # 순차 처리라면 CONCURRENT_REQUESTS * SLOW_UPSTREAM_SECONDS(2.5초) 이상 걸려야 합니다.
+        self.assertLess(elapsed, SLOW_UPSTREAM_SECONDS * 3,
+                        f"외부 API를 기다리는 동안 요청이 직렬화되었습니다. ({elapsed:.2f}초)")
+
+    @print_success_message("비동기 큐레이션 뷰의 인증 테스트")
+    async def test_curation_requires_authentication(self):
+        """
+        토큰 없이 큐레이션을 요청하면 401이 반환되는지 테스트합니다.
+        """
+
+        r = await self.async_client.get('/couponbook/own-couponbook/curation/')
+        self.assertEqual(r.status_code, 401, "로그인하지 않은 유저가 큐레이션을 받았습니다!")
@@ -0,0 +1,109 @@
+from accounts.models import User
+from couponbook.benchmark.runner import (BenchmarkContext, BenchmarkUser,
+                                         check_thresholds, parse_thresholds,
+                                         percentile, stamp)
+from couponbook.benchmark.seed import (BENCHMARK_PREFIX, SeedConfig,
+                                       clear_dataset, seed_dataset)
+from couponbook.models import *
+from django.test import SimpleTestCase, TestCase
+
+from .decorators import print_success_message
+
+# 벤치마크 도구 관련 테스트케이스
+
+
+class BenchmarkSeedTestCase(TestCase):
+    """
+    벤치마크 데이터 생성기를 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.config = SeedConfig(places=3, templates_per_place=2, users=4, coupons_per_user=2,
+                                 stamps_per_coupon=1, spare_receipts=5, batch_size=2)
+        return super().setUp()
+
+    @print_success_message("벤치마크 데이터가 설정한 규모만큼 생성되는지 테스트")
+    def test_seed_dataset(self):
+        counts = seed_dataset(self.config)
+
+        self.assertEqual(counts['places'], 3)
+        self.assertEqual(counts['coupon_templates'], 6)
+        self.assertEqual(counts['users'], 4)
+        self.assertEqual(counts['coupons'], 8)
+        self.assertEqual(counts['stamps'], 8)
+        self.assertEqual(counts['receipts'], 13)
+        self.assertEqual(CouponBook.objects.filter(user__username__startswith=BENCHMARK_PREFIX).count(), 4,
+                         "유저마다 쿠폰북이 생성되지 않았습니다!")
+
+        # 벤치마크 컨텍스트는 생성된 유저와 미사용 영수증만 불러와야 합니다.
+        ctx = BenchmarkContext.load()
+        self.assertEqual(len(ctx.users), 4)
+        self.assertEqual(sum(len(receipts) for receipts in ctx.spare_receipts.values()), 5)
+        for place_id, receipts in ctx.spare_receipts.items():
+            self.assertEqual(Receipt.objects.filter(receipt_number__in=receipts, place_id=place_id).count(), len(receipts))
+        self.assertTrue(all(place_id in ctx.spare_receipts for place_id in ctx.coupon_places.values()),
+                        "쿠폰의 가게에 미사용 영수증이 없습니다!")
+        self.assertIsNotNone(ctx.staff_token, "내보내기 시나리오용 스태프 유저가 없습니다!")
+        self.assertTrue(all(len(user.coupon_ids) == 2 for user in ctx.users))
+
+    @print_success_message("벤치마크 데이터만 삭제되는지 테스트")
+    def test_clear_dataset(self):
+        User.objects.create(username='test', password='1234')
+        seed_dataset(self.config)
+        clear_dataset()
+
+        self.assertFalse(User.objects.filter(username__startswith=BENCHMARK_PREFIX).exists())
+        self.assertFalse(Receipt.objects.exists())
+        self.assertTrue(User.objects.filter(username='test').exists(), "벤치마크 데이터가 아닌 유저가 삭제되었습니다!")
+
+
+class BenchmarkMetricTestCase(SimpleTestCase):
+    """
+    벤치마크 결과 계산과 임계값 검사를 테스트하는 테스트 케이스입니다.
+    """
+
+    @print_success_message("백분위수 계산 테스트")
+    def test_percentile(self):
+        values = [0.1, 0.2, 0.3, 0.4, 0.5]
+
+        self.assertAlmostEqual(percentile(values, 50), 0.3)
+        self.assertAlmostEqual(percentile(values, 95), 0.48)
+        self.assertAlmostEqual(percentile(values, 100), 0.5)
+        self.assertEqual(percentile([], 99), 0.0)
+
+    @print_success_message("영수증은 쿠폰의 가게에서 겹치지 않게 순서대로 쓰고, 쿠폰이 없는 유저는 스탬프 시나리오에서 건너뛰는지 테스트")
+    def test_context_counters(self):
+        users = [BenchmarkUser('a', 'token-a', 1, []), BenchmarkUser('b', 'token-b', 2, [10, 11])]
+        ctx = BenchmarkContext(users, {1: ['r0', 'r2'], 2: ['r1']}, coupon_places={10: 1, 11: 2})
+
+        ctx.next_user()
+        requests = [stamp(ctx) for _ in range(3)]
+        self.assertEqual([request.body['receipt'] for request in requests], ['r0', 'r1', 'r2'])
+        self.assertEqual([request.path for request in requests],
+                         [f'/couponbook/coupons/{i}/stamps/' for i in (10, 11, 10)])
+        self.assertTrue(all(request.token == 'token-b' for request in requests))
+        with self.assertRaises(RuntimeError):
+            ctx.next_receipt(11)
+
+        with self.assertRaises(RuntimeError):
+            stamp(BenchmarkContext(users[:1], {1: ['r0']}))
+
+    @print_success_message("임계값 파싱 및 검사 테스트")
+    def test_thresholds(self):
+        thresholds = parse_thresholds(['catalogue.p95=200', 'catalogue.rps=50', 'stamp.queries=10',
+                                       'export-stamps.rows_per_s=10000'])
+        summaries = {
+            'catalogue': {'p95': 250.0, 'rps': 80.0, 'queries': 3},
+            'stamp': {'p95': 10.0, 'rps': 10.0, 'queries': 10},
+            'export-stamps': {'rows_per_s': 5000.0},
+        }
+
+        failures = check_thresholds(summaries, thresholds)
+        self.assertEqual(len(failures), 2)
+        self.assertTrue(failures[0].startswith('catalogue.p95'))
+        self.assertTrue(failures[1].startswith('export-stamps.rows_per_s'), "처리량은 최솟값으로 검사해야 합니다!")
+
+        with self.assertRaises(ValueError):
+            parse_thresholds(['unknown.p95=1'])
+        with self.assertRaises(ValueError):
+            parse_thresholds(['catalogue.p42=1'])
@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+from accounts.models import User
+from couponbook.models import *
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework.test import APITestCase
+
+from .decorators import print_success_message
+from .receipttests import create_place
+
+# 쿠폰북 요약 조회 관련 테스트케이스
+
+
+class CouponBookSummaryTestCase(APITestCase):
+    """
+    쿠폰북 조회 시 개수와 상태별 쿠폰 수가 한 쿼리로 계산되는지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.place = create_place('내 가게')
+        self.user = User.objects.create(username='customer', password='1234')
+        self.couponbook = CouponBook.objects.get(user=self.user)
+        self.client.force_authenticate(user=self.user)
+        return super().setUp()
+
+    def create_coupon(self, amount: int | None, stamps: int, status=Coupon.Status.ACTIVE) -> Coupon:
+        template = CouponTemplate.objects.create(is_on=True, place=self.place)
+        if amount is not None:
+            RewardsInfo.objects.create(coupon_template=template, amount=amount, reward='아메리카노 1잔 무료')
+        coupon = Coupon.objects.create(couponbook=self.couponbook, original_template=template)
+        for i in range(stamps):
+            receipt = Receipt.objects.create(receipt_number=f'{coupon.id}-{i}', place=self.place)
+            Stamp.objects.create(coupon=coupon, receipt=receipt, customer=self.user)
+        Coupon.objects.filter(id=coupon.id).update(status=status)
+        return coupon
+
+    @print_success_message("쿠폰북 요약 정보(상태별 쿠폰 수 포함)가 한 쿼리로 조회되는지 테스트")
+    def test_summary(self):
+        active = self.create_coupon(amount=3, stamps=1)
+        self.create_coupon(amount=None, stamps=0)  # 리워드 정보가 없으면 완성될 수 없습니다.
+        self.create_coupon(amount=2, stamps=2)
+        self.create_coupon(amount=2, stamps=2, status=Coupon.Status.EXPIRED)  # 완성 후 만료되면 완성으로 셉니다.
+        self.create_coupon(amount=5, stamps=1, status=Coupon.Status.EXPIRED)
+        FavoriteCoupon.objects.create(couponbook=self.couponbook, coupon=active)
+
+        with CaptureQueriesContext(connection) as ctx:
+            r = self.client.get(reverse('couponbook:user-own-couponbook'))
+
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(
+            {key: r.data[key] for key in ('favorite_counts', 'coupon_counts', 'active_counts',
+                                          'completed_counts', 'expired_counts', 'stamp_counts')},
+            {'favorite_counts': 1, 'coupon_counts': 5, 'active_counts': 2,
+             'completed_counts': 2, 'expired_counts': 1, 'stamp_counts': 6},
+        )
+
+
+class FavoriteCouponCardTestCase(APITestCase):
+    """
+    즐겨찾기 목록이 쿠폰 카드를 포함하고, 즐겨찾기 수와 관계없이 같은 수의 쿼리로 조회되는지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.place = create_place('내 가게')
+        self.user = User.objects.create(username='customer', password='1234')
+        self.couponbook = CouponBook.objects.get(user=self.user)
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('couponbook:favorite-coupon-list', kwargs={'couponbook_id': self.couponbook.id})
+        return super().setUp()
+
+    def add_favorite(self, stamps: int) -> FavoriteCoupon:
+        template = CouponTemplate.objects.create(valid_until=now() + timedelta(days=10, hours=1),
+                                                 is_on=True, place=self.place)
+        RewardsInfo.objects.create(coupon_template=template, amount=2, reward='아메리카노 1잔 무료')
+        coupon = Coupon.objects.create(couponbook=self.couponbook, original_template=template)
+        for i in range(stamps):
+            receipt = Receipt.objects.create(receipt_number=f'{coupon.id}-{i}', place=self.place)
+            Stamp.objects.create(coupon=coupon, receipt=receipt, customer=self.user)
+        return FavoriteCoupon.objects.create(couponbook=self.couponbook, coupon=coupon)
+
+    def get_favorites(self):
+        with CaptureQueriesContext(connection) as ctx:
+            r = self.client.get(self.url)
+        self.assertEqual(r.status_code, 200)
+        return r.data, len(ctx.captured_queries)
+
+    @print_success_message("즐겨찾기 목록이 쿠폰 카드를 포함하고 쿼리 수가 일정한지 테스트")
+    def test_favorite_cards(self):
+        favorite = self.add_favorite(stamps=2)
+        data, one = self.get_favorites()
+
+        self.assertEqual(data[0]['id'], favorite.id)
+        card = data[0]['coupon']
+        self.assertEqual((card['id'], card['current_stamps'], card['is_completed'], card['is_expired'], card['days_remaining']),
+                         (favorite.coupon_id, 2, True, False, 10))
+        self.assertEqual(card['place']['name'], '내 가게')
+        self.assertEqual(card['reward_info']['amount'], 2)
+
+        for _ in range(3):
+            self.add_favorite(stamps=1)
+        data, many = self.get_favorites()
+        self.assertEqual((len(data), many), (4, one))
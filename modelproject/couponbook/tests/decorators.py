@@ -1,10 +1,22 @@
+from inspect import iscoroutinefunction
+
+
 # 테스트 로그 출력용 데코레이터
 def print_success_message(test_description: str):
     """
     테스트 성공 시 테스트 내용과 함께 성공 메시지를 출력하는 데코레이터입니다.
+
+    async def로 작성된 테스트 메소드에도 사용할 수 있습니다.
     """
 
     def decorator(func):
+        if iscoroutinefunction(func):
+            async def async_wrapper(testcase_instance):
+                await func(testcase_instance)
+                print(f"테스트 성공! <테스트 내용: {test_description}>")
+
+            return async_wrapper
+
         def wrapper(testcase_instance):
             func(testcase_instance)
             print(f"테스트 성공! <테스트 내용: {test_description}>")
@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+from accounts.models import User
+from couponbook.expiry.utils import sweep_coupon_expiry
+from couponbook.models import *
+from couponbook.signals import coupon_expiring_soon
+from django.test import TestCase
+from django.utils.timezone import now
+
+from .decorators import print_success_message
+from .receipttests import create_place
+
+# 쿠폰 만료 처리(sweep_coupon_expiry) 관련 테스트케이스
+
+
+class CouponExpirySweepTestCase(TestCase):
+    """
+    유효기간이 지난 쿠폰 템플릿과 쿠폰의 상태가 갱신되고, 만료 임박 알림이 한 번만 보내지는지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.place = create_place('내 가게')
+        self.user = User.objects.create(username='customer', password='1234')
+        self.couponbook = CouponBook.objects.get(user=self.user)
+
+        self.notified = []
+        coupon_expiring_soon.connect(self.on_expiring_soon)
+        self.addCleanup(coupon_expiring_soon.disconnect, self.on_expiring_soon)
+        return super().setUp()
+
+    def on_expiring_soon(self, sender, coupons, **kwargs):
+        self.notified.extend(coupon.id for coupon in coupons)
+
+    def create_coupon(self, valid_until) -> Coupon:
+        # 이미 유효기간이 지난 템플릿으로는 쿠폰을 발급할 수 없으므로, 발급 후 유효기간을 바꿉니다.
+        template = CouponTemplate.objects.create(valid_until=now() + timedelta(days=30), is_on=True, place=self.place)
+        coupon = Coupon.objects.create(couponbook=self.couponbook, original_template=template)
+        CouponTemplate.objects.filter(id=template.id).update(valid_until=valid_until)
+        return coupon
+
+    @print_success_message("유효기간이 지난 템플릿은 비공개로, 쿠폰은 만료 상태로 바뀌는지 테스트")
+    def test_sweep_expires_coupons(self):
+        expired = self.create_coupon(now() - timedelta(days=1))
+        active = self.create_coupon(now() + timedelta(days=10))
+        unlimited = self.create_coupon(None)
+
+        result = sweep_coupon_expiry(batch_size=1)
+
+        self.assertEqual((result.templates_closed, result.coupons_expired), (1, 1))
+        self.assertFalse(CouponTemplate.objects.get(id=expired.original_template_id).is_on)
+        self.assertEqual(Coupon.objects.get(id=expired.id).status, Coupon.Status.EXPIRED)
+        for coupon in (active, unlimited):
+            self.assertEqual(Coupon.objects.get(id=coupon.id).status, Coupon.Status.ACTIVE)
+        self.assertEqual(list(Coupon.objects.filter(status=Coupon.Status.EXPIRED).values_list('id', flat=True)),
+                         [expired.id])
+
+    @print_success_message("유효기간이 연장된 템플릿과 만료 쿠폰이 다시 게시 중, 사용 중으로 바뀌는지 테스트")
+    def test_sweep_revives_extended_coupons(self):
+        coupon = self.create_coupon(now() - timedelta(days=1))
+        sweep_coupon_expiry()
+
+        CouponTemplate.objects.filter(id=coupon.original_template_id).update(valid_until=now() + timedelta(days=10))
+        result = sweep_coupon_expiry()
+
+        self.assertEqual((result.templates_reopened, result.coupons_revived), (1, 1))
+        self.assertEqual(Coupon.objects.get(id=coupon.id).status, Coupon.Status.ACTIVE)
+        self.assertTrue(CouponTemplate.objects.active().filter(id=coupon.original_template_id).exists(),
+                        "유효기간을 연장한 템플릿이 다시 게시되지 않았습니다!")
+
+    @print_success_message("점주가 비공개로 바꾼 템플릿은 유효기간이 연장되어도 다시 게시되지 않는지 테스트")
+    def test_sweep_keeps_owner_closed_templates(self):
+        coupon = self.create_coupon(now() - timedelta(days=1))
+        CouponTemplate.objects.filter(id=coupon.original_template_id).update(is_on=False)
+        sweep_coupon_expiry()
+
+        CouponTemplate.objects.filter(id=coupon.original_template_id).update(valid_until=now() + timedelta(days=10))
+        result = sweep_coupon_expiry()
+
+        self.assertEqual(result.templates_reopened, 0)
+        self.assertFalse(CouponTemplate.objects.get(id=coupon.original_template_id).is_on)
+
+    @print_success_message("만료 임박 쿠폰에 알림 시그널이 한 번만 보내지는지 테스트")
+    def test_expiring_soon_notified_once(self):
+        soon = self.create_coupon(now() + timedelta(days=1))
+        self.create_coupon(now() + timedelta(days=30))
+
+        first = sweep_coupon_expiry()
+        second = sweep_coupon_expiry()
+
+        self.assertEqual((first.coupons_notified, second.coupons_notified), (1, 0))
+        self.assertEqual(self.notified, [soon.id])
+        self.assertIsNotNone(Coupon.objects.get(id=soon.id).expiry_notified_at)
@@ -0,0 +1,120 @@
+import csv
+import io
+import json
+
+from accounts.models import User
+from couponbook.exports.utils import stream_export
+from couponbook.models import *
+from django.test import TestCase
+from rest_framework.test import APITestCase
+
+from .decorators import print_success_message
+from .receipttests import create_place
+
+# 쿠폰/스탬프 이력 내보내기 관련 테스트케이스
+
+
+def create_history(place: Place, prefix: str, customers: int) -> CouponTemplate:
+    """
+    가게에 쿠폰 템플릿을 만들고, 고객마다 쿠폰 하나와 스탬프 하나를 만듭니다.
+    """
+    template = CouponTemplate.objects.create(first_n_persons=0, is_on=True, place=place)
+    RewardsInfo.objects.create(coupon_template=template, amount=5, reward='아메리카노 1잔 무료')
+    for i in range(customers):
+        user = User.objects.create(username=f'{prefix}-{i}', password='1234')
+        coupon = Coupon.objects.create(couponbook=CouponBook.objects.get(user=user), original_template=template)
+        receipt = Receipt.objects.create(receipt_number=f'{prefix}-{i}', place=place)
+        Stamp.objects.create(coupon=coupon, receipt=receipt, customer=user)
+    return template
+
+
+class ExportAPITestCase(APITestCase):
+    """
+    쿠폰/스탬프 내보내기 API를 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.owner = User.objects.create(username='owner', password='1234', role=User.Role.OWNER)
+        self.place = create_place('내 가게', owner=self.owner)
+        self.other_place = create_place('남의 가게')
+        create_history(self.place, 'mine', 3)
+        create_history(self.other_place, 'others', 2)
+        self.staff = User.objects.create(username='staff', password='1234', is_staff=True)
+        return super().setUp()
+
+    @print_success_message("스태프가 전체 쿠폰을 CSV로 내보내는지 테스트")
+    def test_staff_exports_all_coupons(self):
+        self.client.force_authenticate(self.staff)
+
+        r = self.client.get('/couponbook/exports/coupons/')
+
+        self.assertEqual(r.status_code, 200)
+        self.assertTrue(r.streaming, "스트리밍 응답이 아닙니다!")
+        self.assertIn('attachment; filename="coupons-', r['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(b''.join(r.streaming_content).decode())))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual({row['stamp_count'] for row in rows}, {'1'})
+
+        r = self.client.get('/couponbook/exports/coupons/', {'place': self.other_place.id})
+        self.assertEqual(len(b''.join(r.streaming_content).splitlines()), 1 + 2)
+
+    @print_success_message("점주는 자신의 가게 스탬프만 NDJSON으로 내보내는지 테스트")
+    def test_owner_exports_own_stamps(self):
+        self.client.force_authenticate(self.owner)
+
+        r = self.client.get('/couponbook/exports/stamps/', {'output': 'ndjson'})
+
+        self.assertEqual(r.status_code, 200)
+        self.assertTrue(r['Content-Type'].startswith('application/x-ndjson'))
+        stamps = [json.loads(line) for line in b''.join(r.streaming_content).splitlines()]
+        self.assertEqual(len(stamps), 3)
+        self.assertEqual({stamp['place_id'] for stamp in stamps}, {self.place.id}, "다른 가게의 스탬프가 포함되었습니다!")
+        self.assertEqual(stamps[0]['receipt_number'], 'mine-0')
+
+        r = self.client.get('/couponbook/exports/stamps/', {'place': self.other_place.id})
+        self.assertEqual(r.status_code, 403, "다른 가게의 스탬프를 내보냈습니다!")
+
+    @print_success_message("손님은 내보내기를 할 수 없는지 테스트")
+    def test_customer_forbidden(self):
+        self.client.force_authenticate(User.objects.get(username='mine-0'))
+
+        self.assertEqual(self.client.get('/couponbook/exports/stamps/').status_code, 403)
+
+    @print_success_message("ASGI에서도 스트리밍으로 내보내는지 테스트")
+    async def test_export_asgi(self):
+        await self.async_client.aforce_login(self.staff)
+
+        r = await self.async_client.get('/couponbook/exports/stamps/')
+
+        self.assertEqual(r.status_code, 200)
+        self.assertTrue(r.is_async, "ASGI에서 동기 이터레이터를 사용해 응답 전체를 메모리에 모읍니다!")
+        content = b''.join([chunk async for chunk in r.streaming_content])
+        self.assertEqual(len(content.splitlines()), 1 + 5)
+
+
+class StreamExportTestCase(TestCase):
+    """
+    내보내기 직렬화가 행 수와 관계없이 조금씩 이루어지는지 테스트하는 테스트 케이스입니다.
+    """
+
+    @print_success_message("행을 나누어 읽고 조각으로 내보내는지 테스트")
+    def test_stream_in_chunks(self):
+        create_history(create_place('내 가게'), 'mine', 4)
+
+        # 2개씩 두 번 + 마지막 빈 조각 한 번. 관계는 조인으로 함께 가져옵니다.
+        with self.assertNumQueries(3):
+            chunks = list(stream_export('stamps', 'csv', chunk_size=2, buffer_size=1))
+
+        self.assertEqual(len(chunks), 1 + 4, "한 줄씩 내보내지 않았습니다!")
+        self.assertTrue(all(isinstance(chunk, bytes) for chunk in chunks))
+
+    @print_success_message("조각 경계에서 행이 빠지거나 중복되지 않고 스탬프 수를 세는지 테스트")
+    def test_coupons_in_chunks(self):
+        create_history(create_place('내 가게'), 'mine', 5)
+
+        lines = b''.join(stream_export('coupons', 'csv', chunk_size=2)).decode()
+        rows = list(csv.DictReader(io.StringIO(lines)))
+
+        self.assertEqual([int(row['coupon_id']) for row in rows],
+                         list(Coupon.objects.order_by('id').values_list('id', flat=True)))
+        self.assertEqual({row['stamp_count'] for row in rows}, {'1'})
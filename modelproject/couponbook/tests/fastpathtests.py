@@ -0,0 +1,87 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from accounts.models import User
+from couponbook.models import *
+from django.test import override_settings
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework.test import APITestCase
+
+from .decorators import print_success_message
+from .receipttests import create_place
+
+# 가벼운 직렬화 경로(couponbook.fastpath) 관련 테스트케이스
+
+
+class FastPathTestCase(APITestCase):
+    """
+    가벼운 직렬화 경로의 응답이 기존 시리얼라이저의 응답과 바이트 단위로 같은지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='customer', password='1234')
+        self.couponbook = CouponBook.objects.get(user=self.user)
+        self.client.force_authenticate(user=self.user)
+
+        place = create_place('좌표 있는 가게')
+        Place.objects.filter(id=place.id).update(lat=Decimal('37.597'), lng=Decimal('127.0588'),
+                                                 thumbnails={'160': 'places/1/thumbnails/1-160.webp',
+                                                             '480': 'places/1/thumbnails/1-480.webp'})
+        other_place = create_place('좌표 없는 가게')
+
+        for i, (target, valid_until, amount) in enumerate([
+            (place, now() + timedelta(days=3, hours=1), 2),
+            (place, None, 5),
+            (other_place, now() + timedelta(days=30), 1),
+        ]):
+            template = CouponTemplate.objects.create(valid_until=valid_until, first_n_persons=i * 10,
+                                                     is_on=True, place=target)
+            RewardsInfo.objects.create(coupon_template=template, amount=amount, reward=f'혜택 {i}')
+            if i < 2:
+                coupon = Coupon.objects.create(couponbook=self.couponbook, original_template=template)
+                for n in range(2):
+                    receipt = Receipt.objects.create(receipt_number=f'{i}-{n}', place=target)
+                    Stamp.objects.create(coupon=coupon, receipt=receipt, customer=self.user)
+
+        # 리워드 정보가 없는 템플릿의 쿠폰, 만료된 쿠폰
+        template = CouponTemplate.objects.create(valid_until=now() + timedelta(days=1), is_on=True, place=place)
+        coupon = Coupon.objects.create(couponbook=self.couponbook, original_template=template)
+        CouponTemplate.objects.filter(id=template.id).update(valid_until=now() - timedelta(days=1), is_on=False)
+        Coupon.objects.filter(id=coupon.id).update(status=Coupon.Status.EXPIRED)
+
+        for coupon in Coupon.objects.filter(couponbook=self.couponbook):
+            FavoriteCoupon.objects.create(couponbook=self.couponbook, coupon=coupon)
+        return super().setUp()
+
+    def assert_same_response(self, url: str):
+        fast = self.client.get(url)
+        with override_settings(FAST_READ_SERIALIZERS=False):
+            slow = self.client.get(url)
+
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(fast.content, slow.content)
+        return fast
+
+    @print_success_message("쿠폰 목록의 가벼운 직렬화 응답이 기존 응답과 같은지 테스트")
+    def test_coupon_list(self):
+        url = reverse('couponbook:coupon-list', kwargs={'couponbook_id': self.couponbook.id})
+        r = self.assert_same_response(url)
+        self.assertEqual(len(r.data), 3)
+        self.assert_same_response(url + '?ordering=-stamp_counts&is_expired=false')
+
+    @print_success_message("즐겨찾기 목록의 가벼운 직렬화 응답이 기존 응답과 같은지 테스트")
+    def test_favorite_coupon_list(self):
+        url = reverse('couponbook:favorite-coupon-list', kwargs={'couponbook_id': self.couponbook.id})
+        r = self.assert_same_response(url)
+        self.assertEqual(len(r.data), 3)
+
+    @print_success_message("쿠폰 템플릿 목록의 가벼운 직렬화 응답이 기존 응답과 같은지 테스트")
+    def test_coupon_template_list(self):
+        url = reverse('couponbook:coupon-template-list')
+        r = self.assert_same_response(url)
+        self.assertEqual(len(r.data), 3)
+        self.assert_same_response(url + '?already_own=true')
+
+        self.client.force_authenticate(user=None)
+        self.assert_same_response(url)
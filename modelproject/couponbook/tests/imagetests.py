@@ -0,0 +1,221 @@
+import base64
+import json
+import tempfile
+from importlib.util import find_spec
+from io import BytesIO
+from unittest import mock, skipUnless
+
+from accounts.models import User
+from couponbook.images.utils import generate_thumbnails
+from couponbook.models import *
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .decorators import print_success_message
+from .receipttests import create_place
+
+# 가게 이미지 업로드, 썸네일 관련 테스트케이스
+
+S3_AVAILABLE = find_spec('moto') is not None and find_spec('storages') is not None
+S3_STORAGES = {
+    'default': {
+        'BACKEND': 'utils.storages.CachedPresignedS3Storage',
+        'OPTIONS': {'bucket_name': 'media', 'region_name': 'ap-northeast-2', 'location': 'media',
+                    'access_key': 'test', 'secret_key': 'test'},
+    },
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+def file_system_storages(location: str) -> dict:
+    return {
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage',
+                    'OPTIONS': {'location': location, 'base_url': '/media/'}},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+
+
+def image_bytes(size: tuple[int, int], format: str = 'PNG', mode: str = 'RGB') -> bytes:
+    from PIL import Image
+
+    output = BytesIO()
+    Image.new(mode, size, 'red').save(output, format)
+    return output.getvalue()
+
+
+class PlaceImageUploadTestCase(APITestCase):
+    """
+    가게 이미지 직접 업로드(presigned POST) API를 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.owner = User.objects.create(username='owner', password='1234', role=User.Role.OWNER)
+        self.place = create_place('내 가게', owner=self.owner)
+        self.client.force_authenticate(self.owner)
+        self.url = reverse('couponbook:place-image-upload')
+        return super().setUp()
+
+    def start_s3(self):
+        import boto3
+        from moto import mock_aws
+
+        mock = mock_aws()
+        mock.start()
+        self.addCleanup(mock.stop)
+        boto3.client('s3', region_name='ap-northeast-2').create_bucket(
+            Bucket='media', CreateBucketConfiguration={'LocationConstraint': 'ap-northeast-2'})
+        settings_override = override_settings(STORAGES=S3_STORAGES)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def complete_url(self, upload_id: int) -> str:
+        return reverse('couponbook:place-image-upload-complete', kwargs={'upload_id': upload_id})
+
+    @skipUnless(S3_AVAILABLE, "moto, django-storages가 설치되어 있지 않습니다.")
+    @print_success_message("presigned POST로 S3에 직접 올리고 업로드를 완료할 수 있는지 테스트")
+    def test_direct_upload(self):
+        import requests
+
+        self.start_s3()
+        r = self.client.post(self.url, {'content_type': 'image/png'}, format='json')
+        self.assertEqual(r.status_code, 201)
+        upload = PlaceImageUpload.objects.get(id=r.data['id'])
+        self.assertEqual(upload.status, PlaceImageUpload.Status.PENDING)
+        self.assertEqual(r.data['upload_fields']['key'], f'media/{upload.name}')
+        self.assertTrue(upload.name.startswith(f'places/{self.place.id}/originals/'))
+
+        policy = json.loads(base64.b64decode(r.data['upload_fields']['policy']))
+        self.assertIn({'Content-Type': 'image/png'}, policy['conditions'])
+        self.assertIn(['content-length-range', 1, r.data['max_bytes']], policy['conditions'])
+
+        # 업로드 전에는 완료할 수 없습니다.
+        self.assertEqual(self.client.post(self.complete_url(upload.id)).status_code, 400)
+
+        uploaded = requests.post(r.data['upload_url'], data=r.data['upload_fields'],
+                                 files={'file': ('image.png', b'png-bytes')})
+        self.assertEqual(uploaded.status_code, 204)
+        self.assertTrue(default_storage.exists(upload.name))
+
+        r = self.client.post(self.complete_url(upload.id))
+        self.assertEqual(r.status_code, 202)
+        self.assertEqual(r.data, {'id': upload.id, 'status': 'uploaded'})
+        self.assertEqual(self.client.post(self.complete_url(upload.id)).data['status'], 'uploaded')
+
+    @print_success_message("점주가 아니거나 남의 업로드, 잘못된 형식, S3가 아닌 스토리지를 거부하는지 테스트")
+    def test_rejections(self):
+        self.assertEqual(self.client.post(self.url, {'content_type': 'image/gif'}, format='json').status_code, 400)
+        with tempfile.TemporaryDirectory() as location, override_settings(STORAGES=file_system_storages(location)):
+            self.assertEqual(self.client.post(self.url, {'content_type': 'image/png'}, format='json').status_code, 503)
+
+        other_owner = User.objects.create(username='other', password='1234', role=User.Role.OWNER)
+        upload = PlaceImageUpload.objects.create(place=create_place('남의 가게', owner=other_owner),
+                                                 name='places/x/originals/a.png', content_type='image/png')
+        self.assertEqual(self.client.post(self.complete_url(upload.id)).status_code, 404)
+
+        self.client.force_authenticate(User.objects.create(username='customer', password='1234'))
+        self.assertEqual(self.client.post(self.url, {'content_type': 'image/png'}, format='json').status_code, 403)
+
+
+@skipUnless(find_spec('PIL'), "Pillow가 설치되어 있지 않습니다.")
+class PlaceThumbnailTestCase(APITestCase):
+    """
+    썸네일 생성(generate_thumbnails)과 목록 응답의 thumbnail_url을 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        location = tempfile.TemporaryDirectory()
+        self.addCleanup(location.cleanup)
+        settings_override = override_settings(STORAGES=file_system_storages(location.name),
+                                              PLACE_THUMBNAIL_SIZES=(160, 480), PLACE_THUMBNAIL_LIST_SIZE=480)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.place = create_place('내 가게')
+        return super().setUp()
+
+    def upload(self, content: bytes, name: str = 'original.png') -> PlaceImageUpload:
+        name = default_storage.save(f'places/{self.place.id}/originals/{name}', ContentFile(content))
+        return PlaceImageUpload.objects.create(place=self.place, name=name, content_type='image/png',
+                                               status=PlaceImageUpload.Status.UPLOADED)
+
+    @print_success_message("긴 변 기준 크기별 WebP 썸네일을 만들고 이전 썸네일을 지우는지 테스트")
+    def test_generate_thumbnails(self):
+        from PIL import Image
+
+        first = self.upload(image_bytes((1200, 600)))
+        second = self.upload(image_bytes((100, 300), 'JPEG', 'L'), 'second.jpg')
+        result = generate_thumbnails()
+        self.assertEqual((result.processed, result.failed), (2, 0))
+
+        self.place.refresh_from_db()
+        self.assertEqual(self.place.image_url, second.name, "가게 이미지가 새 원본으로 바뀌지 않았습니다!")
+        self.assertEqual(self.place.thumbnails.pop('original'), second.name)
+        self.assertEqual(set(self.place.thumbnails), {'160', '480'})
+        for size, name in self.place.thumbnails.items():
+            with default_storage.open(name) as f, Image.open(f) as image:
+                self.assertEqual(image.format, 'WEBP')
+                self.assertEqual(max(image.size), min(int(size), 300), "긴 변이 썸네일 크기와 다릅니다!")
+
+        self.assertFalse(default_storage.exists(f'places/{self.place.id}/thumbnails/{first.id}-160.webp'),
+                         "이전 썸네일이 남아 있습니다!")
+        self.assertTrue(default_storage.exists(first.name), "이전 원본은 업로드 기록을 위해 남겨야 합니다!")
+        self.assertEqual(set(PlaceImageUpload.objects.values_list('status', flat=True)), {'ready'})
+        self.assertEqual(generate_thumbnails().processed, 0)
+
+    @print_success_message("이미지가 아니거나 원본이 없으면 실패로 기록하는지 테스트")
+    def test_invalid_images(self):
+        broken = self.upload(b'not an image', 'broken.png')
+        missing = PlaceImageUpload.objects.create(place=self.place, name='places/missing.png',
+                                                  content_type='image/png', status=PlaceImageUpload.Status.UPLOADED)
+        result = generate_thumbnails()
+
+        self.assertEqual((result.processed, result.failed), (0, 2))
+        for upload in (broken, missing):
+            upload.refresh_from_db()
+            self.assertEqual(upload.status, PlaceImageUpload.Status.FAILED)
+            self.assertTrue(upload.error)
+        self.place.refresh_from_db()
+        self.assertEqual(self.place.thumbnails, {})
+
+    @print_success_message("썸네일을 저장하다가 실패하면 먼저 저장한 썸네일을 지우고 가게를 그대로 두는지 테스트")
+    def test_partial_failure_cleanup(self):
+        upload = self.upload(image_bytes((800, 800)))
+        save = default_storage.save
+
+        def failing_save(name, content, **kwargs):
+            if name.endswith('-480.webp'):
+                raise OSError("스토리지 오류")
+            return save(name, content, **kwargs)
+
+        with mock.patch.object(default_storage, 'save', side_effect=failing_save), self.assertRaises(OSError):
+            generate_thumbnails(storage=default_storage)
+
+        self.assertFalse(default_storage.exists(f'places/{self.place.id}/thumbnails/{upload.id}-160.webp'),
+                         "먼저 저장한 썸네일이 남아 있습니다!")
+        self.place.refresh_from_db()
+        self.assertEqual((self.place.image_url, self.place.thumbnails), ('aaa.jpg', {}))
+        upload.refresh_from_db()
+        self.assertEqual(upload.status, PlaceImageUpload.Status.UPLOADED)
+
+    @print_success_message("목록 응답의 thumbnail_url이 목록용 썸네일을 가리키는지 테스트")
+    def test_thumbnail_url_in_list(self):
+        template = CouponTemplate.objects.create(is_on=True, place=self.place)
+        other_template = CouponTemplate.objects.create(is_on=True, place=create_place('남의 가게'))
+        upload = self.upload(image_bytes((800, 800)))
+        generate_thumbnails()
+        self.place.refresh_from_db()
+
+        self.client.force_authenticate(User.objects.create(username='customer', password='1234'))
+        r = self.client.get(reverse('couponbook:coupon-template-list'))
+        places = {item['id']: item['place'] for item in r.data}
+        self.assertEqual(places[template.id]['thumbnail_url'], default_storage.url(self.place.thumbnails['480']))
+        self.assertEqual(places[other_template.id]['thumbnail_url'], 'aaa.jpg')
+        self.assertEqual(places[template.id]['image_url'], default_storage.url(upload.name))
+        self.assertEqual(places[other_template.id]['image_url'], 'aaa.jpg')
+
+        r = self.client.get(reverse('couponbook:coupon-template-detail', args=[template.id]))
+        self.assertEqual(r.data['place']['image_url'], default_storage.url(upload.name),
+                         "목록과 상세의 가게 이미지가 다릅니다!")
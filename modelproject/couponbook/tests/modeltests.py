@@ -103,7 +103,8 @@ class CouponTestCase(TestCase):
 
         # 영수증 생성
         receipt_dict = {
-            'receipt_number': '000000001'
+            'receipt_number': '000000001',
+            'place': original_template.place,
         }
         receipt = Receipt.objects.create(**receipt_dict)
 
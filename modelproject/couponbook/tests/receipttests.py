@@ -0,0 +1,227 @@
+import csv
+import io
+import json
+import tempfile
+from datetime import timedelta
+
+from accounts.models import User
+from couponbook.models import *
+from couponbook.receipts.utils import ingest_receipts, prune_receipts
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils.timezone import now
+from rest_framework.test import APITestCase
+
+from .decorators import print_success_message
+
+# 영수증 대량 등록 관련 테스트케이스
+
+
+def create_place(name: str, owner: User | None = None) -> Place:
+    legal_district, _ = LegalDistrict.objects.get_or_create(
+        code_in_law='1123011000', defaults={'province': '서울특별시', 'city': '동대문구', 'district': '이문동'}
+    )
+    return Place.objects.create(
+        name=name,
+        address_district=legal_district,
+        address_rest='1234',
+        image_url='aaa.jpg',
+        opens_at=now().time(),
+        closes_at=now().time(),
+        last_order=now().time(),
+        tel='02-xxxx-xxxx',
+        owner=owner,
+    )
+
+
+class ReceiptIngestTestCase(TestCase):
+    """
+    영수증 대량 등록 로직을 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.place = create_place('내 가게')
+        self.other_place = create_place('남의 가게')
+        Receipt.objects.create(receipt_number='mine', place=self.place)
+        Receipt.objects.create(receipt_number='others', place=self.other_place)
+        return super().setUp()
+
+    @print_success_message("영수증 번호별 등록 결과가 올바른지 테스트")
+    def test_ingest_statuses(self):
+        result = ingest_receipts(['new-1', ' new-2 ', 'new-1', 'mine', 'others', '', 'x' * 31], self.place.id)
+
+        self.assertEqual([item['status'] for item in result.results],
+                         ['created', 'created', 'duplicate', 'duplicate', 'conflict', 'invalid', 'invalid'])
+        self.assertEqual(result.counts, {'created': 2, 'duplicate': 2, 'conflict': 1, 'invalid': 2})
+        self.assertEqual(set(Receipt.objects.filter(place=self.place).values_list('receipt_number', flat=True)),
+                         {'mine', 'new-1', 'new-2'})
+        self.assertEqual(Receipt.objects.get(receipt_number='others').place, self.other_place,
+                         "다른 가게의 영수증이 덮어써졌습니다!")
+
+    @print_success_message("배치마다 조회 1번, 등록 1번으로 처리하는지 테스트")
+    def test_ingest_in_batches(self):
+        numbers = [f'{i:08d}' for i in range(10)]
+
+        # 배치(4개)마다 기존 번호 조회 + bulk_create (트랜잭션으로 묶지 않습니다.)
+        with self.assertNumQueries(2 * 3):
+            result = ingest_receipts(numbers, self.place.id, batch_size=4)
+
+        self.assertEqual(result.counts['created'], 10)
+        self.assertEqual(Receipt.objects.filter(place=self.place).count(), 11)
+
+    @print_success_message("입력을 읽다가 실패하면 아무것도 등록하지 않는지 테스트")
+    def test_ingest_rolls_back_on_error(self):
+        def numbers():
+            yield from ['fail-1', 'fail-2', 'fail-3']
+            raise ValueError("잘못된 줄")
+
+        with self.assertRaises(ValueError), self.assertNumQueries(0):
+            ingest_receipts(numbers(), self.place.id, batch_size=2)
+
+        self.assertFalse(Receipt.objects.filter(receipt_number__startswith='fail-').exists(),
+                         "실패한 등록의 앞선 배치가 남아 있습니다!")
+
+    @print_success_message("관리 명령어로 CSV 파일을 등록하는지 테스트")
+    def test_import_command(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', encoding='utf-8') as file:
+            file.write("receipt_number\nfile-1\nfile-2\nmine\n")
+            file.flush()
+            stdout = io.StringIO()
+            call_command('import_receipts', file.name, place=self.place.id, stdout=stdout)
+
+        self.assertIn('created 2', stdout.getvalue())
+        self.assertTrue(Receipt.objects.filter(receipt_number='file-2', place=self.place).exists())
+
+
+class ReceiptBulkCreateAPITestCase(APITestCase):
+    """
+    점주의 영수증 대량 등록 API를 테스트하는 테스트 케이스입니다.
+    """
+
+    url = '/couponbook/own-place/receipts/'
+
+    def setUp(self):
+        self.owner = User.objects.create(username='owner', password='1234', role=User.Role.OWNER)
+        self.place = create_place('내 가게', owner=self.owner)
+        self.client.force_authenticate(self.owner)
+        return super().setUp()
+
+    @print_success_message("JSON 배열로 영수증을 등록하는지 테스트")
+    def test_bulk_create_json(self):
+        r = self.client.post(self.url, ['0001', {'receipt_number': '0002'}, '0001'], format='json')
+
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()['created'], 2)
+        self.assertEqual(r.json()['results'][2], {'receipt_number': '0001', 'status': 'duplicate'})
+        self.assertEqual(Receipt.objects.filter(place=self.place).count(), 2)
+
+    @print_success_message("CSV, NDJSON 본문으로 영수증을 등록하는지 테스트")
+    def test_bulk_create_stream(self):
+        r = self.client.generic('POST', self.url, "0001\n0002\n", content_type='text/csv')
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()['created'], 2)
+
+        body = '\n'.join(json.dumps(number) for number in ['0002', '0003'])
+        r = self.client.generic('POST', self.url, body, content_type='application/x-ndjson')
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual((r.json()['created'], r.json()['duplicate']), (1, 1))
+
+    @print_success_message("본문 중간에 잘못된 줄이 있으면 아무것도 등록하지 않는지 테스트")
+    def test_bulk_create_invalid_body(self):
+        body = b'0001\n0002\n\xff\n'
+        r = self.client.generic('POST', self.url, body, content_type='text/csv')
+
+        self.assertEqual(r.status_code, 400)
+        self.assertFalse(Receipt.objects.exists())
+
+    @print_success_message("CSV 형식이 잘못되었으면 500 대신 400을 돌려주는지 테스트")
+    def test_bulk_create_malformed_csv(self):
+        # 닫히지 않은 따옴표 때문에 본문 끝까지 한 필드가 되어, 필드 크기 제한을 넘습니다. (csv.Error)
+        body = '0001\n"0002\n' + 'x' * (csv.field_size_limit() + 1)
+        r = self.client.generic('POST', self.url, body, content_type='text/csv')
+
+        self.assertEqual(r.status_code, 400)
+        self.assertIn("CSV 형식", r.json()['detail'])
+        self.assertFalse(Receipt.objects.exists())
+
+    @print_success_message("점주가 아니면 영수증을 등록할 수 없는지 테스트")
+    def test_customer_forbidden(self):
+        customer = User.objects.create(username='customer', password='1234')
+        self.client.force_authenticate(customer)
+
+        r = self.client.post(self.url, ['0001'], format='json')
+
+        self.assertEqual(r.status_code, 403)
+        self.assertFalse(Receipt.objects.exists())
+
+
+class ReceiptPlaceBindingTestCase(APITestCase):
+    """
+    영수증이 발행한 가게의 쿠폰에만 적립되는지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.place = create_place('내 가게')
+        self.other_place = create_place('남의 가게')
+        template = CouponTemplate.objects.create(first_n_persons=10, is_on=True, place=self.place)
+        RewardsInfo.objects.create(coupon_template=template, amount=5, reward='아메리카노 1잔 무료')
+
+        user = User.objects.create(username='test', password='1234')
+        self.coupon = Coupon.objects.create(couponbook=CouponBook.objects.get(user=user), original_template=template)
+        self.client.force_authenticate(user)
+        self.url = f'/couponbook/coupons/{self.coupon.id}/stamps/'
+        return super().setUp()
+
+    @print_success_message("쿠폰의 가게에 등록된 영수증으로만 적립되는지 테스트")
+    def test_stamp_with_place_receipt(self):
+        Receipt.objects.create(receipt_number='mine', place=self.place)
+        Receipt.objects.create(receipt_number='others', place=self.other_place)
+        Receipt.objects.create(receipt_number='legacy')
+
+        self.assertEqual(self.client.post(self.url, {'receipt': 'mine'}).status_code, 201)
+        self.assertEqual(self.client.post(self.url, {'receipt': 'legacy'}).status_code, 400,
+                         "가게 정보가 없는 예전 영수증으로 적립되었습니다!")
+        self.assertEqual(self.client.post(self.url, {'receipt': 'others'}).status_code, 400,
+                         "다른 가게의 영수증으로 적립되었습니다!")
+        self.assertEqual(self.client.post(self.url, {'receipt': 'mine'}).status_code, 400,
+                         "이미 사용한 영수증으로 적립되었습니다!")
+
+    @print_success_message("모델 검증(Stamp.save)에서도 다른 가게와 가게 정보가 없는 영수증을 거부하는지 테스트")
+    def test_stamp_save_checks_place(self):
+        customer = self.coupon.couponbook.user
+        for receipt in (Receipt.objects.create(receipt_number='others', place=self.other_place),
+                        Receipt.objects.create(receipt_number='legacy')):
+            Stamp(coupon=self.coupon, receipt=receipt, customer=customer).save()
+        self.assertFalse(Stamp.objects.exists(), "다른 가게의 영수증으로 스탬프가 저장되었습니다!")
+
+        Stamp(coupon=self.coupon, receipt=Receipt.objects.create(receipt_number='mine', place=self.place),
+              customer=customer).save()
+        self.assertEqual(Stamp.objects.count(), 1)
+
+
+class ReceiptPruneTestCase(TestCase):
+    """
+    보관 기간이 지난 영수증 정리를 테스트하는 테스트 케이스입니다.
+    """
+
+    @print_success_message("보관 기간이 지난 미사용 영수증만 배치로 삭제되는지 테스트")
+    def test_prune_receipts(self):
+        place = create_place('내 가게')
+        template = CouponTemplate.objects.create(first_n_persons=10, is_on=True, place=place)
+        RewardsInfo.objects.create(coupon_template=template, amount=5, reward='아메리카노 1잔 무료')
+        user = User.objects.create(username='test', password='1234')
+        coupon = Coupon.objects.create(couponbook=CouponBook.objects.get(user=user), original_template=template)
+
+        Receipt.objects.bulk_create([Receipt(receipt_number=f'old-{i}', place=place) for i in range(5)])
+        Stamp.objects.create(coupon=coupon, receipt_id='old-0', customer=user)
+        Receipt.objects.create(receipt_number='new', place=place)
+        Receipt.objects.filter(receipt_number__startswith='old-').update(created_at=now() - timedelta(days=100))
+
+        archive = io.StringIO()
+        deleted = prune_receipts(now() - timedelta(days=90), batch_size=2, archive=archive)
+
+        self.assertEqual(deleted, 4)
+        self.assertEqual(set(Receipt.objects.values_list('receipt_number', flat=True)), {'old-0', 'new'},
+                         "적립된 영수증이나 보관 기간이 남은 영수증이 삭제되었습니다!")
+        self.assertEqual(sorted(json.loads(line)['receipt_number'] for line in archive.getvalue().splitlines()),
+                         ['old-1', 'old-2', 'old-3', 'old-4'])
@@ -0,0 +1,122 @@
+from datetime import datetime, time, timedelta
+
+from accounts.models import User
+from couponbook.models import *
+from couponbook.stats.utils import rebuild_daily_stats
+from django.test import TestCase
+from django.utils.timezone import localdate, make_aware, now
+from rest_framework.test import APITestCase
+
+from .decorators import print_success_message
+from .receipttests import create_place
+
+# 점주 통계(일별 롤업) 관련 테스트케이스
+
+
+def stats_values(queryset) -> list[tuple]:
+    return list(queryset.order_by('template_id', 'date').values_list(
+        'template_id', 'date', 'coupons_issued', 'stamps_earned', 'completions', 'unique_customers'))
+
+
+class TemplateDailyStatsTestCase(TestCase):
+    """
+    쿠폰/스탬프 생성 시 일별 통계가 갱신되고, 다시 계산한 결과와 같은지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.owner = User.objects.create(username='owner', password='1234', role=User.Role.OWNER)
+        self.place = create_place('내 가게', owner=self.owner)
+        self.template = CouponTemplate.objects.create(first_n_persons=10, is_on=True, place=self.place)
+        RewardsInfo.objects.create(coupon_template=self.template, amount=2, reward='아메리카노 1잔 무료')
+        return super().setUp()
+
+    def earn_stamps(self, username: str, n: int) -> Coupon:
+        user = User.objects.create(username=username, password='1234')
+        coupon = Coupon.objects.create(couponbook=CouponBook.objects.get(user=user), original_template=self.template)
+        for i in range(n):
+            receipt = Receipt.objects.create(receipt_number=f'{username}-{i}', place=self.place)
+            Stamp.objects.create(coupon=coupon, receipt=receipt, customer=user)
+        return coupon
+
+    @print_success_message("쿠폰 발급, 스탬프 적립 시 일별 통계가 갱신되는지 테스트")
+    def test_incremental_stats(self):
+        self.earn_stamps('a', 2)
+        self.earn_stamps('b', 1)
+
+        stats = TemplateDailyStats.objects.get(template=self.template, date=localdate())
+        self.assertEqual((stats.coupons_issued, stats.stamps_earned, stats.completions, stats.unique_customers),
+                         (2, 3, 1, 2))
+
+    @print_success_message("다시 계산한 일별 통계가 증분 갱신한 결과와 같은지 테스트")
+    def test_rebuild_matches_incremental(self):
+        self.earn_stamps('a', 2)
+        coupon = self.earn_stamps('b', 1)
+        # 어제 적립한 스탬프는 어제 통계로 옮겨져야 합니다.
+        Stamp.objects.filter(coupon=coupon).update(created_at=now() - timedelta(days=1))
+        Coupon.objects.filter(id=coupon.id).update(saved_at=now() - timedelta(days=1))
+
+        rebuild_daily_stats()
+        rebuilt = stats_values(TemplateDailyStats.objects.all())
+
+        self.assertEqual(rebuilt, [
+            (self.template.id, localdate() - timedelta(days=1), 1, 1, 0, 1),
+            (self.template.id, localdate(), 1, 2, 1, 1),
+        ])
+
+    @print_success_message("다시 계산할 때 자정 직후의 스탬프를 현지 날짜로 나누는지 테스트")
+    def test_rebuild_local_date(self):
+        coupon = self.earn_stamps('a', 1)
+        # 한국 시각 00:30은 UTC로 전날 15:30입니다.
+        after_midnight = make_aware(datetime.combine(localdate(), time(0, 30)))
+        Stamp.objects.filter(coupon=coupon).update(created_at=after_midnight)
+        Coupon.objects.filter(id=coupon.id).update(saved_at=after_midnight)
+
+        rebuild_daily_stats(start=localdate() - timedelta(days=1), end=localdate())
+
+        self.assertEqual(stats_values(TemplateDailyStats.objects.all()),
+                         [(self.template.id, localdate(), 1, 1, 0, 1)])
+
+
+class PlaceStatsAPITestCase(APITestCase):
+    """
+    점주 통계 API를 테스트하는 테스트 케이스입니다.
+    """
+
+    url = '/couponbook/own-place/stats/'
+
+    def setUp(self):
+        self.owner = User.objects.create(username='owner', password='1234', role=User.Role.OWNER)
+        place = create_place('내 가게', owner=self.owner)
+        self.template = CouponTemplate.objects.create(first_n_persons=10, is_on=True, place=place)
+        other_template = CouponTemplate.objects.create(first_n_persons=10, is_on=True, place=create_place('남의 가게'))
+
+        today = localdate()
+        for days_ago in range(3):
+            TemplateDailyStats.objects.create(template=self.template, date=today - timedelta(days=days_ago),
+                                              coupons_issued=1, stamps_earned=2, completions=0, unique_customers=2)
+        TemplateDailyStats.objects.create(template=other_template, date=today, coupons_issued=100)
+        self.client.force_authenticate(self.owner)
+        return super().setUp()
+
+    @print_success_message("기간의 모든 날짜 통계를 한 번의 쿼리로 조회하는지 테스트")
+    def test_place_stats(self):
+        start = localdate() - timedelta(days=364)
+
+        with self.assertNumQueries(1):
+            r = self.client.get(self.url, {'start': start.isoformat(), 'end': localdate().isoformat()})
+
+        self.assertEqual(r.status_code, 200)
+        series = r.json()['series']
+        self.assertEqual(len(series), 365, "기간의 모든 날짜가 포함되지 않았습니다!")
+        self.assertEqual(sum(day['coupons_issued'] for day in series), 3, "다른 가게의 통계가 포함되었습니다!")
+        self.assertEqual(r.json()['templates'], [{'template_id': self.template.id, 'coupons_issued': 3,
+                                                  'stamps_earned': 6, 'completions': 0, 'unique_customers': 6}])
+
+    @print_success_message("잘못된 기간이나 점주가 아닌 유저의 요청이 거부되는지 테스트")
+    def test_invalid_requests(self):
+        r = self.client.get(self.url, {'start': localdate().isoformat(),
+                                       'end': (localdate() - timedelta(days=1)).isoformat()})
+        self.assertEqual(r.status_code, 400)
+
+        self.client.force_authenticate(User.objects.create(username='customer', password='1234'))
+        self.assertEqual(self.client.get(self.url).status_code, 403)
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+from accounts.models import User
+from couponbook.models import *
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework.test import APITestCase
+
+from .decorators import print_success_message
+from .receipttests import create_place
+
+# 쿠폰 템플릿 쿼리셋(CouponTemplate.objects) 관련 테스트케이스
+
+
+class CouponTemplateQuerySetTestCase(TestCase):
+    """
+    게시 중인 템플릿 필터와 남은 인원, 보유 여부 어노테이션을 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.place = create_place('내 가게')
+        self.user = User.objects.create(username='customer', password='1234')
+        return super().setUp()
+
+    @print_success_message("active()가 비공개, 유효기간이 지난 템플릿을 제외하는지 테스트")
+    def test_active(self):
+        unlimited = CouponTemplate.objects.create(is_on=True, place=self.place)
+        valid = CouponTemplate.objects.create(valid_until=now() + timedelta(days=1), is_on=True, place=self.place)
+        CouponTemplate.objects.create(valid_until=now() - timedelta(seconds=1), is_on=True, place=self.place)
+        CouponTemplate.objects.create(is_on=False, place=self.place)
+
+        self.assertEqual(set(CouponTemplate.objects.active().values_list('id', flat=True)), {unlimited.id, valid.id})
+
+    @print_success_message("with_remaining(), with_owned_by()가 남은 인원과 보유 여부를 계산하는지 테스트")
+    def test_annotations(self):
+        limited = CouponTemplate.objects.create(first_n_persons=2, is_on=True, place=self.place)
+        unlimited = CouponTemplate.objects.create(is_on=True, place=self.place)
+        Coupon.objects.create(couponbook=self.user.couponbook, original_template=limited)
+
+        templates = {t.id: t for t in CouponTemplate.objects.with_remaining().with_owned_by(self.user)}
+
+        self.assertEqual((templates[limited.id].n_remaining, templates[limited.id].is_owned), (1, True))
+        self.assertEqual((templates[unlimited.id].n_remaining, templates[unlimited.id].is_owned), (None, False))
+
+
+class CouponTemplateListQueryTestCase(APITestCase):
+    """
+    쿠폰 템플릿 목록/상세 조회가 템플릿 수와 관계없이 같은 수의 쿼리로 처리되는지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.place = create_place('내 가게')
+        self.user = User.objects.create(username='customer', password='1234')
+        self.client.force_authenticate(user=self.user)
+        return super().setUp()
+
+    def create_templates(self, n: int):
+        for _ in range(n):
+            template = CouponTemplate.objects.create(first_n_persons=10, is_on=True, place=self.place)
+            RewardsInfo.objects.create(coupon_template=template, amount=5, reward='아메리카노 1잔 무료')
+            Coupon.objects.create(couponbook=self.user.couponbook, original_template=template)
+
+    def count_list_queries(self) -> int:
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('couponbook:coupon-template-list'))
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    @print_success_message("쿠폰 템플릿 목록 조회의 쿼리 수가 템플릿 수에 비례하지 않는지 테스트")
+    def test_list_query_count(self):
+        self.create_templates(1)
+        one = self.count_list_queries()
+        self.create_templates(4)
+        self.assertEqual(self.count_list_queries(), one)
+
+    @print_success_message("상세 조회가 요청 시점 기준으로 만료된 템플릿을 제외하는지 테스트")
+    def test_detail_excludes_expired(self):
+        template = CouponTemplate.objects.create(valid_until=now() + timedelta(days=1), is_on=True, place=self.place)
+        RewardsInfo.objects.create(coupon_template=template, amount=5, reward='아메리카노 1잔 무료')
+        url = reverse('couponbook:coupon-template-detail', kwargs={'coupon_template_id': template.id})
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        CouponTemplate.objects.filter(id=template.id).update(valid_until=now() - timedelta(seconds=1))
+        self.assertEqual(self.client.get(url).status_code, 404)
@@ -1,9 +1,12 @@
 from django.urls import path
 
-from .views import (CouponBookDetailView, CouponDetailView, CouponListView,
-                    CouponTemplateCurationView, CouponTemplateDetailView,
-                    CouponTemplateListView, FavoriteCouponDetailView,
-                    FavoriteCouponListView, StampListView)
+from .views import (CouponBookDetailView, CouponDetailView, CouponExportView,
+                    CouponListView, CouponTemplateCurationView,
+                    CouponTemplateDetailView, CouponTemplateListView,
+                    FavoriteCouponDetailView, FavoriteCouponListView,
+                    PlaceImageUploadCompleteView, PlaceImageUploadView,
+                    PlaceStatsView, ReceiptBulkCreateView, StampExportView,
+                    StampListView)
 
 app_name = 'couponbook'
 
@@ -20,4 +23,15 @@ urlpatterns = [
     # 쿠폰 템플릿 관련 엔드포인트입니다.
     path('coupon-templates/', CouponTemplateListView.as_view(), name='coupon-template-list'),
     path('coupon-templates/<int:coupon_template_id>/', CouponTemplateDetailView.as_view(), name='coupon-template-detail'),
+
+    # 점주가 가게의 영수증을 등록하고, 통계를 조회하고, 가게 이미지를 올리는 엔드포인트입니다.
+    path('own-place/receipts/', ReceiptBulkCreateView.as_view(), name='receipt-bulk-create'),
+    path('own-place/stats/', PlaceStatsView.as_view(), name='place-stats'),
+    path('own-place/image-uploads/', PlaceImageUploadView.as_view(), name='place-image-upload'),
+    path('own-place/image-uploads/<int:upload_id>/complete/', PlaceImageUploadCompleteView.as_view(),
+         name='place-image-upload-complete'),
+
+    # 쿠폰/스탬프 이력 내보내기 엔드포인트입니다. (스태프: 전체, 점주: 자신의 가게)
+    path('exports/coupons/', CouponExportView.as_view(), name='coupon-export'),
+    path('exports/stamps/', StampExportView.as_view(), name='stamp-export'),
 ]
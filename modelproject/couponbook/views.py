@@ -1,25 +1,46 @@
-from django.db.models import Count, Q
+from accounts.authentication import (ClaimsJWTAuthentication,
+                                     RequestCachedJWTAuthentication)
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
+from django.utils.timezone import localdate
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (OpenApiExample, OpenApiParameter,
-                                   extend_schema, extend_schema_view)
+                                   OpenApiResponse, extend_schema,
+                                   extend_schema_view)
 from rest_framework import filters, permissions
 from rest_framework import serializers as drf_serializers
 from rest_framework import status
+from rest_framework.authentication import SessionAuthentication
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.generics import (CreateAPIView, DestroyAPIView,
                                      ListAPIView, ListCreateAPIView,
                                      RetrieveAPIView, RetrieveDestroyAPIView)
+from rest_framework.parsers import JSONParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.authentication import JWTAuthentication
-
-from .curation.utils import AICurator, UserStatistics
+from rest_framework.views import APIView
+from utils.async_views import AsyncAPIView
+from utils.identity_map import forget, get_or_load
+from utils.streaming import streaming_response
+
+from .curation.utils import UserStatistics, get_curator
+from .exports.utils import OUTPUTS, stream_export
+from .fastpath.utils import (FastListMixin, serialize_coupon_list,
+                             serialize_coupon_template_list,
+                             serialize_favorite_coupon_list)
 from .filters import CouponFilter, CouponTemplateFilter
+from .images.utils import DirectUploadUnavailable, complete_upload, start_upload
 from .models import *
-from .models import CouponTemplate
-from .permissions import IsMyCoupon, IsMyCouponBook, IsMyCouponForFavoriteAdd
+from .permissions import (IsMyCoupon, IsMyCouponBook,
+                          IsMyCouponForFavoriteAdd, IsStaffOrOwner,
+                          get_owned_object)
+from .receipts.parsers import ReceiptCSVParser, ReceiptNDJSONParser
+from .receipts.utils import ingest_receipts, iter_json_receipt_numbers
 from .serializers import *
+from .stats.utils import get_place_stats
 
 # Create your views here.
 
@@ -52,14 +73,14 @@ class CouponBookDetailView(RetrieveAPIView):
     """
 
     serializer_class = CouponBookDetailResponseSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated] # get_object에서 본인의 쿠폰북을 가져오기 때문에 IsAuthenticated 사용
 
-    queryset= CouponBook.objects.all()
+    queryset= CouponBook.objects.with_summary() # 요약 정보(개수)를 쿠폰북 조회 쿼리에서 함께 계산
 
     def get_object(self):
         """
-        로그인된 유저의 유저 id에 해당하는 쿠폰북 인스턴스를 가져옵니다.
+        로그인된 유저의 유저 id에 해당하는 쿠폰북 인스턴스를 요약 정보와 함께 가져옵니다.
         """
         queryset = self.filter_queryset(self.get_queryset())
         # 로그인된 유저의 유저 id에 해당하는 쿠폰북이 없으면 404가 발생합니다.
@@ -99,18 +120,21 @@ class CouponBookDetailView(RetrieveAPIView):
         examples=[OpenApiExample("요청 예시", value={"original_template": 1}, request_only=True)],
     ),
 )
-class CouponListView(ListCreateAPIView):
+class CouponListView(FastListMixin, ListCreateAPIView):
     """
     쿠폰 목록에 관련된 뷰입니다. 쿠폰북에 속한 쿠폰들의 목록을 가져옵니다.
+
+    목록 조회는 `.values()` 기반의 가벼운 직렬화(fastpath)를 사용합니다. 응답은 CouponListResponseSerializer와 같습니다.
     """
 
     serializer_class = CouponListResponseSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsMyCouponBook]
     queryset = Coupon.objects.none() # drf-spectacular warning 방지
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = CouponFilter
     ordering_fields = ['id', 'saved_at', 'stamp_counts']
+    fast_serializer = staticmethod(serialize_coupon_list)
 
     def get_queryset(self):
         """
@@ -118,8 +142,8 @@ class CouponListView(ListCreateAPIView):
         """
 
         couponbook_id: int = self.kwargs['couponbook_id']
-        queryset = Coupon.objects.filter(couponbook_id=couponbook_id)
-        queryset = queryset.annotate(stamp_counts=Count('stamps'))
+        # 쿠폰 카드에 필요한 가게, 리워드 정보와 스탬프 개수(stamp_counts, 정렬에도 사용)를 함께 조회합니다.
+        queryset = Coupon.objects.filter(couponbook_id=couponbook_id).with_card()
 
         return queryset
     
@@ -134,7 +158,7 @@ class CouponListView(ListCreateAPIView):
         """
 
         couponbook_id = self.kwargs['couponbook_id']
-        couponbook = get_object_or_404(CouponBook, id=couponbook_id)
+        couponbook = get_or_load(CouponBook, couponbook_id, lambda: get_object_or_404(CouponBook, id=couponbook_id))
         request_serializer = self.get_serializer_class()(data=request.data, context={'request': request, 'couponbook': couponbook})
         request_serializer.is_valid(raise_exception=True)
         instance = self.perform_create(request_serializer)
@@ -164,42 +188,90 @@ class CouponDetailView(RetrieveDestroyAPIView):
     """
 
     serializer_class = CouponDetailResponseSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsMyCoupon]
 
-    queryset = Coupon.objects.all()
+    queryset = Coupon.objects.none() # drf-spectacular warning 방지
     lookup_url_kwarg = 'coupon_id'
 
+    def get_coupon_queryset(self):
+        """
+        IsMyCoupon에서 소유권 확인과 함께 쿠폰을 조회할 때 사용하는 쿼리셋입니다. 직렬화에 필요한 관계와 즐겨찾기 id를 함께 가져옵니다.
+        """
+        return (Coupon.objects.select_related('original_template__place__address_district',
+                                              'original_template__reward_info')
+                .with_favorite_id())
+
+    def get_queryset(self):
+        return self.get_coupon_queryset().filter(couponbook__user_id=self.request.user.id)
+
+    def get_object(self) -> Coupon:
+        """
+        IsMyCoupon에서 이미 조회한 본인의 쿠폰을 반환합니다.
+        """
+        return self.coupon
+
+    def perform_destroy(self, instance: Coupon):
+        """
+        쿠폰을 삭제하고, 요청 단위 identity map에서도 지웁니다.
+        """
+        coupon_id = instance.id
+        instance.delete()
+        forget(Coupon, coupon_id)
+
 @extend_schema_view(
     get=extend_schema(
         tags=["AI_CURATION"],
         description="현재 유저가 보유한 쿠폰을 바탕으로 쿠폰 큐레이션을 실행하여 추천된 쿠폰들의 목록을 반환합니다.",
         summary="AI 기반 추천 쿠폰 목록 반환",
+        responses=CouponTemplateListSerializer(many=True),
     )
 )
-class CouponTemplateCurationView(ListAPIView):
+class CouponTemplateCurationView(AsyncAPIView):
     """
     쿠폰 템플릿 추천과 관련된 뷰입니다.
+
+    제미나이 응답을 기다리는 시간이 길기 때문에 비동기 뷰로 작성되었습니다.
+    ASGI로 실행하면 응답을 기다리는 동안 같은 워커가 다른 요청을 처리할 수 있습니다.
     """
 
     serializer_class = CouponTemplateListSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def get_queryset(self):# -> Any:
+    def get_queryset(self):
         """
-        현재 유저의 쿠폰 컬렉션을 바탕으로 쿠폰 템플릿 큐레이션을 실행하여 추천된 쿠폰 템플릿들의 쿼리셋을 반환합니다.
+        큐레이션 대상이 되는 쿠폰 템플릿들의 쿼리셋을 반환합니다.
+
+        유효 기간 지난 것 제거, 현재 게시중인 것만 보이게 하고, 이미 보유한 쿠폰 템플릿 제거
         """
 
-        user_statistics = UserStatistics(self.request.user)
+        return (CouponTemplate.objects.active()
+                .with_owned_by(self.request.user).filter(is_owned=False)
+                .select_related("place__address_district", "reward_info")
+                .with_remaining())
 
-        # 유효 기간 지난 것 제거, 현재 게시중인 것만 보이게 하고, 이미 보유한 쿠폰 템플릿 제거
-        coupon_templates = CouponTemplate.objects.filter(
-            Q(valid_until=None) | Q(valid_until__gte=now()), is_on=True).exclude(coupons__couponbook__user=self.request.user)
+    def serialize_curated(self, coupon_templates_ids: list[int]) -> list[dict]:
+        """
+        추천된 쿠폰 템플릿 id 리스트를 받아 응답 데이터로 직렬화합니다. ORM을 사용하므로 `sync_to_async`로 호출합니다.
+        """
+
+        coupon_templates = (CouponTemplate.objects.active().filter(id__in=coupon_templates_ids)
+                            .select_related("place__address_district", "reward_info")
+                            .with_remaining().with_owned_by(self.request.user))
+        serializer = self.serializer_class(coupon_templates, many=True, context={'request': self.request, 'view': self})
+        return serializer.data
+
+    async def get(self, request, *args, **kwargs):
+        """
+        현재 유저의 쿠폰 컬렉션을 바탕으로 쿠폰 템플릿 큐레이션을 실행하여 추천된 쿠폰 템플릿들의 목록을 반환합니다.
+        """
 
-        curator = AICurator()
-        coupon_templates_ids = curator.curate(user_statistics, coupon_templates)
-        return CouponTemplate.objects.filter(id__in=coupon_templates_ids)
+        user_statistics = UserStatistics(request.user)
+        curator = get_curator()
+        coupon_templates_ids = await curator.acurate(user_statistics, self.get_queryset())
+        data = await sync_to_async(self.serialize_curated)(coupon_templates_ids)
+        return Response(data)
     
 @extend_schema_view(
     get=extend_schema(
@@ -219,13 +291,16 @@ class CouponTemplateCurationView(ListAPIView):
         ],
     )
 )
-class FavoriteCouponListView(ListCreateAPIView):
+class FavoriteCouponListView(FastListMixin, ListCreateAPIView):
     """
     현재 쿠폰북에 등록되어 있는 즐겨찾기 쿠폰들을 조회하는 뷰입니다.
+
+    목록 조회는 `.values()` 기반의 가벼운 직렬화(fastpath)를 사용합니다. 응답은 FavoriteCouponListResponseSerializer와 같습니다.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsMyCouponBook, IsMyCouponForFavoriteAdd]
+    fast_serializer = staticmethod(serialize_favorite_coupon_list)
 
     def get_serializer_class(self):
         if self.request.method == 'GET':
@@ -238,7 +313,10 @@ class FavoriteCouponListView(ListCreateAPIView):
         """
 
         couponbook_id = self.kwargs['couponbook_id']
-        queryset = FavoriteCoupon.objects.filter(couponbook_id=couponbook_id)
+        # 쿠폰 카드(가게, 리워드, 스탬프 개수)를 즐겨찾기 수와 관계없이 쿼리 한 번으로 함께 불러옵니다.
+        queryset = (FavoriteCoupon.objects.filter(couponbook_id=couponbook_id)
+                    .prefetch_related(Prefetch('coupon', queryset=Coupon.objects.with_card()))
+                    .order_by('-added_at', '-id'))
         return queryset
     
     def create(self, request, *args, **kwargs):
@@ -247,7 +325,7 @@ class FavoriteCouponListView(ListCreateAPIView):
         """
 
         couponbook_id = self.kwargs['couponbook_id']
-        couponbook = get_object_or_404(CouponBook, id=couponbook_id)
+        couponbook = get_or_load(CouponBook, couponbook_id, lambda: get_object_or_404(CouponBook, id=couponbook_id))
         request_serializer = self.get_serializer_class()(data=request.data, context={'request': request, 'couponbook': couponbook})
         request_serializer.is_valid(raise_exception=True)
         instance = self.perform_create(request_serializer)
@@ -274,11 +352,18 @@ class FavoriteCouponDetailView(DestroyAPIView):
     현재 즐겨찾기 쿠폰을 즐겨찾기에서 삭제하는 뷰입니다.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
     queryset = FavoriteCoupon.objects.all()
     lookup_url_kwarg = 'favorite_id'
 
+    def get_object(self) -> FavoriteCoupon:
+        """
+        본인의 쿠폰북에 등록된 즐겨찾기 쿠폰만 조회합니다. 남의 즐겨찾기면 403, 없으면 404가 반환됩니다.
+        """
+        return get_owned_object(self.get_queryset(), self.request.user, 'couponbook__user_id',
+                                id=self.kwargs[self.lookup_url_kwarg])
+
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 # ----------------------------- 쿠폰 템플릿 (통합) -------------------------------
@@ -302,15 +387,18 @@ from rest_framework.exceptions import PermissionDenied, ValidationError
         responses={201: CouponTemplateCreateSerializer},
     ),
 )
-class CouponTemplateListView(ListCreateAPIView):
+class CouponTemplateListView(FastListMixin, ListCreateAPIView):
     """
     쿠폰 템플릿 목록 조회(GET) + 템플릿 생성(POST, 점주 전용)
+
+    목록 조회는 `.values()` 기반의 가벼운 직렬화(fastpath)를 사용합니다. 응답은 CouponTemplateListSerializer와 같습니다.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     queryset = CouponTemplate.objects.all()
     filter_backends = [DjangoFilterBackend]
     filterset_class = CouponTemplateFilter
+    fast_serializer = staticmethod(serialize_coupon_template_list)
 
     def get_serializer_class(self):
         if self.request.method == "GET":
@@ -341,8 +429,11 @@ class CouponTemplateListView(ListCreateAPIView):
 
         # 부모에 get_queryset이 있으면 사용, 없으면 기본 queryset 사용
         qs = super().get_queryset() if hasattr(super(), "get_queryset") else self.queryset
-        # Place 및 LegalDistrict 조인 + 추가 필터링
-        return qs.select_related("place", "place__address_district").filter(Q(valid_until=None) | Q(valid_until__gte=now()), is_on=True)
+        # Place 및 LegalDistrict 조인 + 게시 중인 템플릿만 + 남은 인원, 보유 여부를 한 쿼리에서 계산
+        return (qs.active()
+                .select_related("place", "place__address_district", "reward_info")
+                .with_remaining()
+                .with_owned_by(self.request.user))
 
 @extend_schema_view(
     get=extend_schema(
@@ -358,13 +449,22 @@ class CouponTemplateDetailView(RetrieveAPIView):
     """
 
     serializer_class = CouponTemplateDetailSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     # 유효기간이 경과되지 않은 현재 게시중으로 설정된 쿠폰 템플릿 조회
-    queryset = CouponTemplate.objects.filter(Q(valid_until=None) | Q(valid_until__gte=now()), is_on=True)
+    queryset = CouponTemplate.objects.active()
     lookup_url_kwarg = 'coupon_template_id'
 
+    def get_queryset(self):
+        """
+        남은 선착순 인원과 보유 여부를 조회 쿼리에서 함께 계산합니다.
+        """
+        return (super().get_queryset()
+                .select_related("place", "place__address_district", "reward_info")
+                .with_remaining()
+                .with_owned_by(self.request.user))
+
 
 # -------------------------------- 스탬프 ---------------------------------
 @extend_schema_view(
@@ -382,7 +482,7 @@ class StampListView(CreateAPIView):
     스탬프 적립(등록)과 관련된 뷰입니다.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsMyCoupon]
 
     def get_queryset(self):
@@ -401,9 +501,16 @@ class StampListView(CreateAPIView):
         
         return StampCreateRequestSerializer
     
+    def get_coupon_queryset(self):
+        """
+        IsMyCoupon에서 소유권 확인과 함께 쿠폰을 조회할 때 사용하는 쿼리셋입니다. 스탬프 적립 검증에 필요한 관계와 스탬프 수를 함께 가져옵니다.
+        """
+        return Coupon.objects.select_related('original_template__reward_info').with_stamp_counts()
+
     def get_serializer_context(self):
         ctx = super().get_serializer_context()
         ctx['coupon_id'] = self.kwargs.get('coupon_id')
+        ctx['coupon'] = getattr(self, 'coupon', None)  # IsMyCoupon에서 조회한 쿠폰
         return ctx
     
     def create(self, request, *args, **kwargs):
@@ -425,3 +532,243 @@ class StampListView(CreateAPIView):
         """
 
         return serializer.save()
+
+
+# -------------------------------- 영수증 ---------------------------------
+@extend_schema_view(
+    post=extend_schema(
+        tags=["Receipts"],
+        description=(
+            "(OWNER 전용) 점주의 POS 시스템에서 영수증 번호들을 한 번에 등록합니다. 등록된 영수증은 점주의 가게에 연결됩니다.\n\n"
+            "- application/json: 영수증 번호 배열 (`[\"0001\", ...]`, `[{\"receipt_number\": \"0001\"}, ...]`) "
+            "또는 `{\"receipt_numbers\": [...]}`\n"
+            "- text/csv: 첫 번째 열 (첫 줄이 `receipt_number` 헤더이면 해당 열)\n"
+            "- application/x-ndjson: 한 줄에 영수증 번호 하나\n\n"
+            "CSV와 NDJSON은 본문을 줄 단위로 읽고, 끝까지 읽은 후에 배치로 등록하므로 수만 건도 한 번에 보낼 수 있습니다. "
+            "이미 등록된 번호는 오류 없이 건너뛰고, 번호별 결과를 돌려줍니다. "
+            "본문 중간에 읽을 수 없는 줄이 있으면 아무것도 등록하지 않고 400을 돌려줍니다."
+        ),
+        summary="점주: 영수증 대량 등록",
+        request={
+            "application/json": {"type": "array", "items": {"type": "string"}},
+            "text/csv": {"type": "string"},
+            "application/x-ndjson": {"type": "string"},
+        },
+        responses=ReceiptBulkCreateResponseSerializer,
+        examples=[OpenApiExample("요청 예시", value=["00000001", "00000002"], request_only=True)],
+    )
+)
+class ReceiptBulkCreateView(APIView):
+    """
+    점주가 자신의 가게 영수증을 대량으로 등록하는 뷰입니다.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    parser_classes = [JSONParser, ReceiptCSVParser, ReceiptNDJSONParser]
+
+    def post(self, request, *args, **kwargs):
+        if not request.user.is_owner():
+            raise PermissionDenied("점주만 영수증을 등록할 수 있습니다.")
+        place_id = Place.objects.filter(owner_id=request.user.id).values_list('id', flat=True).first()
+        if place_id is None:
+            raise ValidationError({"detail": "등록된 가게가 없습니다. 먼저 가게를 등록해주세요."})
+
+        try:
+            receipt_numbers = request.data
+            if isinstance(receipt_numbers, (list, dict)):  # application/json
+                receipt_numbers = iter_json_receipt_numbers(receipt_numbers)
+            result = ingest_receipts(receipt_numbers, place_id)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValidationError({"detail": f"영수증 번호를 읽을 수 없습니다: {e}"})
+
+        return Response({**result.counts, 'results': result.results}, status=status.HTTP_200_OK)
+
+
+# -------------------------------- 가게 이미지 ---------------------------------
+@extend_schema_view(
+    post=extend_schema(
+        tags=["Places"],
+        description=(
+            "(OWNER 전용) 점주 가게의 이미지를 S3에 직접 올릴 presigned POST를 발급합니다.\n\n"
+            "응답의 `upload_fields`를 모두 multipart/form-data 필드로 넣고, 마지막에 `file` 필드로 이미지를 넣어 "
+            "`upload_url`로 POST한 후, 업로드 완료 API를 호출하세요. 이미지는 서버를 거치지 않습니다.\n\n"
+            "완료된 이미지는 백그라운드에서 WebP 썸네일로 변환되며, 변환이 끝나면 가게 정보의 `thumbnail_url`에 표시됩니다."
+        ),
+        summary="점주: 가게 이미지 업로드 URL 발급",
+        request=PlaceImageUploadRequestSerializer,
+        responses={
+            201: PlaceImageUploadResponseSerializer,
+            503: OpenApiResponse(description="S3 스토리지를 사용하지 않는 환경입니다."),
+        },
+    )
+)
+class PlaceImageUploadView(APIView):
+    """
+    점주가 가게 이미지를 S3에 직접 올릴 presigned POST를 발급하는 뷰입니다.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        if not request.user.is_owner():
+            raise PermissionDenied("점주만 가게 이미지를 올릴 수 있습니다.")
+        place_id = Place.objects.filter(owner_id=request.user.id).values_list('id', flat=True).first()
+        if place_id is None:
+            raise ValidationError({"detail": "등록된 가게가 없습니다. 먼저 가게를 등록해주세요."})
+
+        serializer = PlaceImageUploadRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            upload, post = start_upload(place_id, serializer.validated_data['content_type'])
+        except DirectUploadUnavailable as e:
+            return Response({"detail": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        response_serializer = PlaceImageUploadResponseSerializer({
+            'id': upload.id,
+            'status': upload.status,
+            'upload_url': post.url,
+            'upload_fields': post.fields,
+            'expires_in': post.expires_in,
+            'max_bytes': settings.PLACE_IMAGE_MAX_BYTES,
+        })
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
+
+@extend_schema_view(
+    post=extend_schema(
+        tags=["Places"],
+        description=(
+            "(OWNER 전용) 가게 이미지 업로드를 마쳤음을 알립니다. 업로드된 파일이 있으면 썸네일 생성 대기(`uploaded`) 상태가 됩니다.\n\n"
+            "이미 완료한 업로드에 다시 요청해도 현재 상태를 그대로 돌려줍니다."
+        ),
+        summary="점주: 가게 이미지 업로드 완료",
+        request=None,
+        responses={202: PlaceImageUploadStatusSerializer},
+    )
+)
+class PlaceImageUploadCompleteView(APIView):
+    """
+    점주가 가게 이미지 업로드를 마쳤음을 알리는 뷰입니다.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, upload_id: int, *args, **kwargs):
+        upload = get_object_or_404(PlaceImageUpload, id=upload_id, place__owner_id=request.user.id)
+        if not complete_upload(upload):
+            raise ValidationError({"detail": "업로드된 이미지가 없습니다. 이미지를 먼저 올려주세요."})
+        return Response(PlaceImageUploadStatusSerializer(upload).data, status=status.HTTP_202_ACCEPTED)
+
+
+# -------------------------------- 점주 통계 ---------------------------------
+@extend_schema_view(
+    get=extend_schema(
+        tags=["Stats"],
+        description=(
+            "(OWNER 전용) 점주 가게의 쿠폰 템플릿들의 날짜별 통계(발급된 쿠폰, 적립된 스탬프, 완성된 쿠폰, 고객 수)를 조회합니다.\n\n"
+            "미리 집계된 일별 통계에서 조회하므로, 기간이 길어도 쿠폰과 스탬프를 다시 세지 않습니다. "
+            "기간을 지정하지 않으면 오늘까지 최근 30일을 조회합니다."
+        ),
+        summary="점주: 쿠폰 템플릿 통계 조회",
+        parameters=[PlaceStatsQuerySerializer],
+        responses=PlaceStatsResponseSerializer,
+    )
+)
+class PlaceStatsView(APIView):
+    """
+    점주가 자신의 가게 쿠폰 템플릿들의 통계를 조회하는 뷰입니다.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        if not request.user.is_owner():
+            raise PermissionDenied("점주만 통계를 조회할 수 있습니다.")
+
+        query = PlaceStatsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        start, end = query.validated_data['start'], query.validated_data['end']
+
+        stats = get_place_stats(request.user.id, start, end, query.validated_data.get('template'))
+        serializer = PlaceStatsResponseSerializer({
+            'start': start,
+            'end': end,
+            'series': stats.series,
+            'templates': stats.templates,
+        })
+        return Response(serializer.data)
+
+
+# -------------------------------- 내보내기 ---------------------------------
+class ExportView(APIView):
+    """
+    쿠폰/스탬프 이력을 CSV 또는 NDJSON으로 내보내는 뷰의 기반 클래스입니다.
+
+    스태프는 전체(또는 `place`로 지정한 가게)를, 점주는 자신의 가게 데이터만 내보낼 수 있습니다.
+    행을 조금씩 읽어 바로 내보내므로, 데이터가 많아도 메모리 사용량이 일정합니다.
+    """
+
+    # 관리자 페이지에 로그인한 스태프가 브라우저로 바로 내려받을 수 있도록 세션 인증도 허용합니다.
+    # 스태프 여부(is_staff)는 토큰 클레임에 없으므로 DB에서 유저를 조회하는 RequestCachedJWTAuthentication을 사용합니다.
+    authentication_classes = [RequestCachedJWTAuthentication, SessionAuthentication]
+    permission_classes = [IsStaffOrOwner]
+    dataset: str = ''
+
+    def get(self, request, *args, **kwargs):
+        query = ExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        if request.user.is_staff:
+            place_id = params.get('place')
+        else:
+            place_id = Place.objects.filter(owner_id=request.user.id).values_list('id', flat=True).first()
+            if place_id is None:
+                raise ValidationError({"detail": "등록된 가게가 없습니다. 먼저 가게를 등록해주세요."})
+            if params.get('place', place_id) != place_id:
+                raise PermissionDenied("다른 가게의 데이터는 내보낼 수 없습니다.")
+
+        output = params['output']
+        content = stream_export(self.dataset, output, place_id, params.get('since'), params.get('until'))
+        filename = f"{self.dataset}-{localdate():%Y%m%d}.{output}"
+        return streaming_response(request, content, OUTPUTS[output][1], filename)
+
+
+@extend_schema_view(
+    get=extend_schema(
+        tags=["Exports"],
+        summary="스태프/점주: 쿠폰 이력 내보내기",
+        description=("스태프는 전체 쿠폰을, 점주는 자신의 가게 쿠폰을 CSV(기본) 또는 NDJSON으로 내려받습니다.\n\n"
+                     "열: coupon_id, template_id, place_id, place_name, customer_id, stamp_count, reward_amount, saved_at"),
+        parameters=[ExportQuerySerializer],
+        responses={(200, "text/csv"): OpenApiTypes.STR, (200, "application/x-ndjson"): OpenApiTypes.STR},
+    )
+)
+class CouponExportView(ExportView):
+    """
+    쿠폰 이력을 내보내는 뷰입니다.
+    """
+
+    dataset = 'coupons'
+
+
+@extend_schema_view(
+    get=extend_schema(
+        tags=["Exports"],
+        summary="스태프/점주: 스탬프 이력 내보내기",
+        description=("스태프는 전체 스탬프를, 점주는 자신의 가게 스탬프를 CSV(기본) 또는 NDJSON으로 내려받습니다.\n\n"
+                     "열: stamp_id, coupon_id, template_id, place_id, place_name, customer_id, receipt_number, created_at"),
+        parameters=[ExportQuerySerializer],
+        responses={(200, "text/csv"): OpenApiTypes.STR, (200, "application/x-ndjson"): OpenApiTypes.STR},
+    )
+)
+class StampExportView(ExportView):
+    """
+    스탬프 이력을 내보내는 뷰입니다.
+    """
+
+    dataset = 'stamps'
@@ -73,11 +73,13 @@ from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from django.core.files.storage import default_storage
+from utils.instrumentation import timed
 
 @api_view(["POST"])
 @parser_classes([MultiPartParser, FormParser])
 def upload_image(request):
     f = request.FILES["file"]            # form-data key: file
-    path = default_storage.save(f"uploads/{f.name}", f)
-    url = default_storage.url(path)      # presigned URL(만료됨)
+    with timed("s3"):
+        path = default_storage.save(f"uploads/{f.name}", f)
+        url = default_storage.url(path)      # presigned URL(만료됨)
     return Response({"path": path, "url": url})
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""벤치마크 환경 (배포 환경과 같은 DB/설정에서 HTTP로 부하를 줍니다.)"""
+
+from .deploy_settings import *
+
+# 벤치마크 클라이언트는 로컬에서 HTTP로 요청합니다.
+ALLOWED_HOSTS = [*ALLOWED_HOSTS, "localhost"]
+SECURE_SSL_REDIRECT = False
+
+# 제미나이 대신 일정 시간 기다렸다가 응답하는 스텁 큐레이터를 사용합니다.
+AI_CURATOR_CLASS = "couponbook.benchmark.stubs.StubCurator"
+AI_CURATOR_STUB_DELAY = config("AI_CURATOR_STUB_DELAY", default=0.5, cast=float)  # 초
@@ -59,6 +59,14 @@ DATABASES = {
     }
 }
 
+# 워커 사이에 공유되는 캐시 (Access 토큰 재발급의 블랙리스트 세대 번호, 유저 활성 상태 - accounts.blacklist)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": config("REDIS_URL", "redis://redis:6379/0"),
+    }
+}
+
 AWS_STORAGE_BUCKET_NAME = config("AWS_STORAGE_BUCKET_NAME")
 AWS_S3_REGION_NAME      = config("AWS_S3_REGION_NAME")
 AWS_ACCESS_KEY_ID       = config("AWS_ACCESS_KEY_ID")
@@ -69,6 +77,8 @@ AWS_S3_SIGNATURE_VERSION = "s3v4"
 AWS_S3_FILE_OVERWRITE = False          # 같은 이름으로 덮어쓰기 방지(특히 media)
 AWS_DEFAULT_ACL = None                 # 기본 ACL 끄기(권장)
 AWS_QUERYSTRING_AUTH = True            # media는 presigned URL
+AWS_QUERYSTRING_EXPIRE = 3600          # presigned URL 만료 시간(초)
+PRESIGNED_URL_CACHE_MARGIN = 300       # 만료 이 시간(초) 전까지 같은 presigned URL을 재사용 (utils.storages)
 AWS_S3_OBJECT_PARAMETERS = {"CacheControl": "max-age=86400"}
 
 # URL 구성
@@ -78,9 +88,9 @@ STATIC_LOCATION = config("STATIC_LOCATION", "static-dev")
 
 # Django 4.2+ : STORAGES 방식
 STORAGES = {
-    # 업로드 미디어(비공개) → presigned URL 로 접근
+    # 업로드 미디어(비공개) → presigned URL 로 접근 (URL은 만료 직전까지 재사용)
     "default": {
-        "BACKEND": "storages.backends.s3.S3Storage",
+        "BACKEND": "utils.storages.CachedPresignedS3Storage",
         "OPTIONS": {
             "bucket_name": AWS_STORAGE_BUCKET_NAME,
             "region_name": AWS_S3_REGION_NAME,
@@ -88,9 +98,10 @@ STORAGES = {
             "custom_domain": AWS_S3_CUSTOM_DOMAIN,
         },
     },
-    # 정적 파일(공개 읽기) → collectstatic 시 S3로 업로드
+    # 정적 파일(공개 읽기) → collectstatic 시 해시를 붙인 이름으로 S3에 업로드
+    # 해시가 붙은 파일만 1년 동안 immutable로 캐시하고, 해시 없는 사본과 manifest는 1시간만 캐시합니다.
     "staticfiles": {
-        "BACKEND": "storages.backends.s3.S3Storage",
+        "BACKEND": "utils.storages.ImmutableHashedS3ManifestStaticStorage",
         "OPTIONS": {
             "bucket_name": AWS_STORAGE_BUCKET_NAME,
             "region_name": AWS_S3_REGION_NAME,
@@ -49,7 +49,7 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt.token_blacklist',
     "accounts.apps.AccountsConfig",
     'couponbook.apps.CouponbookConfig',
-    "utils",
+    "utils.apps.UtilsConfig",
     "data_api",
     "django_filters",
     "corsheaders",
@@ -57,6 +57,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "utils.middleware.RequestIdMiddleware",  # 요청 id를 로그와 X-Request-ID 응답 헤더에 붙임 (계측 로그에도 붙도록 맨 앞에 위치)
+    "utils.middleware.InstrumentationMiddleware",  # 요청별 성능 계측 (전체 처리 시간을 재기 위해 앞쪽에 위치)
+    "utils.middleware.IdentityMapMiddleware",  # 요청 안에서 같은 행을 한 번만 조회하도록 인스턴스를 보관
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -88,10 +91,13 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "modelproject.wsgi.application"
 
+# JSON 응답 렌더러. 기본값인 FastJSONRenderer는 orjson이 설치되어 있으면 orjson을 사용하고, 없으면 DRF JSONRenderer와 같습니다.
+JSON_RENDERER = config("JSON_RENDERER", default="utils.renderers.FastJSONRenderer")
+
 REST_FRAMEWORK = {
     # Authentication
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.RequestCachedJWTAuthentication",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     # Parser
@@ -100,8 +106,45 @@ REST_FRAMEWORK = {
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
+    # Renderer
+    "DEFAULT_RENDERER_CLASSES": [
+        JSON_RENDERER,
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
+# 스탬프가 적립되지 않은 영수증을 보관하는 기간(일). 지나면 prune_receipts 명령어로 삭제(또는 보관 파일로 이동)합니다.
+RECEIPT_TTL_DAYS = config("RECEIPT_TTL_DAYS", default=90, cast=int)
+RECEIPT_PRUNE_BATCH_SIZE = 1_000  # 한 번에 삭제하는 영수증 수. 크게 잡으면 삭제 트랜잭션이 테이블을 오래 잠급니다.
+
+# 쿠폰 만료 처리(sweep_coupon_expiry). 유효기간까지 남은 일수가 이 값 이하가 되면 만료 임박 알림을 보냅니다.
+COUPON_EXPIRING_SOON_DAYS = config("COUPON_EXPIRING_SOON_DAYS", default=3, cast=int)
+COUPON_EXPIRY_BATCH_SIZE = 1_000  # 한 번에 상태를 바꾸는 쿠폰/템플릿 수
+
+# 쿠폰/쿠폰 템플릿 목록 조회에서 .values() 기반의 가벼운 직렬화(couponbook.fastpath)를 사용할지 여부
+FAST_READ_SERIALIZERS = config("FAST_READ_SERIALIZERS", default=True, cast=bool)
+
+# 배치 엔드포인트(/batch/)에서 한 번에 실행할 수 있는 최대 요청 수
+BATCH_MAX_REQUESTS = 10
+
+# 토큰 클레임 기반 JWT 인증(accounts.authentication)에서 유저 활성 상태를 캐시하는 시간(초)
+JWT_CLAIMS_USER_STATUS_TTL = 60
+
+# Access 토큰 재발급에서 확인하는 블랙리스트 캐시(accounts.blacklist)를 세대 번호와 관계없이 DB와 다시 맞추는 주기(초).
+# 블랙리스트 변경은 공유 캐시(CACHES["default"])의 세대 번호로 바로 알리므로, 이 값은 알리지 못했을 때(캐시 서버 장애)의 상한입니다.
+JWT_BLACKLIST_SYNC_INTERVAL = 30
+
+# 만료된 Refresh 토큰 정리(purge_expired_tokens). 한 번에 삭제하는 토큰 수
+TOKEN_PURGE_BATCH_SIZE = 1_000
+
+# 가게 이미지 업로드(couponbook.images). 점주는 presigned POST로 S3에 직접 올리고, generate_thumbnails 명령어가
+# 긴 변 기준 PLACE_THUMBNAIL_SIZES(px) 크기의 WebP 썸네일을 만듭니다. 목록 응답의 thumbnail_url은 PLACE_THUMBNAIL_LIST_SIZE를 사용합니다.
+PLACE_IMAGE_MAX_BYTES = 10 * 1024 * 1024
+PLACE_IMAGE_UPLOAD_EXPIRE = 600  # presigned POST 유효 시간(초)
+PLACE_THUMBNAIL_SIZES = (160, 480, 960)
+PLACE_THUMBNAIL_LIST_SIZE = 480
+PLACE_THUMBNAIL_QUALITY = 80
+
 # drf-spectacular 설정
 
 SPECTACULAR_SETTINGS = {
@@ -162,3 +205,43 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
 AUTH_USER_MODEL = "accounts.User"
+
+
+# 로깅 설정 (utils.logs)
+# 로그는 요청 id가 붙은 한 줄짜리 JSON으로 출력합니다. 출력은 백그라운드 스레드가 하므로 요청을 처리하는 스레드는 stderr를 기다리지 않습니다.
+
+LOG_LEVEL = config("LOG_LEVEL", default="INFO")
+LOG_QUEUE_SIZE = 10_000  # 출력을 기다리는 로그 레코드 수. 가득 차면 새 레코드를 버립니다. (log_records_dropped_total)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "json": {"()": "utils.logs.JSONFormatter"},
+    },
+    "filters": {
+        "request_id": {"()": "utils.logs.RequestIdFilter"},
+    },
+    "handlers": {
+        "json": {
+            "()": "utils.logs.QueueLogHandler",
+            "maxsize": LOG_QUEUE_SIZE,
+            "formatter": "json",
+            "filters": ["request_id"],
+        },
+    },
+    "root": {"handlers": ["json"], "level": "WARNING"},
+    "loggers": {
+        "accounts": {"handlers": ["json"], "level": LOG_LEVEL, "propagate": False},
+        "couponbook": {"handlers": ["json"], "level": LOG_LEVEL, "propagate": False},
+        "utils": {"handlers": ["json"], "level": LOG_LEVEL, "propagate": False},
+    },
+}
+
+# 요청별 성능 계측 결과를 Server-Timing 응답 헤더로 노출할지 여부
+SERVER_TIMING_HEADER = True
+
+# N+1 쿼리 탐지 (utils.nplusone)
+# None: 사용하지 않음(운영), "log": 경고 로그(스테이징), "raise": 예외 발생(테스트)
+NPLUSONE_DETECTION = config("NPLUSONE_DETECTION", default=None)
+NPLUSONE_THRESHOLD = 3  # 한 요청 안에서 같은 모양의 쿼리가 몇 번 반복되면 N+1로 볼지
@@ -19,6 +19,7 @@ from data_api import views as data_views
 from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from utils.views import BatchView, MetricsView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -34,4 +35,8 @@ urlpatterns = [
     path("couponbook/", include("couponbook.urls"), name="couponbook"),
     # 위치 정보 API 엔드포인트 : JSON 형식으로 전국 시/도, 시/군/구, 읍/면/동 데이터 반환
     path("api/", include("data_api.urls")),
+    # 내부용 성능 지표 엔드포인트 (Prometheus 텍스트 형식, 스태프 또는 INTERNAL_IPS만 접근 가능)
+    path("internal/metrics/", MetricsView.as_view(), name="metrics"),
+    # 여러 GET 요청을 한 번에 처리하는 배치 엔드포인트 (앱 시작 화면용)
+    path("batch/", BatchView.as_view(), name="batch"),
 ]
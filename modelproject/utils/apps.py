@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class UtilsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "utils"
+
+    def ready(self):
+        from . import instrumentation
+
+        instrumentation.install()
@@ -0,0 +1,52 @@
+"""
+비동기(async) 핸들러를 사용할 수 있는 DRF 뷰의 기반 클래스입니다.
+
+DRF의 `APIView.dispatch`는 동기 함수이기 때문에 `async def get(...)`과 같은 핸들러를 그대로 사용할 수 없습니다.
+`AsyncAPIView`는 인증, 권한 확인처럼 ORM을 사용하는 부분은 `sync_to_async`로 감싸서 실행하고,
+핸들러는 이벤트 루프 위에서 await 하므로, 외부 API(Gemini, 카카오맵 등)를 기다리는 동안 워커가 묶이지 않습니다.
+
+- ASGI(uvicorn 워커)로 실행하면 이벤트 루프 위에서 바로 실행됩니다.
+- WSGI(gunicorn sync 워커)로 실행해도 장고가 `async_to_sync`로 감싸서 실행하므로 그대로 동작합니다.
+"""
+
+from inspect import isawaitable
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    핸들러(get, post 등)를 `async def`로 작성할 수 있는 APIView입니다.
+
+    한 뷰의 핸들러는 모두 동기이거나 모두 비동기여야 합니다. (장고 `View.view_is_async` 규칙)
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        `APIView.dispatch`와 동일한 순서로 요청을 처리하되, 핸들러의 반환값이 awaitable이면 await 합니다.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            # 인증/권한/스로틀링은 DB를 조회할 수 있으므로 스레드에서 실행합니다.
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,91 @@
+"""
+여러 GET 요청을 한 번의 요청으로 처리하는 배치 요청 유틸리티입니다.
+
+앱 시작 화면처럼 여러 API를 연달아 호출해야 할 때, 요청마다 반복되는 TLS 연결과 HTTP 처리를 한 번으로 줄입니다.
+내부 요청은 URL을 resolve해서 뷰를 직접 호출하며, 바깥 요청의 인증 정보(Authorization 헤더, 쿠키와 세션)를 그대로 넘깁니다.
+인증은 각 뷰의 `authentication_classes`로 다시 하므로, 경로를 직접 요청했을 때와 같은 유저(또는 같은 인증 오류)가 됩니다.
+내부 요청들은 바깥 요청의 identity map을 공유하므로 같은 행(쿠폰, 쿠폰북 id 등)은 요청 전체에서 한 번만 조회됩니다.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from django.contrib.auth import get_user
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from django.utils.functional import SimpleLazyObject
+from rest_framework import status
+from rest_framework.response import Response
+
+
+@dataclass
+class BatchItemResult:
+    status: int
+    body: Any
+
+    def as_dict(self) -> dict:
+        return {'status': self.status, 'body': self.body}
+
+
+def build_internal_request(request: HttpRequest, url: str) -> HttpRequest:
+    """
+    바깥 요청의 헤더(호스트, 스킴, Authorization 등)와 쿠키, 세션을 그대로 사용하는 내부 GET 요청을 만듭니다.
+
+    유저는 강제로 지정하지 않으므로(`_force_auth_user`) 대상 뷰의 인증 클래스가 그대로 실행됩니다.
+    `request.user`는 AuthenticationMiddleware처럼 세션에서 읽습니다. (SessionAuthentication에서 사용)
+    바깥 요청의 `user`는 DRF가 인증한 유저로 바뀌어 있으므로 그대로 넘기지 않습니다.
+    """
+
+    path, _, query_string = url.partition('?')
+    internal = HttpRequest()
+    internal.method = 'GET'
+    internal.path = internal.path_info = path
+    internal.META = {**request.META, 'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': query_string}
+    internal.GET = QueryDict(query_string)
+    internal.COOKIES = request.COOKIES
+    if hasattr(request, 'session'):
+        internal.session = request.session
+        internal.user = SimpleLazyObject(lambda: get_user(internal))
+    else:
+        internal.user = AnonymousUser()
+    return internal
+
+
+def run_internal_get(request: HttpRequest, url: str) -> BatchItemResult:
+    """
+    `url`에 해당하는 뷰를 내부 요청으로 실행하고 상태 코드와 응답 데이터를 반환합니다.
+
+    응답은 렌더링하지 않고 `Response.data`를 그대로 사용하므로, 배치 응답 전체가 한 번만 JSON으로 변환됩니다.
+    DRF 뷰가 아니거나(비동기 뷰, 스트리밍 응답 등) 배치 뷰 자신을 가리키는 경로는 처리하지 않습니다.
+    """
+
+    from .views import BatchView
+
+    path = url.partition('?')[0]
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return BatchItemResult(status.HTTP_404_NOT_FOUND, {'detail': "존재하지 않는 경로입니다."})
+
+    view_class = getattr(match.func, 'view_class', None)
+    if view_class is None or view_class is BatchView or getattr(view_class, 'view_is_async', False):
+        return BatchItemResult(status.HTTP_400_BAD_REQUEST, {'detail': "배치 요청에서 사용할 수 없는 경로입니다."})
+
+    response = match.func(build_internal_request(request, url), *match.args, **match.kwargs)
+    if not isinstance(response, Response):
+        return BatchItemResult(status.HTTP_400_BAD_REQUEST, {'detail': "배치 요청에서 사용할 수 없는 경로입니다."})
+    return BatchItemResult(response.status_code, response.data)
+
+
+def run_batch(request, urls: dict[str, str]) -> dict[str, dict]:
+    """
+    이름 -> URL 딕셔너리의 GET 요청들을 순서대로 실행하고, 이름 -> {status, body} 딕셔너리를 반환합니다.
+
+    `request`는 인증이 끝난 DRF 요청이며, 내부 요청은 같은 인증 정보로 각 뷰에서 다시 인증합니다.
+    """
+
+    return {
+        name: run_internal_get(request._request, url).as_dict()
+        for name, url in urls.items()
+    }
@@ -0,0 +1,111 @@
+"""
+요청 단위 identity map입니다.
+
+한 요청 안에서 같은 행을 여러 곳(권한 확인, 시리얼라이저 검증, 모델 save, 응답 시리얼라이저)에서 조회하는 경우,
+처음 조회한 인스턴스를 contextvar에 (모델, pk)로 보관해 두고 이후에는 같은 인스턴스를 돌려줍니다.
+인스턴스를 공유하므로 그 인스턴스에 캐시된 관계(`coupon.original_template` 등)도 한 번만 조회됩니다.
+
+- `IdentityMapMiddleware`가 요청마다 새 맵을 만듭니다. 배치 요청(/batch/)의 내부 요청들도 같은 맵을 공유합니다.
+- 요청 밖(관리 명령어, 셸 등)에서는 보관하지 않고 매번 조회합니다.
+- 요청 안에서 행을 삭제하거나 `QuerySet.update()`로 바꾼 경우에는 `forget()`으로 맵에서 지워야 합니다.
+- 인스턴스가 아닌 값(유저의 쿠폰북 id 등)은 `get_or_compute()`로 같은 맵에 보관합니다.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, TypeVar
+
+from django.db import models
+
+M = TypeVar('M', bound=models.Model)
+T = TypeVar('T')
+
+_current_map: ContextVar[dict[tuple[str, object], object] | None] = ContextVar('identity_map', default=None)
+
+
+@contextmanager
+def identity_map():
+    """
+    블록 안에서 조회한 인스턴스를 하나의 identity map에 보관합니다.
+    """
+
+    token = _current_map.set({})
+    try:
+        yield
+    finally:
+        _current_map.reset(token)
+
+
+def _key(model: type[models.Model], pk) -> tuple[str, object]:
+    return (model._meta.label, model._meta.pk.to_python(pk))
+
+
+def lookup(model: type[M], pk) -> M | None:
+    """
+    현재 요청에서 이미 조회한 인스턴스를 반환합니다. 없거나 요청 밖이면 None입니다.
+    """
+    current = _current_map.get()
+    if current is None or pk is None:
+        return None
+    return current.get(_key(model, pk))
+
+
+def remember(obj: M) -> M:
+    """
+    인스턴스를 현재 요청의 identity map에 보관하고 그대로 반환합니다.
+    """
+    current = _current_map.get()
+    if current is not None and obj is not None and obj.pk is not None:
+        current[_key(type(obj), obj.pk)] = obj
+    return obj
+
+
+def forget(model: type[models.Model], pk):
+    """
+    현재 요청의 identity map에서 인스턴스를 지웁니다.
+    """
+    current = _current_map.get()
+    if current is not None:
+        current.pop(_key(model, pk), None)
+
+
+def get_or_load(model: type[M], pk, loader: Callable[[], M]) -> M:
+    """
+    이미 조회한 인스턴스가 있으면 반환하고, 없으면 `loader()`로 조회해서 보관한 후 반환합니다.
+
+    `loader`에서 일어난 예외(DoesNotExist, Http404 등)는 그대로 전달됩니다.
+    """
+    obj = lookup(model, pk)
+    if obj is None:
+        obj = remember(loader())
+    return obj
+
+
+def get_or_compute(name: str, key, compute: Callable[[], T]) -> T:
+    """
+    모델 인스턴스가 아닌 값을 현재 요청에 `(name, key)`로 보관합니다. None도 보관하므로 다시 계산하지 않습니다.
+
+    요청 밖에서는 보관하지 않고 매번 `compute()`를 호출합니다.
+    """
+    current = _current_map.get()
+    if current is None:
+        return compute()
+    map_key = (f'value:{name}', key)
+    if map_key not in current:
+        current[map_key] = compute()
+    return current[map_key]
+
+
+def related(instance: models.Model, field_name: str):
+    """
+    `instance`의 정방향 관계(ForeignKey, OneToOneField) 인스턴스를 반환합니다.
+
+    인스턴스에 아직 캐시되지 않았으면 identity map에서 먼저 찾고, 없으면 조회해서 보관합니다.
+    """
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        return remember(getattr(instance, field_name))
+
+    obj = get_or_load(field.related_model, getattr(instance, field.attname), lambda: getattr(instance, field_name))
+    field.set_cached_value(instance, obj)
+    return obj
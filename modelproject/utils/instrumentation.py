@@ -0,0 +1,142 @@
+"""
+요청 단위 성능 계측 도구입니다.
+
+요청마다 `RequestMetrics`를 contextvar에 두고, 다음 값을 누적합니다.
+
+- DB 쿼리 수와 총 실행 시간: 연결이 생성될 때(`connection_created`) execute wrapper를 설치해서 측정합니다.
+- 시리얼라이저 시간: `BaseSerializer.data` 접근 시간을 측정합니다. 중첩된 시리얼라이저는 가장 바깥쪽만 계산합니다.
+- 외부 호출 시간(카카오맵, 제미나이, S3 등): 호출하는 곳을 `timed("kakao")`처럼 감싸서 측정합니다.
+- N+1 쿼리 탐지: `NPLUSONE_DETECTION`이 설정되어 있으면 쿼리마다 `utils.nplusone`으로 검사합니다.
+
+contextvar는 `sync_to_async`/`async_to_sync`를 거쳐도 전달되므로 비동기 뷰에서도 같은 요청으로 집계됩니다.
+요청 밖(관리 명령어, 셸 등)에서는 아무 것도 기록하지 않습니다.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from django.db.backends.signals import connection_created
+
+from . import nplusone
+
+
+@dataclass
+class RequestMetrics:
+    db_queries: int = 0
+    db_time: float = 0.0  # 초
+    serializer_time: float = 0.0  # 초
+    external_time: dict[str, float] = field(default_factory=dict)  # 서비스 이름 -> 초
+    serializer_depth: int = 0  # 중첩된 시리얼라이저 중복 계산 방지용
+    nplusone_mode: str | None = None  # None, "log", "raise"
+    query_fingerprints: dict[str, int] = field(default_factory=dict)  # SQL 지문 -> 실행 횟수
+    nplusone_reports: list[dict] = field(default_factory=list)  # 탐지된 N+1 쿼리 (위치, 지문)
+
+
+_current_metrics: ContextVar[RequestMetrics | None] = ContextVar('request_metrics', default=None)
+
+
+def get_current_metrics() -> RequestMetrics | None:
+    """
+    현재 요청의 계측 값을 반환합니다. 요청 밖이면 None입니다.
+    """
+    return _current_metrics.get()
+
+
+@contextmanager
+def collect_metrics():
+    """
+    블록 안에서 일어난 DB 쿼리, 시리얼라이저, 외부 호출을 하나의 `RequestMetrics`로 모읍니다.
+    """
+
+    metrics = RequestMetrics(nplusone_mode=nplusone.get_detection_mode())
+    token = _current_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+@contextmanager
+def timed(service: str):
+    """
+    외부 서비스 호출 시간을 현재 요청의 계측 값에 더합니다.
+
+    사용 예: `with timed("kakao"): requests.get(...)`
+    """
+
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    started_at = perf_counter()
+    try:
+        yield
+    finally:
+        metrics.external_time[service] = metrics.external_time.get(service, 0.0) + perf_counter() - started_at
+
+
+# ---- DB ----
+def db_execute_wrapper(execute, sql, params, many, context):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    started_at = perf_counter()
+    try:
+        result = execute(sql, params, many, context)
+    finally:
+        metrics.db_queries += 1
+        metrics.db_time += perf_counter() - started_at
+
+    if metrics.nplusone_mode:
+        nplusone.inspect_query(metrics, sql)
+    return result
+
+
+def install_db_wrapper(sender, connection, **kwargs):
+    if db_execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(db_execute_wrapper)
+
+
+# ---- 시리얼라이저 ----
+def timed_serializer_data(data_property: property) -> property:
+    """
+    시리얼라이저의 `data` 프로퍼티를 감싸서 직렬화 시간을 측정하는 프로퍼티를 만듭니다.
+    """
+
+    def data(self):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return data_property.fget(self)
+
+        metrics.serializer_depth += 1
+        started_at = perf_counter()
+        try:
+            return data_property.fget(self)
+        finally:
+            metrics.serializer_depth -= 1
+            if metrics.serializer_depth == 0:
+                metrics.serializer_time += perf_counter() - started_at
+
+    data.__wrapped__ = data_property.fget
+    return property(data)
+
+
+def install():
+    """
+    DB 연결과 시리얼라이저에 계측 코드를 설치합니다. `UtilsConfig.ready()`에서 한 번 호출됩니다.
+    """
+
+    from django.db import connections
+    from rest_framework.serializers import BaseSerializer
+
+    connection_created.connect(install_db_wrapper, dispatch_uid='utils.instrumentation')
+    # 이미 열려 있는 연결에도 설치합니다.
+    for connection in connections.all(initialized_only=True):
+        install_db_wrapper(None, connection)
+
+    if not hasattr(BaseSerializer.data.fget, '__wrapped__'):
+        BaseSerializer.data = timed_serializer_data(BaseSerializer.data)
@@ -0,0 +1,164 @@
+"""
+구조화(JSON) 로그와 요청 스레드를 막지 않는 로그 출력입니다. (settings_base.LOGGING)
+
+- `print()`나 `StreamHandler`는 요청을 처리하는 스레드에서 stderr에 직접 쓰기 때문에, gunicorn이 출력을 받아 가는 동안
+  같은 워커의 스레드들이 출력 잠금을 기다립니다. `QueueLogHandler`는 레코드를 JSON 한 줄로 만들어 큐에 넣기만 하고,
+  실제 출력은 백그라운드 스레드(`QueueListener`)가 합니다.
+- 로그 한 줄에는 요청 id(`RequestIdMiddleware`)가 들어가므로 같은 요청에서 남긴 로그를 모아 볼 수 있습니다.
+- `log_event()`로 남긴 이벤트는 `app_events_total` 카운터(/internal/metrics/)에도 집계됩니다.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from .metrics import REGISTRY
+
+EVENTS = REGISTRY.counter('app_events_total', "log_event()로 남긴 이벤트 수", ('logger', 'event', 'reason'))
+LOG_RECORDS_DROPPED = REGISTRY.counter('log_records_dropped_total', "로그 큐가 가득 차서 버린 로그 레코드 수")
+
+_request_id: ContextVar[str | None] = ContextVar('request_id', default=None)
+
+
+def get_request_id() -> str | None:
+    """
+    현재 요청의 id를 반환합니다. 요청 밖이면 None입니다.
+    """
+    return _request_id.get()
+
+
+@contextmanager
+def request_id_context(request_id: str):
+    """
+    블록 안에서 남긴 로그에 `request_id`를 붙입니다.
+    """
+
+    token = _request_id.set(request_id)
+    try:
+        yield
+    finally:
+        _request_id.reset(token)
+
+
+def log_event(logger: logging.Logger, event: str, message: str, *, level: int = logging.INFO,
+              reason: str = '', exc_info=None, **fields):
+    """
+    `event` 이름과 `fields`를 담은 구조화 로그를 남기고, `app_events_total{logger, event, reason}`을 1 올립니다.
+
+    사용 예: `log_event(logger, 'coupon_rejected', "...", level=logging.WARNING, reason='sold_out', template_id=3)`
+    """
+
+    EVENTS.inc(logger=logger.name, event=event, reason=reason)
+    if reason:
+        fields['reason'] = reason
+    logger.log(level, message, exc_info=exc_info, extra={'event': event, 'fields': fields})
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    레코드에 현재 요청의 id(`record.request_id`)를 붙입니다.
+
+    요청 id는 contextvar에 있으므로, 큐로 넘기기 전(로그를 남긴 스레드)에 실행되도록 핸들러에 답니다.
+    미들웨어를 모두 빠져나온 뒤에 남기는 django.request 로그(4xx/5xx 응답)는 레코드의 `request`에서 id를 가져옵니다.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'request_id'):
+            record.request_id = _request_id.get() or getattr(getattr(record, 'request', None), 'request_id', None)
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    레코드를 JSON 한 줄로 만듭니다.
+
+    예) {"time": "2025-08-30T12:00:00.123+00:00", "level": "WARNING", "logger": "couponbook.models",
+        "event": "coupon_rejected", "message": "...", "request_id": "3f2a...", "reason": "sold_out", "template_id": 3}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+        }
+        event = getattr(record, 'event', None)
+        message = record.getMessage()
+        if event:
+            entry['event'] = event
+        if message != event:
+            entry['message'] = message
+        entry['request_id'] = getattr(record, 'request_id', None)
+        entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    포맷한 레코드를 큐에 넣고, 백그라운드 스레드가 `stream`(기본값 stderr)에 출력하는 핸들러입니다.
+
+    - 포맷(과 필터)은 로그를 남긴 스레드에서 실행되고, 출력만 백그라운드 스레드에서 합니다.
+    - 큐가 가득 차면 기다리지 않고 레코드를 버린 뒤 `log_records_dropped_total`을 올립니다.
+    - 백그라운드 스레드는 프로세스에서 처음 로그를 남길 때 시작합니다. (gunicorn이 fork한 워커에서도 새로 시작합니다.)
+    - 프로세스가 끝날 때(`logging.shutdown`) 큐에 남은 레코드를 모두 출력합니다.
+    """
+
+    def __init__(self, stream=None, maxsize: int = 10_000):
+        super().__init__(queue.Queue(maxsize))
+        self.maxsize = maxsize
+        self.target = logging.StreamHandler(stream)
+        self._listener: QueueListener | None = None
+        self._pid: int | None = None
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        if self._pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                # fork한 자식 프로세스에는 부모의 출력 스레드가 없으므로 큐와 스레드를 새로 만듭니다.
+                self.queue = queue.Queue(self.maxsize)
+            self._listener = QueueListener(self.queue, self.target)
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def stop(self):
+        """
+        큐에 남은 레코드를 모두 출력하고 백그라운드 스레드를 멈춥니다.
+        """
+
+        with self._start_lock:
+            if self._listener is None or self._pid != os.getpid():
+                return
+            try:
+                self._listener.stop()
+            except queue.Full:
+                pass  # 종료 신호를 넣을 자리가 없으면 스레드(데몬)를 그대로 둡니다.
+            self._listener = None
+            self._pid = None
+
+    def enqueue(self, record: logging.LogRecord):
+        self.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+    def flush(self):
+        self.target.flush()
+
+    def close(self):
+        self.stop()
+        self.target.close()
+        super().close()
@@ -0,0 +1,146 @@
+"""
+라우트별 성능 지표와 이벤트 수를 모아 Prometheus 텍스트 형식으로 내보내는 간단한 히스토그램/카운터 레지스트리입니다.
+
+지표는 프로세스 메모리에 저장되므로, gunicorn 워커가 여러 개라면 워커마다 따로 집계됩니다.
+(수집기는 요청을 받은 워커의 값만 보게 되므로, 워커별로 스크랩하거나 합산해서 사용합니다.)
+"""
+
+import threading
+from bisect import bisect_left
+
+# 초 단위 지연 시간 버킷
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 요청당 쿼리 수 버킷
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """
+    레이블 조합별로 버킷 카운트, 합계, 개수를 저장하는 히스토그램입니다.
+    """
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...], buckets: tuple[float, ...]):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: dict[tuple[str, ...], list] = {}  # 레이블 값 -> [버킷별 카운트, 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels[name]) for name in self.label_names)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            snapshot = sorted((key, (list(counts), total, n)) for key, (counts, total, n) in self._series.items())
+
+        for key, (counts, total, n) in snapshot:
+            labels = dict(zip(self.label_names, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{_format_labels({**labels, "le": _format_number(bound)})} {cumulative}')
+            lines.append(f'{self.name}_bucket{_format_labels({**labels, "le": "+Inf"})} {n}')
+            lines.append(f'{self.name}_sum{_format_labels(labels)} {_format_number(total)}')
+            lines.append(f'{self.name}_count{_format_labels(labels)} {n}')
+        return lines
+
+
+class Counter:
+    """
+    레이블 조합별로 누적 값을 저장하는 카운터입니다.
+    """
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._series: dict[tuple[str, ...], float] = {}  # 레이블 값 -> 누적 값
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(str(labels[name]) for name in self.label_names)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._series.get(tuple(str(labels[name]) for name in self.label_names), 0)
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} counter']
+        with self._lock:
+            snapshot = sorted(self._series.items())
+
+        for key, value in snapshot:
+            lines.append(f'{self.name}{_format_labels(dict(zip(self.label_names, key)))} {_format_number(value)}')
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: dict[str, Histogram | Counter] = {}
+
+    def histogram(self, name: str, description: str, label_names: tuple[str, ...],
+                  buckets: tuple[float, ...] = DURATION_BUCKETS) -> Histogram:
+        if name not in self.metrics:
+            self.metrics[name] = Histogram(name, description, label_names, buckets)
+        return self.metrics[name]
+
+    def counter(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> Counter:
+        if name not in self.metrics:
+            self.metrics[name] = Counter(name, description, label_names)
+        return self.metrics[name]
+
+    def clear(self):
+        for metric in self.metrics.values():
+            metric.clear()
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines += metric.render()
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_DURATION = REGISTRY.histogram(
+    'http_request_duration_seconds', "요청 처리 시간", ('method', 'route', 'status'))
+REQUEST_DB_QUERIES = REGISTRY.histogram(
+    'http_request_db_queries', "요청당 DB 쿼리 수", ('method', 'route'), QUERY_COUNT_BUCKETS)
+REQUEST_DB_DURATION = REGISTRY.histogram(
+    'http_request_db_duration_seconds', "요청당 DB 쿼리 실행 시간", ('method', 'route'))
+REQUEST_SERIALIZER_DURATION = REGISTRY.histogram(
+    'http_request_serializer_duration_seconds', "요청당 직렬화 시간", ('method', 'route'))
+REQUEST_EXTERNAL_DURATION = REGISTRY.histogram(
+    'http_request_external_duration_seconds', "요청당 외부 서비스 호출 시간", ('method', 'route', 'service'))
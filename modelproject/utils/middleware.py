@@ -0,0 +1,175 @@
+import logging
+import re
+from time import perf_counter
+from uuid import uuid4
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .identity_map import identity_map
+from .instrumentation import RequestMetrics, collect_metrics
+from .logs import request_id_context
+from .metrics import (REQUEST_DB_DURATION, REQUEST_DB_QUERIES,
+                      REQUEST_DURATION, REQUEST_EXTERNAL_DURATION,
+                      REQUEST_SERIALIZER_DURATION)
+from .signals import request_metrics_collected
+
+logger = logging.getLogger('utils.instrumentation')
+
+
+class RequestIdMiddleware:
+    """
+    요청마다 id를 정해서 요청 중에 남기는 로그(`utils.logs`)에 붙이고, `X-Request-ID` 응답 헤더로 돌려줍니다.
+
+    nginx가 넘겨준 `X-Request-ID`가 있으면 그대로 사용하고, 없거나 형식이 맞지 않으면 새로 만듭니다.
+    계측 로그에도 id가 붙도록 MIDDLEWARE의 맨 앞에 둡니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+    header_pattern = re.compile(r'[A-Za-z0-9._-]{1,64}')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        request.request_id = self.get_request_id(request)
+        with request_id_context(request.request_id):
+            response = self.get_response(request)
+        response['X-Request-ID'] = request.request_id
+        return response
+
+    async def __acall__(self, request):
+        request.request_id = self.get_request_id(request)
+        with request_id_context(request.request_id):
+            response = await self.get_response(request)
+        response['X-Request-ID'] = request.request_id
+        return response
+
+    def get_request_id(self, request) -> str:
+        request_id = request.headers.get('X-Request-ID', '')
+        if self.header_pattern.fullmatch(request_id):
+            return request_id
+        return uuid4().hex
+
+
+class InstrumentationMiddleware:
+    """
+    요청마다 DB 쿼리 수/시간, 시리얼라이저 시간, 외부 호출 시간을 측정해서
+    `Server-Timing` 헤더와 구조화된 로그로 남기고, 라우트별 히스토그램에 기록합니다.
+
+    전체 처리 시간을 재기 위해 MIDDLEWARE의 맨 앞에 둡니다.
+    `SERVER_TIMING_HEADER = False`로 설정하면 응답 헤더는 붙이지 않습니다.
+    """
+
+    sync_capable = True
+    async_capable = True  # ASGI에서 비동기 뷰를 스레드로 감싸지 않도록 비동기로도 동작합니다.
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started_at = perf_counter()
+        with collect_metrics() as metrics:
+            response = self.get_response(request)
+        return self.process_metrics(request, response, perf_counter() - started_at, metrics)
+
+    async def __acall__(self, request):
+        started_at = perf_counter()
+        with collect_metrics() as metrics:
+            response = await self.get_response(request)
+        return self.process_metrics(request, response, perf_counter() - started_at, metrics)
+
+    def process_metrics(self, request, response, total: float, metrics: RequestMetrics):
+        """
+        측정 결과를 히스토그램에 기록하고, `Server-Timing` 헤더와 로그를 남깁니다.
+        """
+
+        route = self.get_route(request)
+        self.record(request.method, route, response.status_code, total, metrics)
+        if getattr(settings, 'SERVER_TIMING_HEADER', True):
+            response['Server-Timing'] = self.server_timing(total, metrics)
+        logger.info('request', extra={'event': 'request', 'fields': {
+            'method': request.method,
+            'route': route,
+            'path': request.path,
+            'status': response.status_code,
+            'duration_ms': round(total * 1000, 2),
+            'db_queries': metrics.db_queries,
+            'db_ms': round(metrics.db_time * 1000, 2),
+            'serializer_ms': round(metrics.serializer_time * 1000, 2),
+            'external_ms': {service: round(t * 1000, 2) for service, t in metrics.external_time.items()},
+            'nplusone': [report['origin'] for report in metrics.nplusone_reports],
+        }})
+        request_metrics_collected.send(sender=self.__class__, request=request, route=route, metrics=metrics)
+        return response
+
+    def get_route(self, request) -> str:
+        """
+        히스토그램 레이블로 사용할 URL 패턴을 반환합니다. (예: couponbook/coupons/<int:coupon_id>/)
+
+        경로 그대로 사용하면 id마다 레이블이 생기므로 URL 패턴을 사용합니다.
+        """
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None:
+            return 'unmatched'
+        return resolver_match.route
+
+    def record(self, method: str, route: str, status: int, total: float, metrics: RequestMetrics):
+        REQUEST_DURATION.observe(total, method=method, route=route, status=status)
+        REQUEST_DB_QUERIES.observe(metrics.db_queries, method=method, route=route)
+        REQUEST_DB_DURATION.observe(metrics.db_time, method=method, route=route)
+        REQUEST_SERIALIZER_DURATION.observe(metrics.serializer_time, method=method, route=route)
+        for service, t in metrics.external_time.items():
+            REQUEST_EXTERNAL_DURATION.observe(t, method=method, route=route, service=service)
+
+    def server_timing(self, total: float, metrics: RequestMetrics) -> str:
+        """
+        `Server-Timing` 헤더 값을 만듭니다. 시간은 밀리초 단위입니다.
+
+        예) db;dur=12.3;desc="8 queries", serializer;dur=4.1, kakao;dur=120.0, total;dur=140.2
+        """
+
+        entries = [
+            f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.db_queries} queries"',
+            f'serializer;dur={metrics.serializer_time * 1000:.1f}',
+        ]
+        entries += [f'{service};dur={t * 1000:.1f}' for service, t in metrics.external_time.items()]
+        entries.append(f'total;dur={total * 1000:.1f}')
+        return ', '.join(entries)
+
+
+class IdentityMapMiddleware:
+    """
+    요청마다 새 identity map(`utils.identity_map`)을 만들어, 같은 행을 요청 안에서 한 번만 조회하게 합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with identity_map():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with identity_map():
+            return await self.get_response(request)
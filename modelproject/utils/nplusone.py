@@ -0,0 +1,106 @@
+"""
+한 요청 안에서 같은 모양의 SQL이 반복되는 N+1 쿼리를 찾아내는 탐지기입니다.
+
+`utils.instrumentation`의 DB execute wrapper 위에서 동작합니다. 쿼리마다 리터럴과 IN 목록 길이를 지운
+지문(fingerprint)을 만들어 세고, 같은 지문이 `NPLUSONE_THRESHOLD`번(기본 3번) 나오면
+호출 스택에서 쿼리를 일으킨 시리얼라이저 필드를 찾아 보고합니다.
+
+settings의 `NPLUSONE_DETECTION`으로 동작 방식을 정합니다.
+
+- None: 탐지하지 않습니다. (운영 환경 기본값)
+- "log": 경고 로그를 남깁니다. (스테이징)
+- "raise": `NPlusOneError`를 일으킵니다. (테스트)
+"""
+
+import logging
+import re
+import sys
+
+from django.conf import settings
+
+logger = logging.getLogger('utils.nplusone')
+
+DEFAULT_THRESHOLD = 3
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*(?:%s|\?|NULL)\s*,?)+\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+
+class NPlusOneError(Exception):
+    """
+    `NPLUSONE_DETECTION = "raise"`일 때 N+1 쿼리가 탐지되면 일어나는 예외입니다.
+    """
+
+
+def get_detection_mode() -> str | None:
+    return getattr(settings, 'NPLUSONE_DETECTION', None)
+
+
+def fingerprint(sql: str) -> str:
+    """
+    파라미터 값과 관계없이 같은 모양의 쿼리가 같은 문자열이 되도록 SQL을 정규화합니다.
+    """
+
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = sql.replace('%s', '?')
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+def find_origin() -> str:
+    """
+    호출 스택을 거슬러 올라가며 쿼리를 일으킨 시리얼라이저 필드를 찾습니다.
+
+    중첩된 시리얼라이저라면 바깥쪽부터 `CouponDetailResponseSerializer.place > PlaceDetailResponseSerializer.address`처럼
+    이어서 반환합니다. 시리얼라이저 밖에서 일어난 쿼리라면 프로젝트 코드의 파일 위치를 반환합니다.
+    """
+
+    from rest_framework.fields import Field
+
+    fields, seen = [], set()
+    app_location = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        owner = frame.f_locals.get('self')
+        if isinstance(owner, Field) and owner.field_name and owner.parent is not None and id(owner) not in seen:
+            seen.add(id(owner))
+            fields.append(f'{type(owner.parent).__name__}.{owner.field_name}')
+        elif app_location is None and _is_app_frame(frame):
+            app_location = f'{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})'
+        frame = frame.f_back
+
+    if fields:
+        return ' > '.join(reversed(fields))
+    return app_location or 'unknown'
+
+
+def _is_app_frame(frame) -> bool:
+    filename = frame.f_code.co_filename
+    return (filename.startswith(str(settings.BASE_DIR))
+            and 'site-packages' not in filename
+            and not filename.endswith('utils/nplusone.py')
+            and not filename.endswith('utils/instrumentation.py'))
+
+
+def inspect_query(metrics, sql: str):
+    """
+    실행된 쿼리를 현재 요청의 지문 카운터에 더하고, 반복 횟수가 임계값에 도달하면 보고합니다.
+
+    같은 지문은 요청당 한 번만 보고합니다.
+    """
+
+    key = fingerprint(sql)
+    count = metrics.query_fingerprints.get(key, 0) + 1
+    metrics.query_fingerprints[key] = count
+    if count != getattr(settings, 'NPLUSONE_THRESHOLD', DEFAULT_THRESHOLD):
+        return
+
+    origin = find_origin()
+    message = f"N+1 쿼리가 탐지되었습니다. ({count}회 이상 반복, 위치: {origin})\n{key}"
+    metrics.nplusone_reports.append({'origin': origin, 'fingerprint': key})
+    if metrics.nplusone_mode == 'raise':
+        raise NPlusOneError(message)
+    logger.warning(message)
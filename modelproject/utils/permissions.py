@@ -0,0 +1,15 @@
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+
+class IsStaffOrInternalIP(BasePermission):
+    """
+    스태프 유저이거나, settings의 `INTERNAL_IPS`에 있는 주소에서 온 요청인지 확인합니다.
+
+    사용되는 뷰: MetricsView (permission)
+    """
+
+    def has_permission(self, request, view) -> bool:
+        if request.META.get('REMOTE_ADDR') in getattr(settings, 'INTERNAL_IPS', []):
+            return True
+        return bool(request.user and request.user.is_staff)
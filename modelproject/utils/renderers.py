@@ -0,0 +1,52 @@
+"""
+JSON 응답 렌더러입니다.
+
+`FastJSONRenderer`는 orjson이 설치되어 있으면 orjson으로 JSON을 만들고, 없으면 DRF의 `JSONRenderer`와 똑같이 동작합니다.
+settings의 `REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"]`에서 선택합니다. (환경 변수 `JSON_RENDERER`)
+
+orjson으로 만든 결과도 DRF `JSONRenderer`와 같은 바이트가 되도록 맞춥니다.
+
+- datetime, date, time은 orjson 기본 포맷 대신 DRF의 `JSONEncoder`에 넘겨서 같은 문자열로 만듭니다.
+- Decimal, lazy 번역 문자열 등 orjson이 모르는 타입도 DRF의 `JSONEncoder`로 변환합니다.
+- `\\u2028`, `\\u2029`는 DRF처럼 이스케이프합니다.
+- 들여쓰기를 요청한 경우(브라우저블 API, `indent` 미디어 타입 파라미터)는 DRF `JSONRenderer`로 처리합니다.
+- NaN, Infinity는 예외 대신 null로 출력됩니다.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # orjson은 prod 의존성입니다.
+    orjson = None
+
+_LINE_SEPARATOR = '\u2028'.encode()
+_PARAGRAPH_SEPARATOR = '\u2029'.encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson이 있으면 orjson으로, 없으면 DRF `JSONRenderer`로 JSON을 만드는 렌더러입니다.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.encoder_class().default,
+                           option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        if _LINE_SEPARATOR in ret or _PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(_LINE_SEPARATOR, b'\\u2028').replace(_PARAGRAPH_SEPARATOR, b'\\u2029')
+        return ret
+
+
+def is_fast_json_available() -> bool:
+    """
+    `FastJSONRenderer`가 orjson을 사용하는지 여부입니다.
+    """
+    return orjson is not None
+
@@ -0,0 +1,38 @@
+from django.conf import settings
+from drf_spectacular.utils import OpenApiExample, extend_schema_serializer
+from rest_framework import serializers
+
+
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            "앱 시작 화면 요청 예시",
+            {
+                "requests": {
+                    "couponbook": "/couponbook/own-couponbook/",
+                    "coupons": "/couponbook/couponbooks/1/coupons/?is_expired=false",
+                    "favorites": "/couponbook/couponbooks/1/favorites/",
+                    "templates": "/couponbook/coupon-templates/",
+                    "me": "/accounts/auth/me/",
+                },
+            },
+            request_only=True,
+        )
+    ]
+)
+class BatchRequestSerializer(serializers.Serializer):
+    """
+    배치 요청에 사용되는 시리얼라이저입니다. 응답에서 결과를 구분할 이름과 GET 요청할 경로(쿼리스트링 포함)를 받습니다.
+    """
+
+    requests = serializers.DictField(child=serializers.CharField(max_length=2048), allow_empty=False,
+                                     help_text="이름 -> 경로 딕셔너리입니다. 경로는 '/'로 시작해야 합니다.")
+
+    def validate_requests(self, value: dict[str, str]) -> dict[str, str]:
+        if len(value) > settings.BATCH_MAX_REQUESTS:
+            raise serializers.ValidationError(f"한 번에 최대 {settings.BATCH_MAX_REQUESTS}개까지 요청할 수 있습니다.")
+        for url in value.values():
+            if not url.startswith('/'):
+                raise serializers.ValidationError("경로는 '/'로 시작해야 합니다.")
+        return value
+
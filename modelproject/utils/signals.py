@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# 요청 하나의 계측이 끝났을 때 보내는 시그널입니다.
+# 인자: request, route(URL 패턴), metrics(utils.instrumentation.RequestMetrics)
+request_metrics_collected = Signal()
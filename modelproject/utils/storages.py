@@ -0,0 +1,68 @@
+"""
+배포 환경에서 쓰는 S3 스토리지입니다.
+
+presigned URL을 재사용하는 media 스토리지 (deploy_settings.STORAGES["default"])
+
+`AWS_QUERYSTRING_AUTH = True`이면 `storage.url(name)`을 호출할 때마다 SigV4 서명을 새로 계산하고, 서명 시각이 URL에 들어가서
+같은 파일이라도 응답마다 URL이 달라집니다. 그러면 목록 응답에서 이미지 수만큼 서명 비용이 들고, 클라이언트는 URL이 바뀌어서
+이미지를 캐시하지 못합니다.
+
+여기서는 한 번 만든 URL을 만료 `PRESIGNED_URL_CACHE_MARGIN`초 전까지 프로세스 메모리(`TTLCache`)에 보관해서 그대로 반환합니다.
+
+- 기본 만료 시간(`AWS_QUERYSTRING_EXPIRE`)으로 만드는 GET URL만 캐시합니다. 파라미터, 만료 시간, HTTP 메소드를 지정하면 매번 서명합니다.
+- 캐시는 워커 프로세스마다 따로 있으므로, 워커가 여러 개면 워커 수만큼 다른 URL이 나올 수 있습니다.
+- 파일을 삭제하면 해당 URL도 캐시에서 지웁니다.
+
+해시가 붙은 파일만 immutable로 캐시하는 정적 파일 스토리지 (deploy_settings.STORAGES["staticfiles"])
+
+collectstatic은 해시가 붙은 사본(app.3f2a9c1b7d4e.css)과 원래 이름의 사본(app.css), manifest(staticfiles.json)를 함께 올립니다.
+원래 이름의 파일은 다음 배포에서 내용이 바뀌므로 `STATIC_UNHASHED_CACHE_CONTROL`(기본값 1시간)로 올립니다.
+"""
+
+import re
+
+from django.conf import settings
+from storages.backends.s3 import S3ManifestStaticStorage, S3Storage
+from storages.utils import clean_name
+
+from .ttl_cache import TTLCache
+
+
+class CachedPresignedS3Storage(S3Storage):
+    """
+    presigned URL을 만료 직전까지 재사용하는 `S3Storage`입니다.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        margin = getattr(settings, 'PRESIGNED_URL_CACHE_MARGIN', 300)
+        self.url_cache = TTLCache(ttl=self.querystring_expire - margin,
+                                  maxsize=getattr(settings, 'PRESIGNED_URL_CACHE_SIZE', 10_000))
+
+    def url(self, name, parameters=None, expire=None, http_method=None):
+        if not self.querystring_auth or parameters or expire is not None or http_method or self.url_cache.ttl <= 0:
+            return super().url(name, parameters, expire, http_method)
+
+        sign = super().url
+        return self.url_cache.get_or_set(clean_name(name), lambda: sign(name))
+
+    def delete(self, name):
+        super().delete(name)
+        self.url_cache.delete(clean_name(name))
+
+
+class ImmutableHashedS3ManifestStaticStorage(S3ManifestStaticStorage):
+    """
+    해시가 붙은 이름에만 `Cache-Control: public, max-age=31536000, immutable`을 붙이는 `S3ManifestStaticStorage`입니다.
+    """
+
+    hashed_name_pattern = re.compile(r'\.[0-9a-f]{12}(\.[^./]+)?$')
+    hashed_cache_control = 'public, max-age=31536000, immutable'
+
+    def get_object_parameters(self, name):
+        params = super().get_object_parameters(name)
+        if self.hashed_name_pattern.search(name):
+            params['CacheControl'] = self.hashed_cache_control
+        else:
+            params['CacheControl'] = getattr(settings, 'STATIC_UNHASHED_CACHE_CONTROL', 'public, max-age=3600')
+        return params
@@ -0,0 +1,40 @@
+"""
+WSGI와 ASGI에서 모두 메모리에 모으지 않고 내보내는 스트리밍 응답.
+
+장고는 ASGI에서 동기 이터레이터를, WSGI에서 비동기 이터레이터를 받으면 전체를 메모리에 모은 후에 응답합니다.
+`streaming_response()`는 요청이 ASGI로 들어왔으면 동기 이터레이터를 비동기 이터레이터로 감싸서,
+어느 쪽으로 실행해도 조각마다 바로 내보내도록 합니다.
+"""
+
+from typing import AsyncIterator, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, StreamingHttpResponse
+
+_DONE = object()
+
+
+async def iterate_in_thread(iterator: Iterator) -> AsyncIterator:
+    """
+    동기 이터레이터를 한 조각씩 스레드에서 꺼내는 비동기 이터레이터로 감쌉니다.
+
+    DB 커서를 사용하는 이터레이터는 같은 스레드(같은 DB 연결)에서 꺼내야 하므로 thread_sensitive로 실행합니다.
+    """
+    next_item = sync_to_async(next, thread_sensitive=True)
+    while (item := await next_item(iterator, _DONE)) is not _DONE:
+        yield item
+
+
+def streaming_response(request: HttpRequest, content: Iterator[bytes], content_type: str,
+                       filename: str | None = None) -> StreamingHttpResponse:
+    """
+    `content`를 조각마다 바로 내보내는 응답을 만듭니다. `filename`을 주면 파일로 내려받도록 합니다.
+    """
+
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        content = iterate_in_thread(content)
+    response = StreamingHttpResponse(content, content_type=content_type)
+    if filename:
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
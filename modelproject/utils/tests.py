@@ -0,0 +1,579 @@
+import io
+import json
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from importlib.util import find_spec
+from unittest import mock, skipUnless
+from uuid import UUID
+
+from accounts.models import User
+from couponbook.models import Coupon, CouponBook, CouponTemplate
+from couponbook.serializers import TIME_FORMAT, CachedTimeField
+from couponbook.tests.receipttests import create_place
+from couponbook.tests.decorators import print_success_message
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import set_script_prefix
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .identity_map import get_or_compute, get_or_load, identity_map, lookup, related
+from .instrumentation import collect_metrics, timed
+from .logs import (EVENTS, LOG_RECORDS_DROPPED, JSONFormatter, QueueLogHandler,
+                   RequestIdFilter, log_event, request_id_context)
+from .metrics import REGISTRY, Counter, Histogram
+from .nplusone import NPlusOneError, fingerprint
+from .renderers import FastJSONRenderer, is_fast_json_available
+from .url_templates import url_template
+
+# 성능 계측 관련 테스트케이스
+
+
+class InstrumentationTestCase(APITestCase):
+    """
+    요청별 성능 계측 미들웨어와 지표 엔드포인트를 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        REGISTRY.clear()
+        self.user = User.objects.create(username='test', password='1234')
+        self.staff = User.objects.create(username='staff', password='1234', is_staff=True)
+        return super().setUp()
+
+    @print_success_message("Server-Timing 헤더에 쿼리 수와 처리 시간이 담기는지 테스트")
+    def test_server_timing_header(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        r = self.client.get('/couponbook/own-couponbook/')
+
+        self.assertEqual(r.status_code, 200)
+        server_timing = r['Server-Timing']
+        self.assertIn('db;dur=', server_timing)
+        self.assertRegex(server_timing, r'desc="[1-9]\d* queries"')
+        self.assertIn('serializer;dur=', server_timing)
+        self.assertIn('total;dur=', server_timing)
+
+    @print_success_message("라우트별 히스토그램이 Prometheus 형식으로 노출되는지 테스트")
+    @override_settings(INTERNAL_IPS=[])
+    def test_metrics_endpoint(self):
+        self.client.get('/couponbook/coupon-templates/')
+
+        # 일반 유저는 접근할 수 없습니다.
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        r = self.client.get('/internal/metrics/')
+        self.assertEqual(r.status_code, 403, "일반 유저가 성능 지표를 조회했습니다!")
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.staff)}')
+        r = self.client.get('/internal/metrics/')
+        self.assertEqual(r.status_code, 200)
+        body = r.content.decode()
+        self.assertIn('# TYPE http_request_duration_seconds histogram', body)
+        self.assertIn('route="couponbook/coupon-templates/"', body)
+        self.assertIn('http_request_db_queries_count{method="GET",route="couponbook/coupon-templates/"}', body)
+
+
+class MetricsTestCase(TestCase):
+    """
+    계측 값 수집과 히스토그램 집계를 테스트하는 테스트 케이스입니다.
+    """
+
+    @print_success_message("요청 밖에서는 계측하지 않고, 요청 안에서는 외부 호출 시간을 누적하는지 테스트")
+    def test_collect_metrics(self):
+        with timed('kakao'):
+            pass  # 요청 밖이므로 아무 일도 일어나지 않아야 합니다.
+
+        with collect_metrics() as metrics:
+            User.objects.exists()
+            with timed('kakao'):
+                pass
+            with timed('kakao'):
+                pass
+
+        self.assertEqual(metrics.db_queries, 1)
+        self.assertEqual(list(metrics.external_time), ['kakao'])
+
+    @print_success_message("히스토그램 버킷이 누적 카운트로 출력되는지 테스트")
+    def test_histogram_render(self):
+        histogram = Histogram('test_seconds', "테스트", ('route',), (0.1, 1.0))
+        histogram.observe(0.05, route='a')
+        histogram.observe(0.5, route='a')
+        histogram.observe(5, route='a')
+
+        lines = histogram.render()
+        self.assertIn('test_seconds_bucket{route="a",le="0.1"} 1', lines)
+        self.assertIn('test_seconds_bucket{route="a",le="1.0"} 2', lines)
+        self.assertIn('test_seconds_bucket{route="a",le="+Inf"} 3', lines)
+        self.assertIn('test_seconds_count{route="a"} 3', lines)
+
+    @print_success_message("카운터가 레이블별로 누적되어 출력되는지 테스트")
+    def test_counter_render(self):
+        counter = Counter('test_total', "테스트", ('reason',))
+        counter.inc(reason='a')
+        counter.inc(2, reason='a')
+        counter.inc(reason='b')
+
+        self.assertEqual(counter.value(reason='a'), 3)
+        self.assertEqual(counter.render()[1:], ['# TYPE test_total counter',
+                                                'test_total{reason="a"} 3', 'test_total{reason="b"} 1'])
+
+
+class ProbeSerializer(serializers.Serializer):
+    """
+    인스턴스마다 쿼리를 실행하는 N+1 테스트용 시리얼라이저입니다.
+    """
+
+    username = serializers.CharField()
+    is_staff_exists = serializers.SerializerMethodField()
+
+    def get_is_staff_exists(self, obj: User) -> bool:
+        return User.objects.filter(id=obj.id, is_staff=True).exists()
+
+
+class NPlusOneTestCase(TestCase):
+    """
+    N+1 쿼리 탐지기를 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        for i in range(3):
+            User.objects.create(username=f'test{i}', password='1234')
+        return super().setUp()
+
+    @print_success_message("파라미터만 다른 쿼리가 같은 지문이 되는지 테스트")
+    def test_fingerprint(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id = 1 AND name = 'a' AND x IN (%s, %s)"),
+            fingerprint("SELECT  * FROM t WHERE id = 25 AND name = 'bb' AND x IN (%s)"),
+        )
+        self.assertNotEqual(fingerprint("SELECT a FROM t WHERE id = %s"), fingerprint("SELECT b FROM t WHERE id = %s"))
+
+    @print_success_message("N+1 쿼리를 일으킨 시리얼라이저 필드를 찾아내는지 테스트")
+    @override_settings(NPLUSONE_DETECTION='raise', NPLUSONE_THRESHOLD=3)
+    def test_detect_serializer_field(self):
+        with collect_metrics():
+            with self.assertRaises(NPlusOneError) as cm:
+                ProbeSerializer(User.objects.all(), many=True).data
+
+        self.assertIn('ProbeSerializer.is_staff_exists', str(cm.exception))
+
+    @print_success_message("탐지기를 끄면 반복 쿼리를 검사하지 않는지 테스트")
+    @override_settings(NPLUSONE_DETECTION=None)
+    def test_detection_off(self):
+        with collect_metrics() as metrics:
+            ProbeSerializer(User.objects.all(), many=True).data
+
+        self.assertEqual(metrics.query_fingerprints, {})
+
+
+class BatchTestCase(APITestCase):
+    """
+    배치 엔드포인트가 여러 GET 요청의 결과를 직접 요청했을 때와 같게 묶어서 반환하는지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='test', password='1234')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        self.couponbook_id = self.user.couponbook.id
+        return super().setUp()
+
+    @print_success_message("배치 요청 결과가 각 경로를 직접 요청한 결과와 같은지 테스트")
+    def test_batch(self):
+        urls = {
+            'couponbook': '/couponbook/own-couponbook/',
+            'coupons': f'/couponbook/couponbooks/{self.couponbook_id}/coupons/?is_expired=false',
+            'favorites': f'/couponbook/couponbooks/{self.couponbook_id}/favorites/',
+            'me': '/accounts/auth/me/',
+        }
+        r = self.client.post('/batch/', {'requests': urls}, format='json')
+
+        self.assertEqual(r.status_code, 200)
+        for name, url in urls.items():
+            direct = self.client.get(url)
+            self.assertEqual(r.data[name], {'status': direct.status_code, 'body': direct.json()}, name)
+
+    @print_success_message("없는 경로, 남의 쿠폰북, 사용할 수 없는 경로가 항목별 에러로 반환되는지 테스트")
+    def test_batch_item_errors(self):
+        other = User.objects.create(username='other', password='1234')
+        r = self.client.post('/batch/', {'requests': {
+            'missing': '/nowhere/',
+            'others': f'/couponbook/couponbooks/{other.couponbook.id}/coupons/',
+            'nested': '/batch/',
+            'curation': '/couponbook/own-couponbook/curation/',
+        }}, format='json')
+
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual({name: item['status'] for name, item in r.data.items()},
+                         {'missing': 404, 'others': 403, 'nested': 400, 'curation': 400})
+
+    @print_success_message("내부 요청이 대상 뷰의 인증 클래스로 다시 인증되는지 테스트")
+    def test_batch_uses_view_authentication(self):
+        from accounts.views import MeView
+
+        # 인증 클래스가 없는 뷰는 직접 요청하면 익명 유저이므로, 배치 요청에서도 바깥 요청의 유저로 처리되면 안 됩니다.
+        with mock.patch.object(MeView, 'authentication_classes', ()):
+            direct = self.client.get('/accounts/auth/me/')
+            r = self.client.post('/batch/', {'requests': {'me': '/accounts/auth/me/'}}, format='json')
+
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.data['me']['status'], direct.status_code)
+        self.assertIn(direct.status_code, (401, 403))
+
+    @print_success_message("요청 수 제한과 인증이 적용되는지 테스트")
+    @override_settings(BATCH_MAX_REQUESTS=2)
+    def test_batch_limits(self):
+        urls = {str(i): '/couponbook/own-couponbook/' for i in range(3)}
+        self.assertEqual(self.client.post('/batch/', {'requests': urls}, format='json').status_code, 400)
+
+        self.client.credentials()
+        self.assertEqual(self.client.post('/batch/', {'requests': {'a': '/accounts/auth/me/'}}, format='json').status_code, 401)
+
+
+class IdentityMapTestCase(TestCase):
+    """
+    요청 단위 identity map이 같은 행을 한 번만 조회하게 하는지 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='test', password='1234')
+        return super().setUp()
+
+    def load_user(self) -> User:
+        return get_or_load(User, self.user.id, lambda: User.objects.get(id=self.user.id))
+
+    @print_success_message("identity map 안에서는 같은 행을 한 번만 조회하고, 밖에서는 매번 조회하는지 테스트")
+    def test_get_or_load(self):
+        with identity_map():
+            with CaptureQueriesContext(connection) as ctx:
+                first, second = self.load_user(), self.load_user()
+            self.assertIs(first, second)
+            self.assertEqual(len(ctx.captured_queries), 1)
+            self.assertIs(lookup(User, str(self.user.id)), first)  # pk 문자열도 같은 키로 취급합니다.
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertIsNot(self.load_user(), self.load_user())
+        self.assertEqual(len(ctx.captured_queries), 2)
+
+    @print_success_message("인스턴스가 아닌 값(None 포함)도 요청 안에서 한 번만 계산하는지 테스트")
+    def test_get_or_compute(self):
+        compute = mock.Mock(return_value=None)
+        with identity_map():
+            self.assertIsNone(get_or_compute('value', 1, compute))
+            self.assertIsNone(get_or_compute('value', 1, compute))
+        self.assertEqual(compute.call_count, 1)
+
+        get_or_compute('value', 1, compute)
+        self.assertEqual(compute.call_count, 2, "요청 밖에서 계산한 값이 보관되었습니다!")
+
+    @print_success_message("정방향 관계가 identity map에 보관된 인스턴스를 사용하는지 테스트")
+    def test_related(self):
+        couponbook = type(self.user.couponbook).objects.get(user_id=self.user.id)
+        with identity_map():
+            user = self.load_user()
+            with CaptureQueriesContext(connection) as ctx:
+                self.assertIs(related(couponbook, 'user'), user)
+            self.assertEqual(len(ctx.captured_queries), 0)
+
+
+class IdentityMapRequestTestCase(APITestCase):
+    """
+    배치 요청 안의 같은 쿠폰 조회가 권한 확인에서 한 번만 조회되는지 테스트하는 테스트 케이스입니다.
+    """
+
+    @print_success_message("같은 쿠폰을 조회하는 배치 요청에서 쿠폰 조회 쿼리가 한 번만 실행되는지 테스트")
+    def test_batch_shares_coupon(self):
+        from couponbook.models import Coupon, CouponTemplate
+        from couponbook.tests.receipttests import create_place
+
+        user = User.objects.create(username='test', password='1234')
+        template = CouponTemplate.objects.create(is_on=True, place=create_place('내 가게'))
+        coupon = Coupon.objects.create(couponbook=user.couponbook, original_template=template)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        url = f'/couponbook/coupons/{coupon.id}/'
+
+        with CaptureQueriesContext(connection) as ctx:
+            r = self.client.post('/batch/', {'requests': {'a': url, 'b': url}}, format='json')
+
+        self.assertEqual((r.data['a']['status'], r.data['b']['status']), (200, 200))
+        coupon_table = Coupon._meta.db_table
+        coupon_selects = [q for q in ctx.captured_queries
+                          if q['sql'].startswith('SELECT') and f'FROM "{coupon_table}"' in q['sql']]
+        self.assertEqual(len(coupon_selects), 1)
+
+
+class FastJSONRendererTestCase(TestCase):
+    """
+    FastJSONRenderer가 DRF JSONRenderer와 같은 바이트를 만드는지 테스트하는 테스트 케이스입니다.
+    """
+
+    data = {
+        'text': "쿠폰 \u2028 \u2029 \"quote\" \\ end",
+        'numbers': [1, -2, 3.5, 1e20, Decimal('10.50'), True, None],
+        'datetime': datetime(2025, 8, 21, 12, 34, 56, 789123, tzinfo=timezone.utc),
+        'naive': datetime(2025, 8, 21, 12, 34),
+        'date': date(2025, 8, 21),
+        'time': time(9, 30),
+        'uuid': UUID('12345678-1234-5678-1234-567812345678'),
+        'lazy': gettext_lazy("쿠폰"),
+        'nested': [{'id': 1, 'tags': ('a', 'b')}, {}],
+        1: 'int key',
+    }
+
+    @skipUnless(is_fast_json_available(), "orjson이 설치되어 있지 않습니다.")
+    @print_success_message("orjson으로 렌더링한 결과가 JSONRenderer와 같은지 테스트")
+    def test_same_bytes_with_orjson(self):
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    @print_success_message("orjson이 없을 때 JSONRenderer와 같은지 테스트")
+    def test_same_bytes_without_orjson(self):
+        with mock.patch('utils.renderers.orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    @print_success_message("들여쓰기를 요청하면 JSONRenderer로 렌더링하는지 테스트")
+    def test_indent(self):
+        media_type = 'application/json; indent=4'
+        self.assertEqual(FastJSONRenderer().render(self.data, media_type),
+                         JSONRenderer().render(self.data, media_type))
+
+    @print_success_message("CachedTimeField가 TimeField와 같은 문자열을 반환하는지 테스트")
+    def test_cached_time_field(self):
+        plain, cached = serializers.TimeField(TIME_FORMAT), CachedTimeField(TIME_FORMAT)
+        for value in [time(0, 0), time(9, 5), time(23, 59, 59), None, '']:
+            self.assertEqual(cached.to_representation(value), plain.to_representation(value))
+            self.assertEqual(cached.to_representation(value), plain.to_representation(value))  # 캐시된 값
+        self.assertEqual(CachedTimeField().to_representation(time(9, 5)),
+                         serializers.TimeField().to_representation(time(9, 5)))
+
+
+class URLTemplateTestCase(TestCase):
+    """
+    URL 템플릿이 reverse와 같은 URL을 만드는지 테스트하는 테스트 케이스입니다.
+    """
+
+    routes = [('couponbook:coupon-detail', 'coupon_id'),
+              ('couponbook:coupon-template-detail', 'coupon_template_id')]
+
+    def tearDown(self):
+        set_script_prefix('/')
+        return super().tearDown()
+
+    @print_success_message("URL 템플릿이 reverse와 같은 절대 URL을 만드는지 테스트")
+    def test_same_as_reverse(self):
+        for host, secure in [('testserver', False), ('api.example.com:8443', True)]:
+            request = Request(RequestFactory().get('/', HTTP_HOST=host, secure=secure))
+            for viewname, kwarg in self.routes:
+                for value in [1, 42, 1_000_000]:
+                    self.assertEqual(url_template(request, viewname, kwarg)(value),
+                                     reverse(viewname, kwargs={kwarg: value}, request=request))
+
+    @print_success_message("요청이 없거나 스크립트 접두사가 있을 때 reverse와 같은 경로를 만드는지 테스트")
+    def test_without_request_and_script_prefix(self):
+        viewname, kwarg = self.routes[0]
+        self.assertEqual(url_template(None, viewname, kwarg)(7), reverse(viewname, kwargs={kwarg: 7}))
+
+        set_script_prefix('/api/')
+        request = Request(RequestFactory().get('/'))
+        self.assertEqual(url_template(request, viewname, kwarg)(7),
+                         reverse(viewname, kwargs={kwarg: 7}, request=request))
+        self.assertTrue(url_template(None, viewname, kwarg)(7).startswith('/api/'))
+
+    @print_success_message("URL 템플릿을 요청마다 한 번만 만드는지 테스트")
+    def test_cached_per_request(self):
+        viewname, kwarg = self.routes[0]
+        request = Request(RequestFactory().get('/'))
+        self.assertIs(url_template(request, viewname, kwarg), url_template(request, viewname, kwarg))
+        self.assertIsNot(url_template(Request(RequestFactory().get('/')), viewname, kwarg),
+                         url_template(request, viewname, kwarg))
+
+
+@skipUnless(find_spec('moto') and find_spec('storages'), "moto, django-storages가 설치되어 있지 않습니다.")
+class CachedPresignedS3StorageTestCase(TestCase):
+    """
+    presigned URL을 재사용하는 S3 스토리지를 moto(로컬 S3)로 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        import boto3
+        from moto import mock_aws
+
+        from .storages import CachedPresignedS3Storage
+
+        self.mock = mock_aws()
+        self.mock.start()
+        boto3.client('s3', region_name='ap-northeast-2').create_bucket(
+            Bucket='media', CreateBucketConfiguration={'LocationConstraint': 'ap-northeast-2'})
+        self.storage = CachedPresignedS3Storage(bucket_name='media', region_name='ap-northeast-2',
+                                                access_key='test', secret_key='test', querystring_expire=3600)
+        self.name = self.storage.save('uploads/image.jpg', ContentFile(b'image'))
+        return super().setUp()
+
+    def tearDown(self):
+        self.mock.stop()
+        return super().tearDown()
+
+    def sign_count(self, *urls):
+        with mock.patch('storages.backends.s3.S3Storage.url', autospec=True,
+                        side_effect=lambda storage, name, *args, **kwargs: f'signed:{name}') as signed:
+            for name in urls:
+                self.storage.url(name)
+        return signed.call_count
+
+    @print_success_message("같은 파일의 presigned URL을 한 번만 서명하고 재사용하는지 테스트")
+    def test_reuse(self):
+        first = self.storage.url(self.name)
+        self.assertIn('X-Amz-Signature=', first)
+        self.assertEqual(self.storage.url(self.name), first)
+        self.assertEqual(self.sign_count(self.name, self.name), 0)
+        self.assertEqual(self.sign_count('uploads/other.jpg', 'uploads/other.jpg'), 1)
+
+    @print_success_message("파라미터나 만료 시간을 지정하면 캐시하지 않는지 테스트")
+    def test_custom_url_not_cached(self):
+        url = self.storage.url(self.name)
+        self.assertNotEqual(self.storage.url(self.name, expire=60), url)
+        self.assertIn('response-content-disposition=',
+                      self.storage.url(self.name, parameters={'ResponseContentDisposition': 'attachment'}))
+
+    @print_success_message("만료가 가까워지거나 파일을 삭제하면 다시 서명하는지 테스트")
+    def test_expiry_and_delete(self):
+        self.storage.url(self.name)
+        self.assertEqual(self.storage.url_cache.ttl, 3600 - 300)
+        with mock.patch('utils.ttl_cache.monotonic', return_value=10 ** 9):
+            self.assertEqual(self.sign_count(self.name), 1)
+
+        self.storage.url(self.name)
+        self.storage.delete(self.name)
+        self.assertFalse(self.storage.exists(self.name))
+        self.assertEqual(self.sign_count(self.name), 1)
+
+
+@skipUnless(find_spec('moto') and find_spec('storages'), "moto, django-storages가 설치되어 있지 않습니다.")
+class ImmutableHashedS3ManifestStaticStorageTestCase(TestCase):
+    """
+    해시가 붙은 정적 파일에만 immutable 캐시 헤더를 붙이는지 테스트하는 테스트 케이스입니다.
+    """
+
+    @print_success_message("해시가 붙은 이름만 immutable로, 나머지는 짧게 캐시하는지 테스트")
+    def test_cache_control(self):
+        import boto3
+        from moto import mock_aws
+
+        from .storages import ImmutableHashedS3ManifestStaticStorage
+
+        with mock_aws():  # 스토리지를 만들 때 manifest를 읽습니다.
+            boto3.client('s3', region_name='ap-northeast-2').create_bucket(
+                Bucket='static', CreateBucketConfiguration={'LocationConstraint': 'ap-northeast-2'})
+            storage = ImmutableHashedS3ManifestStaticStorage(
+                bucket_name='static', region_name='ap-northeast-2', access_key='test', secret_key='test',
+                object_parameters={'ContentEncoding': 'identity'})
+        hashed = storage.get_object_parameters('admin/css/base.3f2a9c1b7d4e.css')
+        self.assertEqual(hashed, {'ContentEncoding': 'identity', 'CacheControl': 'public, max-age=31536000, immutable'})
+        for name in ('admin/css/base.css', 'staticfiles.json', 'fonts/3f2a9c1b7d4e/font.woff2'):
+            self.assertEqual(storage.get_object_parameters(name)['CacheControl'], 'public, max-age=3600')
+
+
+class StructuredLoggingTestCase(APITestCase):
+    """
+    구조화 로그(JSON, 요청 id)와 큐 기반 로그 핸들러를 테스트하는 테스트 케이스입니다.
+    """
+
+    def setUp(self):
+        REGISTRY.clear()
+        return super().setUp()
+
+    def make_handler(self, stream: io.StringIO, maxsize: int = 100) -> QueueLogHandler:
+        handler = QueueLogHandler(stream, maxsize=maxsize)
+        handler.setFormatter(JSONFormatter())
+        handler.addFilter(RequestIdFilter())
+        self.addCleanup(handler.close)
+        return handler
+
+    def make_logger(self, handler: logging.Handler) -> logging.Logger:
+        logger = logging.getLogger('utils.tests.structured')
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        return logger
+
+    @print_success_message("이벤트를 요청 id가 붙은 JSON 한 줄로 출력하고 카운터를 올리는지 테스트")
+    def test_json_event(self):
+        stream = io.StringIO()
+        handler = self.make_handler(stream)
+        logger = self.make_logger(handler)
+
+        with request_id_context('req-1'):
+            log_event(logger, 'coupon_rejected', "선착순 마감", level=logging.WARNING, reason='sold_out', template_id=3)
+        logger.info("요청 밖")
+        handler.stop()  # 큐에 남은 로그를 모두 출력합니다.
+
+        first, second = map(json.loads, stream.getvalue().splitlines())
+        self.assertEqual({key: first[key] for key in ('level', 'logger', 'event', 'message', 'request_id')},
+                         {'level': 'WARNING', 'logger': 'utils.tests.structured', 'event': 'coupon_rejected',
+                          'message': "선착순 마감", 'request_id': 'req-1'})
+        self.assertEqual((first['reason'], first['template_id']), ('sold_out', 3))
+        self.assertEqual((second['message'], second['request_id']), ("요청 밖", None))
+        self.assertEqual(EVENTS.value(logger='utils.tests.structured', event='coupon_rejected', reason='sold_out'), 1)
+
+    @print_success_message("로그 큐가 가득 차면 기다리지 않고 버리는지 테스트")
+    def test_queue_full(self):
+        handler = self.make_handler(io.StringIO(), maxsize=1)
+        logger = self.make_logger(handler)
+
+        with mock.patch.object(handler, 'start'):  # 출력 스레드 없이 큐만 채웁니다.
+            for i in range(3):
+                logger.info("로그 %d", i)
+        self.assertEqual(LOG_RECORDS_DROPPED.value(), 2)
+
+    @print_success_message("요청 id를 응답 헤더로 돌려주고, 형식이 맞지 않으면 새로 만드는지 테스트")
+    def test_request_id_header(self):
+        r = self.client.get('/couponbook/coupon-templates/', HTTP_X_REQUEST_ID='nginx-0123')
+        self.assertEqual(r['X-Request-ID'], 'nginx-0123')
+
+        r = self.client.get('/couponbook/coupon-templates/', HTTP_X_REQUEST_ID='bad id\n')
+        self.assertRegex(r['X-Request-ID'], r'^[0-9a-f]{32}$')
+
+        # 요청 중에 남긴 계측 로그에도 같은 요청 id가 붙습니다.
+        stream = io.StringIO()
+        handler = self.make_handler(stream)
+        logging.getLogger('utils.instrumentation').addHandler(handler)
+        self.addCleanup(logging.getLogger('utils.instrumentation').removeHandler, handler)
+        r = self.client.get('/couponbook/coupon-templates/')
+        handler.stop()
+
+        entry = json.loads(stream.getvalue())
+        self.assertEqual((entry['event'], entry['route']), ('request', 'couponbook/coupon-templates/'))
+        self.assertEqual(entry['request_id'], r['X-Request-ID'])
+
+    @print_success_message("미들웨어 밖에서 남기는 django.request 로그에도 요청 id가 붙는지 테스트")
+    def test_request_id_on_django_request_log(self):
+        stream = io.StringIO()
+        handler = self.make_handler(stream)
+        logging.getLogger('django.request').addHandler(handler)
+        self.addCleanup(logging.getLogger('django.request').removeHandler, handler)
+        r = self.client.get('/couponbook/own-couponbook/')  # 401
+        handler.stop()
+
+        entry = json.loads(stream.getvalue())
+        self.assertEqual((entry['level'], entry['request_id']), ('WARNING', r['X-Request-ID']))
+
+    @print_success_message("쿠폰 등록 검증 실패를 구조화 이벤트로 남기는지 테스트")
+    def test_coupon_rejected_event(self):
+        user = User.objects.create(username='test', password='1234')
+        template = CouponTemplate.objects.create(is_on=True, place=create_place('가게'),
+                                                 valid_until=now() - timedelta(days=1))
+
+        with self.assertLogs('couponbook.models', 'WARNING') as logs:
+            Coupon(couponbook=CouponBook.objects.get(user=user), original_template=template).save()
+
+        self.assertFalse(Coupon.objects.exists())
+        record = logs.records[0]
+        self.assertEqual(record.event, 'coupon_rejected')
+        self.assertEqual((record.fields['reason'], record.fields['template_id']), ('template_expired', template.id))
+        self.assertEqual(EVENTS.value(logger='couponbook.models', event='coupon_rejected', reason='template_expired'), 1)
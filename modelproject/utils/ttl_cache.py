@@ -0,0 +1,61 @@
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """
+    프로세스 메모리에 값을 일정 시간(ttl초) 동안 보관하는 스레드 안전한 캐시입니다.
+
+    `maxsize`개를 넘으면 가장 오래 전에 저장한 값부터 버립니다.
+    워커 프로세스마다 따로 존재하므로, 다른 워커에서 일어난 변경은 ttl이 지나야 반영됩니다.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, ttl: float, maxsize: int = 10_000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, default: Callable[[], Any]) -> Any:
+        """
+        캐시에 값이 없으면 `default()`를 호출해서 저장한 후 반환합니다.
+        """
+
+        value = self.get(key, self._MISSING)
+        if value is self._MISSING:
+            value = default()
+            self.set(key, value)
+        return value
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
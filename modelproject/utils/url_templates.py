@@ -0,0 +1,66 @@
+"""
+목록 응답에서 항목마다 만드는 상세 조회 URL을 위한 URL 템플릿입니다.
+
+`rest_framework.reverse.reverse`는 호출할 때마다 URLconf에서 패턴을 찾고, 인자를 검사하고, 절대 URL을 만듭니다.
+목록 응답에서는 같은 경로에 id만 바꿔서 수백 번 호출하므로, 경로를 한 번만 reverse해서 (앞부분, 뒷부분)으로 나눠 두고
+항목마다 문자열만 이어 붙입니다.
+
+- 경로의 (앞부분, 뒷부분)은 (URL 이름, 인자 이름, URLconf, 스크립트 접두사)별로 프로세스에서 한 번만 계산합니다.
+- 절대 URL의 앞부분(스킴, 호스트)은 요청마다 한 번 계산해서 요청 객체에 보관합니다.
+- 인자는 정수 id처럼 URL에서 이스케이프할 필요가 없는 값이어야 합니다.
+- DRF의 URL 버전 관리(versioning_scheme)는 고려하지 않습니다. (이 프로젝트에서는 사용하지 않습니다.)
+"""
+
+from functools import lru_cache
+
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import get_script_prefix, get_urlconf, reverse
+
+# 경로를 나눌 위치를 찾기 위해 인자 대신 넣는 값입니다. 정수 경로 변환기(<int:...>)를 통과해야 합니다.
+_PLACEHOLDER = 918_273_645_546_372_819
+
+
+class URLTemplate:
+    """
+    (앞부분, 뒷부분)으로 나눈 URL입니다. `template(value)`는 앞부분 + value + 뒷부분을 반환합니다.
+    """
+
+    __slots__ = ('prefix', 'suffix')
+
+    def __init__(self, prefix: str, suffix: str):
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def __call__(self, value) -> str:
+        return f'{self.prefix}{value}{self.suffix}'
+
+
+@lru_cache(maxsize=256)
+def _split_path(viewname: str, kwarg: str, urlconf, script_prefix: str) -> tuple[str, str]:
+    path = reverse(viewname, kwargs={kwarg: _PLACEHOLDER}, urlconf=urlconf)
+    prefix, found, suffix = path.partition(str(_PLACEHOLDER))
+    if not found or str(_PLACEHOLDER) in suffix:
+        raise ImproperlyConfigured(f"URL 템플릿을 만들 수 없는 경로입니다: {viewname}")
+    return prefix, suffix
+
+
+def url_template(request, viewname: str, kwarg: str) -> URLTemplate:
+    """
+    `reverse(viewname, kwargs={kwarg: value}, request=request)`와 같은 URL을 만드는 템플릿을 반환합니다.
+
+    `request`가 있으면 절대 URL, 없으면 경로만 만듭니다. 요청마다 경로별로 한 번만 만들어서 요청 객체에 보관합니다.
+    """
+
+    cache = getattr(request, '_url_templates', None)
+    if cache is not None and (template := cache.get((viewname, kwarg))):
+        return template
+
+    prefix, suffix = _split_path(viewname, kwarg, get_urlconf(), get_script_prefix())
+    if request is None:
+        return URLTemplate(prefix, suffix)
+
+    template = URLTemplate(request.build_absolute_uri(prefix), suffix)
+    if cache is None:
+        cache = request._url_templates = {}
+    cache[(viewname, kwarg)] = template
+    return template
@@ -0,0 +1,57 @@
+from accounts.authentication import RequestCachedJWTAuthentication
+from django.http import HttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .batch import run_batch
+from .metrics import REGISTRY
+from .permissions import IsStaffOrInternalIP
+from .serializers import BatchRequestSerializer
+
+
+@extend_schema(exclude=True)
+class MetricsView(APIView):
+    """
+    라우트별 성능 지표를 Prometheus 텍스트 형식으로 돌려주는 내부용 뷰입니다.
+    """
+
+    authentication_classes = [RequestCachedJWTAuthentication]
+    permission_classes = [IsStaffOrInternalIP]
+
+    def get(self, request):
+        return HttpResponse(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+@extend_schema(
+    tags=["Batch"],
+    summary="여러 GET 요청을 한 번에 실행",
+    description="이름 -> 경로 딕셔너리로 받은 GET 요청들을 서버 안에서 실행하고, 이름 -> {status, body}로 묶어서 반환합니다. "
+                "각 요청은 배치 요청의 인증 정보로 해당 경로에서 다시 인증하므로, 결과는 해당 경로를 직접 요청했을 때와 같습니다. "
+                "비동기 뷰(큐레이션)와 스트리밍 응답(내보내기) 경로는 사용할 수 없습니다.",
+    request=BatchRequestSerializer,
+    responses={200: OpenApiResponse(
+        response=OpenApiTypes.OBJECT,
+        description="요청의 이름마다 {status: HTTP 상태 코드, body: 응답 본문}입니다.",
+        examples=[OpenApiExample("응답 예시", {
+            "couponbook": {"status": 200, "body": {"id": 1, "favorite_counts": 1, "coupon_counts": 3}},
+            "me": {"status": 200, "body": {"id": 1, "username": "customer"}},
+        })],
+    )},
+)
+class BatchView(APIView):
+    """
+    여러 GET 요청을 한 번의 요청으로 처리하는 뷰입니다.
+
+    배치 요청 자체는 JWT로 인증하고, 내부 요청은 같은 Authorization 헤더로 각 뷰의 인증 클래스에서 다시 인증합니다.
+    """
+
+    authentication_classes = [RequestCachedJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = BatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(run_batch(request, serializer.validated_data['requests']))